@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BlogsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.blogs"
+
+    def ready(self):
+        import apps.blogs.signals  # noqa: F401
@@ -1,10 +1,11 @@
 """Managers for Blogs App."""
 
 from datetime import timedelta
-from django.db.models import Q
 from django.utils import timezone
 
 from apps.utilities.managers import BaseManager
+from apps.utilities.search import search
+from apps.reviews.services import ReviewService
 
 
 class TagManager(BaseManager):
@@ -16,20 +17,20 @@ class PostManager(BaseManager):
 
     def get_featured(self):
         """Return a queryset of featured posts."""
-        return self.get_available().filter(is_featured=True)
+        return self.get_with_ratings().filter(is_featured=True)
 
     def get_recent(self):
         """Return a queryset of recent posts created within the last 7 days."""
         seven_days_ago = timezone.now() - timedelta(days=7)
-        return self.get_available().filter(created_at__gte=seven_days_ago)[:25]
+        return self.get_with_ratings().filter(created_at__gte=seven_days_ago)[:25]
+
+    def get_with_ratings(self):
+        """Return available posts annotated with their rating summary."""
+        return ReviewService.annotate_ratings(self.get_available())
 
     def search_by_term(self, search_term):
         """Filter promotions based on a search term."""
-        return self.get_available().filter(
-            Q(title__icontains=search_term)
-            | Q(content__icontains=search_term)
-            | Q(tags__name__icontains=search_term)
-        )
+        return search(self.get_available(), search_term)
 
 
 class PostReportManager(BaseManager):
@@ -2,6 +2,9 @@
 
 from django.conf import settings
 from django.db import models
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 from apps.utilities.models import BaseModel
 from apps.utilities.mixins import SlugMixin
@@ -40,6 +43,9 @@ class Post(BaseModel, SlugMixin):
     author_id = models.ForeignKey(User, on_delete=models.CASCADE)
     points = models.IntegerField(default=100)
     is_featured = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    review_summaries = GenericRelation("reviews.ReviewSummary")
 
     objects = PostManager()
 
@@ -47,6 +53,14 @@ class Post(BaseModel, SlugMixin):
         ordering = ["pk"]
         verbose_name = "post"
         verbose_name_plural = "posts"
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            GinIndex(
+                fields=["title"],
+                name="post_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self):
         return str(self.title)
@@ -4,6 +4,7 @@ from rest_framework.serializers import ModelSerializer, CharField, StringRelated
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from apps.users.serializers import UserMinimalSerializer
+from apps.reviews.serializers import RatingSummaryField
 from .models import Post, Tag, PostReport
 
 
@@ -34,6 +35,7 @@ class PostReadSerializer(ReadOnlyFieldsMixin, ModelSerializer):
 
     tags = TagReadSerializer(many=True)
     author_id = StringRelatedField()
+    rating = RatingSummaryField()
 
     class Meta:
         model = Post
@@ -44,6 +46,7 @@ class PostReadSerializer(ReadOnlyFieldsMixin, ModelSerializer):
             "content",
             "tags",
             "author_id",
+            "rating",
             "created_at",
             "updated_at",
         ]
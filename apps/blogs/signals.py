@@ -0,0 +1,13 @@
+"""Signals for Blogs App."""
+
+from apps.utilities.cache import register_list_cache
+from apps.utilities.search import register_search
+from .models import Post
+
+
+register_list_cache(Post)
+register_search(
+    Post,
+    {"title": "A", "tags__name": "B", "content": "C"},
+    trigram_field="title",
+)
@@ -12,7 +12,8 @@ from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
 
 from apps.users.permissions import IsMarketing, IsClient
-from apps.utilities.mixins import ListCacheMixin, LogicalDeleteMixin
+from apps.utilities.mixins import ReplicaMixin, ListCacheMixin, LogicalDeleteMixin
+from apps.reviews.models import ReviewSummary
 from .models import Post, PostReport, Tag
 from .services import PostService
 from .serializers import (
@@ -28,7 +29,7 @@ from .schemas import post_schemas
 
 
 @extend_schema_view(**post_schemas)
-class PostViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
+class PostViewSet(ReplicaMixin, ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     """
     ViewSet for managing Country instances.
 
@@ -41,14 +42,22 @@ class PostViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     - DELETE /api/v1/posts/{id}/
     """
 
+    replica_actions = [
+        "list",
+        "retrieve",
+        "get_featured_posts",
+        "get_recent_posts",
+        "get_tags",
+    ]
     permission_classes = [IsMarketing]
     serializer_class = PostWriteSerializer
     search_fields = ["title", "author_id__name"]
     filterset_class = PostFilter
+    cache_dependencies = [Post, ReviewSummary]
 
     def get_queryset(self):
         return (
-            Post.objects.get_available()
+            Post.objects.get_with_ratings()
             .select_related("author_id")
             .prefetch_related("tags")
         )
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('deliveries', '0004_alter_faileddelivery_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='delivery',
+            name='settled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaldelivery',
+            name='settled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='delivery',
+            index=models.Index(condition=models.Q(('is_completed', True), ('settled_at__isnull', True)), fields=['delivered_at'], name='delivery_unsettled_idx'),
+        ),
+    ]
@@ -36,6 +36,7 @@ class Delivery(BaseModel):
     )
     picked_up_at = models.DateTimeField(blank=True, null=True)
     delivered_at = models.DateTimeField(blank=True, null=True)
+    settled_at = models.DateTimeField(blank=True, null=True)
     is_completed = models.BooleanField(default=False)
 
     objects = DeliveryManager()
@@ -51,6 +52,12 @@ class Delivery(BaseModel):
             models.Index(fields=["status"]),
             # Composite indexes
             models.Index(fields=["order_id", "status"]),
+            # Completed deliveries waiting for their revenues
+            models.Index(
+                fields=["delivered_at"],
+                name="delivery_unsettled_idx",
+                condition=models.Q(is_completed=True, settled_at__isnull=True),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
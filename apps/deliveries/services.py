@@ -1,8 +1,11 @@
 """Services for Deliveries App."""
 
+from asgiref.sync import sync_to_async
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import status
 
+from apps.drivers.services import DriverService
 from .models import Delivery, FailedDelivery
 from .choices import StatusChoices
 
@@ -28,15 +31,15 @@ class DeliveryService:
         delivery.save()
 
     @staticmethod
-    def mark_as_picked_up(order, driver):
+    async def amark_as_picked_up(order, driver):
         """Mark the delivery as picked up."""
         try:
-            delivery = Delivery.objects.get(order_id=order, driver_id=driver)
+            delivery = await Delivery.objects.aget(order_id=order, driver_id=driver)
 
             if delivery.status == StatusChoices.ASSIGNED:
                 delivery.status = StatusChoices.PICKED_UP
                 delivery.picked_up_at = timezone.now()
-                delivery.save()
+                await delivery.asave()
 
                 return {
                     "success": True,
@@ -63,18 +66,28 @@ class DeliveryService:
             }
 
     @staticmethod
-    def mark_as_delivered(order, driver, signature):
+    def complete_delivery(delivery, signature):
+        """Save a delivery as delivered together with the driver earning."""
+        with transaction.atomic():
+            delivery.signature = signature
+            delivery.status = StatusChoices.DELIVERED
+            delivery.delivered_at = timezone.now()
+            delivery.is_completed = True
+            delivery.save()
+            DriverService.record_earning(delivery)
+
+    @staticmethod
+    async def amark_as_delivered(order, driver, signature):
         """Mark the delivery status as completed."""
         try:
-            delivery = Delivery.objects.get(order_id=order, driver_id=driver)
+            delivery = await Delivery.objects.aget(order_id=order, driver_id=driver)
 
             if delivery.status == StatusChoices.PICKED_UP:
                 # TODO: Add verification code
-                delivery.signature = signature
-                delivery.status = StatusChoices.DELIVERED
-                delivery.delivered_at = timezone.now()
-                delivery.is_completed = True
-                delivery.save()
+                # Transactions are not supported by the async ORM yet
+                await sync_to_async(DeliveryService.complete_delivery)(
+                    delivery, signature
+                )
 
                 return {
                     "success": True,
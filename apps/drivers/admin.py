@@ -3,7 +3,13 @@
 from django.contrib import admin
 
 from apps.utilities.admin import BaseAdmin
-from .models import Driver, DriverAssignment, Resource
+from .models import (
+    Driver,
+    DriverAssignment,
+    DriverEarning,
+    DriverDailyEarning,
+    Resource,
+)
 
 
 @admin.register(Driver)
@@ -26,6 +32,27 @@ class DriverAssignmentAdmin(BaseAdmin):
     readonly_fields = ["pk", "created_at", "updated_at"]
 
 
+@admin.register(DriverEarning)
+class DriverEarningAdmin(BaseAdmin):
+    """Admin for DriverEarning model."""
+
+    search_fields = ["driver_id", "order_id"]
+    list_display = ["driver_id", "order_id", "amount", "earned_at"]
+    readonly_fields = ["pk", "created_at", "updated_at"]
+    ordering = ["-earned_at"]
+
+
+@admin.register(DriverDailyEarning)
+class DriverDailyEarningAdmin(admin.ModelAdmin):
+    """Admin for DriverDailyEarning model."""
+
+    search_fields = ["driver_id"]
+    list_display = ["driver_id", "day", "amount", "deliveries"]
+    list_filter = ["day"]
+    list_per_page = 25
+    ordering = ["-day"]
+
+
 @admin.register(Resource)
 class ResourceAdmin(BaseAdmin):
     """Admin for Resource model."""
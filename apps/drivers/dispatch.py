@@ -0,0 +1,41 @@
+"""Dispatch for Drivers App."""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from .spatial import EARTH_RADIUS_KM
+
+# Cost used for pairs that must never be matched (out of range, already tried)
+UNREACHABLE = 1e9
+
+
+def distance_matrix(origins, destinations):
+    """
+    Vectorized equirectangular distances in km.
+
+    `origins` and `destinations` are `(n, 2)` and `(m, 2)` arrays of
+    `(latitude, longitude)` pairs; the result is an `(n, m)` matrix.
+    """
+    origins = np.radians(np.asarray(origins, dtype=float))
+    destinations = np.radians(np.asarray(destinations, dtype=float))
+    lat1 = origins[:, 0][:, None]
+    lon1 = origins[:, 1][:, None]
+    lat2 = destinations[:, 0][None, :]
+    lon2 = destinations[:, 1][None, :]
+    x = (lon2 - lon1) * np.cos((lat1 + lat2) / 2)
+    y = lat2 - lat1
+    return EARTH_RADIUS_KM * np.hypot(x, y)
+
+
+def solve_assignment(cost, max_cost):
+    """
+    Solve the order-to-driver assignment with the Hungarian algorithm.
+
+    Returns the `(row, column)` pairs of the optimal matching whose cost is
+    below `max_cost`; rows left out could not be matched in this batch.
+    """
+    if cost.size == 0:
+        return []
+    rows, columns = linear_sum_assignment(cost)
+    keep = cost[rows, columns] < max_cost
+    return list(zip(rows[keep].tolist(), columns[keep].tolist()))
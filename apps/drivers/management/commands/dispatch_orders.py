@@ -0,0 +1,31 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.drivers.services import DriverService
+
+
+class Command(BaseCommand):
+    help = "Dispatch: Assign drivers to all orders awaiting one in batches"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running one batch every --window seconds.",
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=settings.DISPATCH_BATCH_WINDOW,
+        )
+
+    def handle(self, *args, **options) -> None:
+        while True:
+            result = DriverService.dispatch_pending_orders()
+            style = self.style.SUCCESS if result["success"] else self.style.WARNING
+            self.stdout.write(style(result["message"]))
+
+            if not options["loop"]:
+                break
+            time.sleep(options["window"])
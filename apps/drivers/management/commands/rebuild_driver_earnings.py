@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.drivers.services import DriverService
+
+
+class Command(BaseCommand):
+    help = "Earnings: Backfill the driver earnings ledger and rebuild daily rollups"
+
+    def handle(self, *args, **options) -> None:
+        total = DriverService.rebuild_earnings()
+        self.stdout.write(self.style.SUCCESS(f"{total} daily earning rollups rebuilt."))
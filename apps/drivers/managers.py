@@ -1,5 +1,11 @@
 """Managers for Drivers App."""
 
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
 from apps.utilities.managers import BaseManager
 
 
@@ -9,12 +15,7 @@ class DriverManager(BaseManager):
     def get_list(self):
         return (
             self.get_available()
-            .select_related(
-                "user_id",
-                "city_id",
-                "state_id",
-                "country_id",
-            )
+            .select_related("user_id")
             .only(
                 "id",
                 "user_id",
@@ -28,12 +29,7 @@ class DriverManager(BaseManager):
     def get_detail(self):
         return (
             self.get_available()
-            .select_related(
-                "user_id",
-                "city_id",
-                "state_id",
-                "country_id",
-            )
+            .select_related("user_id")
             .defer(
                 "driver_license",
                 "identification_document",
@@ -50,6 +46,51 @@ class DriverManager(BaseManager):
         """Return a queryset of drivers in a specific city."""
         return self.get_available().filter(city_id=city_id)
 
+    def get_dispatchable(self):
+        """Return verified, active drivers with a known location."""
+        return self.get_available().filter(
+            is_verified=True,
+            is_active=True,
+            latitude__isnull=False,
+            longitude__isnull=False,
+        )
+
 
 class ResourceManager(BaseManager):
     """Manager for Resource model."""
+
+
+class DriverAssignmentManager(BaseManager):
+    """Manager for DriverAssignment model."""
+
+    def get_active(self):
+        """
+        Return the offers still open and the accepted assignments in progress.
+
+        Offers expire after `DRIVER_OFFER_TIMEOUT` seconds, and assignments
+        of delivered or cancelled orders, or of finished deliveries, are over.
+        """
+        from apps.orders.choices import OrderStatusChoices
+        from apps.deliveries.choices import StatusChoices
+        from .choices import AssignmentStatusChoices
+
+        offered_since = timezone.now() - timedelta(
+            seconds=settings.DRIVER_OFFER_TIMEOUT
+        )
+        return (
+            self.filter(
+                Q(status=AssignmentStatusChoices.ACCEPTED)
+                | Q(
+                    status=AssignmentStatusChoices.PENDING,
+                    created_at__gte=offered_since,
+                )
+            )
+            .exclude(
+                order_id__status__in=[
+                    OrderStatusChoices.DELIVERED,
+                    OrderStatusChoices.CANCELLED,
+                ]
+            )
+            .exclude(order_id__delivery__is_completed=True)
+            .exclude(order_id__delivery__status=StatusChoices.FAILED)
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:37
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drivers', '0005_driver_latitude_driver_location_updated_at_and_more'),
+        ('orders', '0009_remove_historicalorder_zip_code_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DriverDailyEarning',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('deliveries', models.PositiveIntegerField(default=0)),
+                ('driver_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_earnings', to='drivers.driver')),
+            ],
+            options={
+                'verbose_name': 'driver daily earning',
+                'verbose_name_plural': 'driver daily earnings',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DriverEarning',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_available', models.BooleanField(db_index=True, default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('earned_at', models.DateTimeField()),
+                ('driver_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='earnings', to='drivers.driver')),
+                ('order_id', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='orders.order')),
+            ],
+            options={
+                'verbose_name': 'driver earning',
+                'verbose_name_plural': 'driver earnings',
+                'ordering': ['-earned_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='driverdailyearning',
+            constraint=models.UniqueConstraint(fields=('driver_id', 'day'), name='unique_driver_daily_earning'),
+        ),
+        migrations.AddIndex(
+            model_name='driverearning',
+            index=models.Index(fields=['driver_id', 'earned_at'], name='drivers_dri_driver__e9d006_idx'),
+        ),
+    ]
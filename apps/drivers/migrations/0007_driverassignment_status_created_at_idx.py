@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drivers', '0006_driverdailyearning_driverearning_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='driverassignment',
+            index=models.Index(fields=['status', 'created_at'], name='drivers_dri_status_cf1ca3_idx'),
+        ),
+    ]
@@ -9,7 +9,7 @@ from apps.utilities.models import BaseModel
 from apps.utilities.paths import docs_path
 from apps.orders.models import Order
 from apps.locations.models import Country, State, City
-from .managers import DriverManager, ResourceManager
+from .managers import DriverManager, DriverAssignmentManager, ResourceManager
 from .choices import (
     VehicleChoices,
     StatusChoices,
@@ -60,6 +60,9 @@ class Driver(BaseModel):
         default=False,
         help_text="Indicates if the driver is active to receive orders.",
     )
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
+    location_updated_at = models.DateTimeField(blank=True, null=True)
 
     objects = DriverManager()
 
@@ -69,6 +72,7 @@ class Driver(BaseModel):
         verbose_name_plural = "drivers"
         indexes = [
             models.Index(fields=["is_verified", "is_active"]),
+            models.Index(fields=["updated_at"]),
         ]
 
     def __str__(self):
@@ -93,12 +97,16 @@ class DriverAssignment(BaseModel):
         default=AssignmentStatusChoices.PENDING,
     )
 
+    objects = DriverAssignmentManager()
+
     class Meta:
         ordering = ["-assigned_at"]
         verbose_name = "driver assignment"
         verbose_name_plural = "driver assignments"
         indexes = [
             models.Index(fields=["status"]),
+            # Composite indexes
+            models.Index(fields=["status", "created_at"]),
         ]
         constraints = [
             # Ensures that the combination of driver and order is unique
@@ -118,6 +126,52 @@ class DriverAssignment(BaseModel):
         return f"{self.driver_id} assigned to {self.order_id} on {self.assigned_at}"
 
 
+class DriverEarning(BaseModel):
+    """Model definition for DriverEarning (Append-only ledger)."""
+
+    driver_id = models.ForeignKey(
+        Driver, on_delete=models.CASCADE, related_name="earnings"
+    )
+    order_id = models.OneToOneField(Order, on_delete=models.CASCADE)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    earned_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["-earned_at"]
+        verbose_name = "driver earning"
+        verbose_name_plural = "driver earnings"
+        indexes = [
+            models.Index(fields=["driver_id", "earned_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.driver_id} earned {self.amount} for {self.order_id}"
+
+
+class DriverDailyEarning(models.Model):
+    """Model definition for DriverDailyEarning (Rollup of DriverEarning)."""
+
+    driver_id = models.ForeignKey(
+        Driver, on_delete=models.CASCADE, related_name="daily_earnings"
+    )
+    day = models.DateField()
+    amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    deliveries = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        verbose_name = "driver daily earning"
+        verbose_name_plural = "driver daily earnings"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["driver_id", "day"], name="unique_driver_daily_earning"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.driver_id} on {self.day}: {self.amount}"
+
+
 class Resource(BaseModel):
     """Model definition for Resource."""
 
@@ -7,6 +7,8 @@ from .serializers import (
     DriverReadSerializer,
     DriverWriteSerializer,
     DriverMinimalSerializer,
+    DriverLocationSerializer,
+    DriverEarningsFilterSerializer,
 )
 
 
@@ -94,11 +96,12 @@ driver_schemas = {
     ),
     "get_earnings": extend_schema(
         summary="Retrieve Earnings of a Driver",
-        description="Retrieve all earnings generated by a driver for the day, only for `IsDriver` or `IsAdministrator` users.",
+        description="Retrieve the earnings generated by a driver, in total and per day, optionally within a `start_date`/`end_date` range (lifetime total by default, the daily list covers at most the last 30 days of the range), only for `IsDriver` or `IsAdministrator` users.",
+        parameters=[DriverEarningsFilterSerializer],
         responses={
             200: OpenApiResponse(
                 DriverReadSerializer,
-                description="A dictionary with driver name and total earnings.",
+                description="A dictionary with driver name, total earnings and daily earnings.",
             ),
             404: OpenApiResponse(description="Driver not found."),
         },
@@ -147,6 +150,21 @@ driver_schemas = {
         },
         tags=["drivers"],
     ),
+    "update_location": extend_schema(
+        summary="Update Driver Location",
+        description="Receives a location ping from a driver and updates its position in the dispatch index, only for `IsDriver` or `IsAdministrator` users.",
+        request=DriverLocationSerializer,
+        responses={
+            200: OpenApiResponse(description="Location updated."),
+            400: OpenApiResponse(description="Bad request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(
+                description="You do not have permission to perform this action."
+            ),
+            404: OpenApiResponse(description="Driver not found."),
+        },
+        tags=["drivers"],
+    ),
     "get_orders": extend_schema(
         summary="Get Orders for a Driver",
         description="Returns a list of orders associated with a driver, only for `IsDriver` or `IsAdministrator` users.",
@@ -5,16 +5,18 @@ from rest_framework import serializers
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from apps.utilities.functions import decrypt_field
 from apps.utilities.validators import validate_phone, validate_birth_date
-from .models import Driver, Resource
+from apps.locations.models import Country, State, City
+from apps.locations.serializers import LocationNameField
+from .models import Driver, DriverDailyEarning, Resource
 
 
 class DriverReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Driver model (List/retrieve)"""
 
     user_id = serializers.UUIDField(read_only=True)
-    city_id = serializers.StringRelatedField()
-    state_id = serializers.StringRelatedField()
-    country_id = serializers.StringRelatedField()
+    city_id = LocationNameField(model=City)
+    state_id = LocationNameField(model=State)
+    country_id = LocationNameField(model=Country)
     vehicle_type = serializers.CharField(source="get_vehicle_type_display")
     status = serializers.CharField(source="get_status_display")
 
@@ -72,9 +74,9 @@ class DriverMinimalSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Driver model (Minimal)"""
 
     user_id = serializers.StringRelatedField()
-    city_id = serializers.StringRelatedField()
-    state_id = serializers.StringRelatedField()
-    country_id = serializers.StringRelatedField()
+    city_id = LocationNameField(model=City)
+    state_id = LocationNameField(model=State)
+    country_id = LocationNameField(model=Country)
     status = serializers.CharField(source="get_status_display")
 
     class Meta:
@@ -89,6 +91,41 @@ class DriverMinimalSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
         ]
 
 
+class DriverLocationSerializer(serializers.Serializer):
+    """Serializer for driver location pings."""
+
+    latitude = serializers.FloatField(min_value=-90, max_value=90)
+    longitude = serializers.FloatField(min_value=-180, max_value=180)
+
+
+class DriverEarningsFilterSerializer(serializers.Serializer):
+    """Serializer for the date range of driver earnings."""
+
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        start_date = attrs.get("start_date")
+        end_date = attrs.get("end_date")
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError(
+                "The start date cannot be later than the end date."
+            )
+        return attrs
+
+
+class DriverDailyEarningSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
+    """Serializer for DriverDailyEarning model (List)."""
+
+    class Meta:
+        model = DriverDailyEarning
+        fields = [
+            "day",
+            "amount",
+            "deliveries",
+        ]
+
+
 class ResourceReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Resource model (List/retrieve)."""
 
@@ -1,9 +1,13 @@
 """Services for Drivers App."""
 
-import random
+from datetime import timedelta
 from decimal import Decimal
 from django.conf import settings
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import F, Sum, Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -12,6 +16,8 @@ from apps.users.choices import RoleChoices
 from apps.deliveries.models import Delivery
 from .choices import VehicleChoices, StatusChoices
 from .serializers import DriverWriteSerializer
+from .spatial import driver_index
+from .dispatch import UNREACHABLE, distance_matrix, solve_assignment
 
 
 class DriverService:
@@ -80,16 +86,75 @@ class DriverService:
         )
 
     @staticmethod
-    def calculate_earnings(driver):
+    def record_earning(delivery):
         """
-        Calculate total earnings for a given driver.
+        Append the earning of a completed delivery to the driver ledger.
+
+        The ledger row is unique per order, so recording the same delivery
+        twice is a no-op; the daily rollup is incremented in the same
+        transaction with `F()` expressions.
         """
-        # Add filter by day or date range
-        deliveries = Delivery.objects.filter(driver_id=driver)
-        total_earnings = sum(
-            delivery.order_id.amount * Decimal(settings.DRIVER_TAX_RATE)
-            for delivery in deliveries
+        from .models import DriverEarning, DriverDailyEarning
+
+        earned_at = delivery.delivered_at or timezone.now()
+        amount = round(
+            delivery.order_id.amount * Decimal(settings.DRIVER_TAX_RATE), 2
         )
+        with transaction.atomic():
+            _, created = DriverEarning.objects.get_or_create(
+                order_id=delivery.order_id,
+                defaults={
+                    "driver_id": delivery.driver_id,
+                    "amount": amount,
+                    "earned_at": earned_at,
+                },
+            )
+            if not created:
+                return
+            rollup, _ = DriverDailyEarning.objects.get_or_create(
+                driver_id=delivery.driver_id,
+                day=timezone.localdate(earned_at),
+            )
+            DriverDailyEarning.objects.filter(pk=rollup.pk).update(
+                amount=F("amount") + amount,
+                deliveries=F("deliveries") + 1,
+            )
+
+    @staticmethod
+    def get_daily_earnings(driver, start_date=None, end_date=None):
+        """Return the daily earning rollups of a driver within a date range."""
+        from .models import DriverDailyEarning
+
+        daily_earnings = DriverDailyEarning.objects.filter(driver_id=driver)
+        if start_date:
+            daily_earnings = daily_earnings.filter(day__gte=start_date)
+        if end_date:
+            daily_earnings = daily_earnings.filter(day__lte=end_date)
+        return daily_earnings
+
+    @staticmethod
+    def get_daily_window(start_date=None, end_date=None):
+        """
+        Return the date range listed in the daily earnings breakdown.
+
+        The range ends at `end_date` (today by default) and spans at most
+        DRIVER_EARNINGS_WINDOW_DAYS days, starting at `start_date` when given.
+        """
+        end_date = end_date or timezone.localdate()
+        earliest = end_date - timedelta(days=settings.DRIVER_EARNINGS_WINDOW_DAYS - 1)
+        start_date = max(start_date, earliest) if start_date else earliest
+        return start_date, end_date
+
+    @staticmethod
+    def calculate_earnings(driver, start_date=None, end_date=None):
+        """
+        Calculate total earnings for a given driver.
+
+        Sums the pre-aggregated daily rollups, optionally within a date range.
+        """
+        total_earnings = DriverService.get_daily_earnings(
+            driver, start_date, end_date
+        ).aggregate(total=Sum("amount"))["total"] or Decimal(0)
 
         # Add extra percentage based on the driver's status
         extra_percentage = Decimal(0)
@@ -104,6 +169,61 @@ class DriverService:
         total_earnings += total_earnings * extra_percentage
         return round(total_earnings, 2)  # Round to 2 decimal places
 
+    @staticmethod
+    def rebuild_earnings():
+        """
+        Rebuild the earnings ledger and its daily rollups from deliveries.
+
+        Backfills a ledger row for every completed delivery that has none and
+        recomputes all daily rollups from the ledger.
+        """
+        from .models import DriverEarning, DriverDailyEarning
+
+        rate = Decimal(settings.DRIVER_TAX_RATE)
+        deliveries = (
+            Delivery.objects.filter(
+                is_completed=True,
+                driver_id__isnull=False,
+                delivered_at__isnull=False,
+            )
+            .exclude(order_id__driverearning__isnull=False)
+            .values_list("order_id", "driver_id", "order_id__amount", "delivered_at")
+        )
+        with transaction.atomic():
+            DriverEarning.objects.bulk_create(
+                [
+                    DriverEarning(
+                        order_id_id=order_id,
+                        driver_id_id=driver_id,
+                        amount=round(amount * rate, 2),
+                        earned_at=delivered_at,
+                    )
+                    for order_id, driver_id, amount, delivered_at in deliveries.iterator()
+                ],
+                batch_size=1000,
+            )
+
+            rollups = (
+                DriverEarning.objects.annotate(day=TruncDate("earned_at"))
+                .order_by()
+                .values("driver_id", "day")
+                .annotate(total=Sum("amount"), count=Count("id"))
+            )
+            DriverDailyEarning.objects.all().delete()
+            created = DriverDailyEarning.objects.bulk_create(
+                [
+                    DriverDailyEarning(
+                        driver_id_id=rollup["driver_id"],
+                        day=rollup["day"],
+                        amount=rollup["total"],
+                        deliveries=rollup["count"],
+                    )
+                    for rollup in rollups.iterator()
+                ],
+                batch_size=1000,
+            )
+        return len(created)
+
     @staticmethod
     def toggle_availability(driver):
         """
@@ -127,34 +247,87 @@ class DriverService:
                 }
             )
 
+    @staticmethod
+    def update_location(driver, latitude, longitude):
+        """
+        Store the latest location ping of a driver and move it in the index.
+
+        Uses a single UPDATE instead of `save()` so pings do not re-run the
+        model signals; `updated_at` is bumped so other processes pick the new
+        position up on their next incremental index sync.
+        """
+        from apps.drivers.models import Driver
+
+        now = timezone.now()
+        Driver.objects.filter(pk=driver.pk).update(
+            latitude=latitude,
+            longitude=longitude,
+            location_updated_at=now,
+            updated_at=now,
+        )
+        driver.latitude = latitude
+        driver.longitude = longitude
+        driver.location_updated_at = now
+        driver_index.update(
+            driver.pk,
+            latitude,
+            longitude,
+            is_dispatchable=(
+                driver.is_available and driver.is_verified and driver.is_active
+            ),
+        )
+
+    @staticmethod
+    def get_nearest_drivers(latitude, longitude, k=None, exclude=None):
+        """
+        Return the ids of the `k` dispatchable drivers nearest to a point.
+
+        Falls back to any indexed drivers when the point is unknown.
+        """
+        k = k or settings.DRIVER_DISPATCH_CANDIDATES
+        driver_index.sync()
+        if latitude is None or longitude is None:
+            return driver_index.any(k=k, exclude=exclude)
+        return [
+            driver_id
+            for driver_id, _ in driver_index.nearest(
+                latitude, longitude, k=k, exclude=exclude
+            )
+        ]
+
     @staticmethod
     def assign_driver_to_order(order):
         """
         Assign an available driver to a specific order.
 
-        This method checks for available drivers who are verified and active,
-        randomly selects one, and assigns them to the specified order.
+        This method looks up the verified and active drivers nearest to the
+        order's restaurant in the in-process spatial index, and assigns the
+        closest one that has not been assigned to the order yet.
         """
-        from apps.drivers.models import Driver, DriverAssignment
+        from apps.drivers.models import DriverAssignment
 
         try:
-            available_drivers = Driver.objects.get_available().filter(
-                is_verified=True, is_active=True
+            restaurant = order.restaurant_id
+            candidates = DriverService.get_nearest_drivers(
+                restaurant.latitude, restaurant.longitude
             )
-            # ! TODO: Add location filter
 
             # Check if there are available drivers
-            if not available_drivers.exists():
+            if not candidates:
                 return {
                     "success": False,
                     "message": "No drivers available or active.",
                     "status_code": status.HTTP_404_NOT_FOUND,
                 }
 
-            # Randomly select a driver
-            driver = random.choice(available_drivers)
+            assigned = set(
+                DriverAssignment.objects.filter(
+                    order_id=order, driver_id__in=candidates
+                ).values_list("driver_id", flat=True)
+            )
+            driver_id = next((pk for pk in candidates if pk not in assigned), None)
 
-            if DriverAssignment.objects.filter(order_id=order, driver_id=driver).exists():
+            if driver_id is None:
                 return {
                     "success": False,
                     "message": "The order has already been assigned.",
@@ -162,11 +335,11 @@ class DriverService:
                 }
 
             # Create the driver assignment
-            DriverAssignment.objects.create(order_id=order, driver_id=driver)
+            DriverAssignment.objects.create(order_id=order, driver_id_id=driver_id)
 
             return {
                 "success": True,
-                "message": f"Driver {driver.id} assigned to order {order.id}.",
+                "message": f"Driver {driver_id} assigned to order {order.id}.",
                 "status_code": status.HTTP_200_OK,
             }
         except ObjectDoesNotExist:
@@ -181,3 +354,105 @@ class DriverService:
                 "message": str(e),
                 "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
             }
+
+    @staticmethod
+    def dispatch_pending_orders():
+        """
+        Assign drivers to every order awaiting one in a single batch.
+
+        Collects the paid, undelivered orders without an active assignment,
+        gathers the nearest drivers of each pickup point from the spatial
+        index, and solves one global order-to-driver matching over the
+        vectorized distance matrix. All assignments are written with a
+        single `bulk_create`.
+        """
+        from apps.orders.models import Order
+        from apps.drivers.models import DriverAssignment
+
+        with transaction.atomic():
+            orders = list(
+                Order.objects.get_awaiting_driver()
+                .filter(
+                    restaurant_id__latitude__isnull=False,
+                    restaurant_id__longitude__isnull=False,
+                )
+                .select_related("restaurant_id")
+                .select_for_update(skip_locked=True, of=("self",))
+                .only(
+                    "id",
+                    "restaurant_id",
+                    "restaurant_id__latitude",
+                    "restaurant_id__longitude",
+                )
+            )
+            if not orders:
+                return {
+                    "success": True,
+                    "message": "No orders awaiting a driver.",
+                    "status_code": status.HTTP_200_OK,
+                }
+
+            # Drivers with an open offer or an ongoing delivery are busy
+            busy = set(
+                DriverAssignment.objects.get_active().values_list(
+                    "driver_id", flat=True
+                )
+            )
+
+            driver_index.sync()
+            pickups = [
+                (order.restaurant_id.latitude, order.restaurant_id.longitude)
+                for order in orders
+            ]
+            nearest = {
+                driver_id: None
+                for latitude, longitude in pickups
+                for driver_id, _ in driver_index.nearest(
+                    latitude,
+                    longitude,
+                    k=settings.DISPATCH_BATCH_CANDIDATES,
+                    exclude=busy,
+                )
+            }
+            # Drivers removed from the index meanwhile are left out
+            positions = driver_index.positions(nearest)
+            driver_ids = list(positions)
+            candidates = {pk: column for column, pk in enumerate(driver_ids)}
+
+            if not driver_ids:
+                return {
+                    "success": False,
+                    "message": "No drivers available or active.",
+                    "status_code": status.HTTP_404_NOT_FOUND,
+                }
+
+            cost = distance_matrix(pickups, list(positions.values()))
+            cost[cost > settings.DRIVER_DISPATCH_RADIUS_KM] = UNREACHABLE
+
+            # Never offer an order again to a driver who already had it
+            order_rows = {order.pk: row for row, order in enumerate(orders)}
+            previous = DriverAssignment.objects.filter(
+                order_id__in=order_rows, driver_id__in=driver_ids
+            ).values_list("order_id", "driver_id")
+            for order_id, driver_id in previous:
+                cost[order_rows[order_id], candidates[driver_id]] = UNREACHABLE
+
+            matches = solve_assignment(cost, UNREACHABLE)
+            DriverAssignment.objects.bulk_create(
+                [
+                    DriverAssignment(
+                        order_id=orders[row],
+                        driver_id_id=driver_ids[column],
+                    )
+                    for row, column in matches
+                ]
+            )
+
+        return {
+            "success": True,
+            "message": (
+                f"{len(matches)} orders assigned, "
+                f"{len(orders) - len(matches)} left pending."
+            ),
+            "status_code": status.HTTP_200_OK,
+        }
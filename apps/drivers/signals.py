@@ -1,35 +1,41 @@
 """Signals for Drivers App."""
 
-import os
-from django.conf import settings
 from django.dispatch import receiver
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_save, post_delete
 
+from apps.utilities.cache import register_list_cache
 from .models import Driver
+from .spatial import driver_index
+from .tasks import delete_driver_documents
 
 
-@receiver(pre_save, sender=Driver)
-def delete_sensitive_documents(sender, instance, **kwargs):
-    """Delete sensitive documents associated with a driver if they are verified."""
-    if instance.is_verified:
-        try:
-            if instance.driver_license:
-                os.remove(
-                    os.path.join(settings.MEDIA_ROOT, instance.driver_license.name)
-                )
-            if instance.identification_document:
-                os.remove(
-                    os.path.join(
-                        settings.MEDIA_ROOT, instance.identification_document.name
-                    )
-                )
-            if instance.social_security_certificate:
-                os.remove(
-                    os.path.join(
-                        settings.MEDIA_ROOT, instance.social_security_certificate.name
-                    )
-                )
-        except FileNotFoundError:
-            # ! TODO: Add sentry for logs
-            # logger.error(f"File not found error")
-            pass
+register_list_cache(Driver)
+
+
+@receiver(post_save, sender=Driver)
+def delete_sensitive_documents(sender, instance, raw=False, **kwargs):
+    """Signal queue the deletion of the documents of a verified driver."""
+    if instance.is_verified and not raw:
+        delete_driver_documents.enqueue(
+            dedup_key=f"drivers:documents:{instance.pk}",
+            driver_id=str(instance.pk),
+        )
+
+
+@receiver(post_save, sender=Driver)
+def update_driver_index(sender, instance, **kwargs):
+    """Keep the in-process dispatch index in sync with the saved driver."""
+    driver_index.update(
+        instance.pk,
+        instance.latitude,
+        instance.longitude,
+        is_dispatchable=(
+            instance.is_available and instance.is_verified and instance.is_active
+        ),
+    )
+
+
+@receiver(post_delete, sender=Driver)
+def remove_driver_from_index(sender, instance, **kwargs):
+    """Remove a deleted driver from the in-process dispatch index."""
+    driver_index.remove(instance.pk)
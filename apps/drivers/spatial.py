@@ -0,0 +1,179 @@
+"""Spatial index for Drivers App."""
+
+import math
+
+from django.conf import settings
+
+from apps.utilities.sync import SyncedIndex
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Equirectangular distance between two points, accurate at city scale."""
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return EARTH_RADIUS_KM * math.hypot(x, y)
+
+
+class DriverSpatialIndex(SyncedIndex):
+    """
+    In-process grid index of dispatchable drivers.
+
+    Drivers are bucketed into square cells of `cell_size` degrees, so a
+    nearest-neighbour query only inspects the rings of cells around the
+    pickup point instead of every online driver. The index is loaded once
+    from the database and then refreshed incrementally: location pings and
+    driver saves in this process update it directly, and `sync()` pulls the
+    rows changed by other processes since the last sync.
+    """
+
+    def __init__(self, cell_size, sync_interval, max_radius_km):
+        super().__init__(sync_interval)
+        self.cell_size = cell_size
+        self.max_radius_km = max_radius_km
+        self._cells = {}
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _cell(self, latitude, longitude):
+        return (
+            math.floor(latitude / self.cell_size),
+            math.floor(longitude / self.cell_size),
+        )
+
+    def _discard(self, driver_id):
+        position = self._positions.pop(driver_id, None)
+        if position is None:
+            return
+        cell = self._cell(*position)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(driver_id)
+            if not bucket:
+                del self._cells[cell]
+
+    def _upsert(self, driver_id, latitude, longitude):
+        self._discard(driver_id)
+        self._positions[driver_id] = (latitude, longitude)
+        self._cells.setdefault(self._cell(latitude, longitude), set()).add(driver_id)
+
+    def _apply(self, rows):
+        for driver_id, latitude, longitude, is_dispatchable in rows:
+            if is_dispatchable and latitude is not None and longitude is not None:
+                self._upsert(driver_id, latitude, longitude)
+            else:
+                self._discard(driver_id)
+
+    def update(self, driver_id, latitude, longitude, is_dispatchable=True):
+        """Insert, move or remove a single driver."""
+        with self._lock:
+            self._apply([(driver_id, latitude, longitude, is_dispatchable)])
+
+    def remove(self, driver_id):
+        with self._lock:
+            self._discard(driver_id)
+
+    def _reset(self):
+        self._cells.clear()
+        self._positions.clear()
+
+    def _load_rows(self):
+        from .models import Driver
+
+        self._apply(
+            (pk, lat, lon, True)
+            for pk, lat, lon in Driver.objects.get_dispatchable().values_list(
+                "id", "latitude", "longitude"
+            )
+        )
+
+    def _sync_rows(self, since):
+        from .models import Driver
+
+        changed = Driver.objects.filter(updated_at__gte=since).values_list(
+            "id",
+            "latitude",
+            "longitude",
+            "is_available",
+            "is_verified",
+            "is_active",
+        )
+        rows = [
+            (pk, lat, lon, is_available and is_verified and is_active)
+            for pk, lat, lon, is_available, is_verified, is_active in changed
+        ]
+        with self._lock:
+            self._apply(rows)
+
+    def _scan_cell(self, cell, latitude, longitude, exclude):
+        """Yield the `(distance_km, driver_id)` of the drivers of a cell in range."""
+        for driver_id in self._cells.get(cell, ()):
+            if driver_id in exclude:
+                continue
+            lat, lon = self._positions[driver_id]
+            dist = distance_km(latitude, longitude, lat, lon)
+            if dist <= self.max_radius_km:
+                yield dist, driver_id
+
+    def nearest(self, latitude, longitude, k=1, exclude=None):
+        """
+        Return up to `k` `(driver_id, distance_km)` pairs ordered by distance.
+
+        Rings of cells are scanned outwards from the query point and the
+        search stops as soon as the k-th candidate is closer than any driver
+        in the next ring could be, or when `max_radius_km` is reached.
+        """
+        exclude = exclude or ()
+        cell_lat, cell_lon = self._cell(latitude, longitude)
+        cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+        ring_km = self.cell_size * KM_PER_DEGREE * cos_lat
+        max_ring = max(1, math.ceil(self.max_radius_km / ring_km))
+
+        candidates = []
+        with self._lock:
+            for ring in range(max_ring + 1):
+                for d_lat in range(-ring, ring + 1):
+                    for d_lon in range(-ring, ring + 1):
+                        if max(abs(d_lat), abs(d_lon)) == ring:
+                            candidates.extend(
+                                self._scan_cell(
+                                    (cell_lat + d_lat, cell_lon + d_lon),
+                                    latitude,
+                                    longitude,
+                                    exclude,
+                                )
+                            )
+                if len(candidates) >= k:
+                    candidates.sort()
+                    if candidates[k - 1][0] <= ring * ring_km:
+                        break
+
+        candidates.sort()
+        return [(driver_id, dist) for dist, driver_id in candidates[:k]]
+
+    def positions(self, driver_ids):
+        """
+        Return the `(latitude, longitude)` of the driver ids still indexed,
+        by id; drivers removed since they were found are left out.
+        """
+        with self._lock:
+            return {
+                pk: self._positions[pk] for pk in driver_ids if pk in self._positions
+            }
+
+    def any(self, k=1, exclude=None):
+        """Return up to `k` indexed driver ids, used when there is no pickup point."""
+        exclude = exclude or ()
+        with self._lock:
+            return [pk for pk in self._positions if pk not in exclude][:k]
+
+
+driver_index = DriverSpatialIndex(
+    cell_size=settings.DRIVER_INDEX_CELL_SIZE,
+    sync_interval=settings.DRIVER_INDEX_SYNC_INTERVAL,
+    max_radius_km=settings.DRIVER_DISPATCH_RADIUS_KM,
+)
@@ -0,0 +1,20 @@
+"""Tasks for Drivers App."""
+
+from apps.tasks.registry import task
+from .models import Driver
+
+
+@task()
+def delete_driver_documents(driver_id):
+    """Task delete the sensitive documents of a verified driver."""
+    driver = Driver.objects.filter(pk=driver_id, is_verified=True).first()
+    if driver is None:
+        return
+    for document in [
+        driver.driver_license,
+        driver.identification_document,
+        driver.social_security_certificate,
+    ]:
+        if document:
+            # Missing files are ignored, other storage errors are retried
+            document.storage.delete(document.name)
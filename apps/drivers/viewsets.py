@@ -9,7 +9,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
 
-from apps.utilities.mixins import ListCacheMixin, LogicalDeleteMixin
+from apps.utilities.mixins import ReplicaMixin, ListCacheMixin, LogicalDeleteMixin
 from apps.users.permissions import IsSupport, IsClient, IsDriver, IsOwner
 from apps.orders.models import Order
 from apps.orders.serializers import OrderMinimalSerializer
@@ -20,6 +20,9 @@ from .serializers import (
     DriverReadSerializer,
     DriverWriteSerializer,
     DriverMinimalSerializer,
+    DriverLocationSerializer,
+    DriverEarningsFilterSerializer,
+    DriverDailyEarningSerializer,
     ResourceReadSerializer,
     ResourceWriteSerializer,
 )
@@ -28,7 +31,7 @@ from .schemas import driver_schemas
 
 
 @extend_schema_view(**driver_schemas)
-class DriverViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
+class DriverViewSet(ReplicaMixin, ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     """
     ViewSet for managing Driver instances.
 
@@ -41,10 +44,12 @@ class DriverViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     - DELETE /api/v1/drivers/{id}/
     """
 
+    replica_actions = ["get_resources_history"]
     permission_classes = [IsSupport, IsOwner]
     serializer_class = DriverWriteSerializer
     search_fields = ["user_id"]
     filterset_class = DriverFilter
+    cache_scope = "user"
 
     def get_queryset(self):
         if self.action == "list":
@@ -99,15 +104,31 @@ class DriverViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
         Action returns a list of earnings for a driver.
 
         Endpoints:
-        - GET api/v1/driver/{id}/earnings/
+        - GET api/v1/driver/{id}/earnings/?start_date=&end_date=
         """
         try:
             driver = self.get_object()
-            total_earnings = DriverService.calculate_earnings(driver)
+            serializer = DriverEarningsFilterSerializer(data=request.query_params)
+            serializer.is_valid(raise_exception=True)
+            start_date = serializer.validated_data.get("start_date")
+            end_date = serializer.validated_data.get("end_date")
+
+            total_earnings = DriverService.calculate_earnings(
+                driver, start_date, end_date
+            )
+            # The total covers the whole range, the daily list is bounded
+            daily_earnings = DriverService.get_daily_earnings(
+                driver, *DriverService.get_daily_window(start_date, end_date)
+            )
 
             data = {
                 "driver_name": driver.user_id.username,
+                "start_date": start_date,
+                "end_date": end_date,
                 "total_earnings": total_earnings,
+                "daily_earnings": DriverDailyEarningSerializer(
+                    daily_earnings, many=True
+                ).data,
             }
             return Response(data, status=status.HTTP_200_OK)
         except Driver.DoesNotExist:
@@ -201,6 +222,39 @@ class DriverViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    @action(
+        detail=True,
+        methods=["patch"],
+        permission_classes=[IsDriver],
+        url_path="location",
+    )
+    def update_location(self, request, *args, **kwargs):
+        """
+        Action receives a location ping from a driver.
+
+        Endpoints:
+        - PATCH api/v1/drivers/{id}/location/
+        """
+        driver = self.get_object()
+
+        if driver.user_id != request.user:
+            return Response(
+                {"detail": "You do not have permission to perform this action."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = DriverLocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        DriverService.update_location(
+            driver,
+            serializer.validated_data["latitude"],
+            serializer.validated_data["longitude"],
+        )
+        return Response(
+            {"detail": "Location updated."},
+            status=status.HTTP_200_OK,
+        )
+
     @action(
         detail=True,
         methods=["get"],
@@ -3,7 +3,7 @@
 from django.contrib import admin
 from apps.utilities.admin import BaseAdmin
 
-from .models import Revenue
+from .models import Revenue, RevenueDailySummary
 
 
 @admin.register(Revenue)
@@ -21,3 +21,14 @@ class RevenueAdmin(BaseAdmin):
     list_filter = ["transaction_type"]
     readonly_fields = ["created_at", "updated_at"]
     ordering = ["-created_at"]
+
+
+@admin.register(RevenueDailySummary)
+class RevenueDailySummaryAdmin(admin.ModelAdmin):
+    """Admin for RevenueDailySummary model."""
+
+    search_fields = ["restaurant_id", "driver_id"]
+    list_display = ["day", "restaurant_id", "driver_id", "transaction_type", "amount"]
+    list_filter = ["day", "transaction_type"]
+    list_per_page = 25
+    ordering = ["-day"]
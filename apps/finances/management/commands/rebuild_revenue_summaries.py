@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.finances.services import RevenueService
+
+
+class Command(BaseCommand):
+    help = "Finances: Rebuild the daily revenue summaries from the revenues table"
+
+    def handle(self, *args, **options) -> None:
+        total = RevenueService.rebuild_summaries()
+        self.stdout.write(
+            self.style.SUCCESS(f"{total} days of revenue summaries rebuilt.")
+        )
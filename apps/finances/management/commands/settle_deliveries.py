@@ -0,0 +1,39 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.finances.services import RevenueService
+
+
+class Command(BaseCommand):
+    help = "Finances: Create the driver earnings and restaurant commissions of completed deliveries"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep settling new deliveries every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.SETTLEMENT_INTERVAL,
+        )
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=settings.SETTLEMENT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options) -> None:
+        while True:
+            total = 0
+            # Drain the backlog one batch at a time
+            while settled := RevenueService.settle_deliveries(options["batch"]):
+                total += settled
+            if total or not options["loop"]:
+                self.stdout.write(self.style.SUCCESS(f"{total} deliveries settled."))
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drivers', '0006_driverdailyearning_driverearning_and_more'),
+        ('finances', '0002_alter_revenue_driver_id_alter_revenue_order_id_and_more'),
+        ('orders', '0009_remove_historicalorder_zip_code_and_more'),
+        ('restaurants', '0004_historicalrestaurant_latitude_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='revenue',
+            index=models.Index(fields=['created_at', 'id'], name='finances_re_created_45cba6_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drivers', '0006_driverdailyearning_driverearning_and_more'),
+        ('finances', '0003_revenue_finances_re_created_45cba6_idx'),
+        ('restaurants', '0005_food_search_vector_restaurant_search_vector_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('transaction_type', models.CharField(choices=[('delivery_earnings', 'Delivery Earnings'), ('restaurant_commission', 'Restaurant Commission'), ('driver_withdrawal', 'Driver Withdrawal'), ('promotional_bonus', 'Promotional Bonus'), ('referral_bonus', 'Referral Bonus'), ('other_income', 'Other Income'), ('expense', 'Expense'), ('adjustment', 'Adjustment'), ('marketing_expense', 'Marketing Expense'), ('operational_expense', 'Operational Expense'), ('subscription_revenue', 'Subscription Revenue'), ('partnership_revenue', 'Partnership Revenue'), ('refund', 'Refund'), ('taxes', 'Taxes'), ('loan_repayment', 'Loan Repayment')], max_length=30)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('revenues', models.PositiveIntegerField(default=0)),
+                ('driver_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='drivers.driver')),
+                ('restaurant_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='restaurants.restaurant')),
+            ],
+            options={
+                'verbose_name': 'revenue daily summary',
+                'verbose_name_plural': 'revenue daily summaries',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day'], name='finances_re_day_60a929_idx'), models.Index(fields=['restaurant_id', 'day'], name='finances_re_restaur_c582af_idx'), models.Index(fields=['driver_id', 'day'], name='finances_re_driver__83aeb5_idx'), models.Index(fields=['transaction_type', 'day'], name='finances_re_transac_8103f5_idx')],
+            },
+        ),
+    ]
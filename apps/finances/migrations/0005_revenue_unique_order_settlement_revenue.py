@@ -0,0 +1,42 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+SETTLEMENT_TYPES = ["delivery_earnings", "restaurant_commission"]
+
+
+def remove_duplicate_settlements(apps, schema_editor):
+    """Keep the oldest settlement revenue of each order and type."""
+    Revenue = apps.get_model("finances", "Revenue")
+    duplicates = (
+        Revenue.objects.filter(transaction_type__in=SETTLEMENT_TYPES)
+        .values("order_id", "transaction_type")
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for duplicate in duplicates.iterator():
+        revenues = Revenue.objects.filter(
+            order_id=duplicate["order_id"],
+            transaction_type=duplicate["transaction_type"],
+        ).order_by("created_at", "id")
+        Revenue.objects.filter(
+            pk__in=list(revenues.values_list("pk", flat=True)[1:])
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0004_revenuedailysummary'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_settlements, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='revenue',
+            constraint=models.UniqueConstraint(condition=models.Q(('transaction_type__in', ['delivery_earnings', 'restaurant_commission'])), fields=('order_id', 'transaction_type'), name='unique_order_settlement_revenue'),
+        ),
+    ]
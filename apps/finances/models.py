@@ -48,7 +48,60 @@ class Revenue(BaseModel):
             models.Index(fields=["driver_id"]),
             models.Index(fields=["restaurant_id"]),
             models.Index(fields=["transaction_type"]),
+            # Composite indexes
+            models.Index(fields=["created_at", "id"]),
+        ]
+        constraints = [
+            # Settlement revenues are created once per order
+            models.UniqueConstraint(
+                fields=["order_id", "transaction_type"],
+                condition=models.Q(
+                    transaction_type__in=[
+                        TransactionTypeChoices.DELIVERY_EARNINGS,
+                        TransactionTypeChoices.RESTAURANT_COMMISSION,
+                    ]
+                ),
+                name="unique_order_settlement_revenue",
+            ),
         ]
 
     def __str__(self):
         return str(self.pk)
+
+
+class RevenueDailySummary(models.Model):
+    """Model definition for RevenueDailySummary (Rollup of Revenue)."""
+
+    day = models.DateField()
+    restaurant_id = models.ForeignKey(
+        Restaurant,
+        on_delete=models.DO_NOTHING,
+        blank=True,
+        null=True,
+    )
+    driver_id = models.ForeignKey(
+        Driver,
+        on_delete=models.DO_NOTHING,
+        blank=True,
+        null=True,
+    )
+    transaction_type = models.CharField(
+        max_length=30,
+        choices=TransactionTypeChoices.choices,
+    )
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    revenues = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        verbose_name = "revenue daily summary"
+        verbose_name_plural = "revenue daily summaries"
+        indexes = [
+            models.Index(fields=["day"]),
+            models.Index(fields=["restaurant_id", "day"]),
+            models.Index(fields=["driver_id", "day"]),
+            models.Index(fields=["transaction_type", "day"]),
+        ]
+
+    def __str__(self):
+        return f"{self.transaction_type} on {self.day}: {self.amount}"
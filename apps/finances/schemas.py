@@ -2,7 +2,13 @@
 
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
-from .serializers import RevenueReadSerializer, RevenueWriteSerializer
+from apps.utilities.exports import export_format_parameter, export_responses
+from .serializers import (
+    RevenueReadSerializer,
+    RevenueWriteSerializer,
+    RevenueSummaryFilterSerializer,
+    RevenueSummarySerializer,
+)
 
 
 revenue_schemas = {
@@ -76,4 +82,29 @@ revenue_schemas = {
         },
         tags=["revenues"],
     ),
+    "export": extend_schema(
+        summary="Export Revenues",
+        description="Download all the revenues matching the list filters as a CSV or NDJSON file, streamed while it is read, only for `IsFinance` or `IsAdministrator` users.",
+        parameters=[export_format_parameter],
+        filters=True,
+        responses={
+            **export_responses,
+            400: OpenApiResponse(description="Bad request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+        },
+        tags=["revenues"],
+    ),
+    "get_summary": extend_schema(
+        summary="Get the Revenue Summary",
+        description="Get the total amount and number of revenues within a `start_date`/`end_date` range, grouped by `period` and the `group_by` dimensions. Totals are read from the daily revenue summaries, refreshed shortly after every change of a revenue, only for `IsFinance` or `IsAdministrator` users.",
+        parameters=[RevenueSummaryFilterSerializer],
+        responses={
+            200: OpenApiResponse(RevenueSummarySerializer, description="OK"),
+            400: OpenApiResponse(description="Bad request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+        },
+        tags=["revenues"],
+    ),
 }
@@ -4,7 +4,8 @@ from rest_framework import serializers
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from .models import Revenue
-from .services import RevenueService
+from .services import RevenueService, SUMMARY_PERIODS, SUMMARY_DIMENSIONS
+from .choices import TransactionTypeChoices
 
 
 class RevenueReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
@@ -44,3 +45,63 @@ class RevenueWriteSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         return RevenueService.validate_transaction_type(data)
+
+
+class RevenueSummaryFilterSerializer(serializers.Serializer):
+    """Serializer for the parameters of the revenue summary."""
+
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    period = serializers.ChoiceField(
+        choices=list(SUMMARY_PERIODS),
+        required=False,
+        help_text="Group the totals by day, week, month or year.",
+    )
+    group_by = serializers.MultipleChoiceField(
+        choices=list(SUMMARY_DIMENSIONS),
+        required=False,
+        allow_empty=True,
+        help_text="Group the totals by restaurant, driver and/or transaction type, ex `/?group_by=restaurant&group_by=transaction_type`",
+    )
+    restaurant_id = serializers.UUIDField(required=False)
+    driver_id = serializers.UUIDField(required=False)
+    transaction_type = serializers.ChoiceField(
+        choices=TransactionTypeChoices.choices,
+        required=False,
+    )
+
+    def validate(self, attrs):
+        start_date = attrs.get("start_date")
+        end_date = attrs.get("end_date")
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError(
+                "The start date cannot be later than the end date."
+            )
+        # Keep the order of the dimensions stable
+        attrs["group_by"] = [
+            dimension
+            for dimension in SUMMARY_DIMENSIONS
+            if dimension in attrs.get("group_by", ())
+        ]
+        return attrs
+
+
+class RevenueSummaryRowSerializer(serializers.Serializer):
+    """Serializer for a group of the revenue summary."""
+
+    period = serializers.DateField(required=False)
+    restaurant_id = serializers.UUIDField(required=False)
+    driver_id = serializers.UUIDField(required=False)
+    transaction_type = serializers.CharField(required=False)
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    revenues = serializers.IntegerField()
+
+
+class RevenueSummarySerializer(serializers.Serializer):
+    """Serializer for the revenue summary."""
+
+    start_date = serializers.DateField(allow_null=True)
+    end_date = serializers.DateField(allow_null=True)
+    total_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_revenues = serializers.IntegerField()
+    results = RevenueSummaryRowSerializer(many=True)
@@ -1,9 +1,32 @@
 """Services for Finances App."""
 
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDate, TruncMonth, TruncWeek, TruncYear
+from django.utils import timezone
 from rest_framework import serializers
 
+from apps.utilities.cache import bump_model_version
 from .choices import TransactionTypeChoices
 
+# Periods and dimensions the revenue summaries can be grouped by
+SUMMARY_PERIODS = {
+    "day": F("day"),
+    "week": TruncWeek("day"),
+    "month": TruncMonth("day"),
+    "year": TruncYear("day"),
+}
+SUMMARY_DIMENSIONS = {
+    "restaurant": "restaurant_id",
+    "driver": "driver_id",
+    "transaction_type": "transaction_type",
+}
+
 
 class RevenueService:
     """
@@ -40,3 +63,218 @@ class RevenueService:
 
         # Add more validations...
         return data
+
+    @staticmethod
+    def settle_deliveries(limit=1000):
+        """
+        Create the revenues of a batch of completed, unsettled deliveries.
+
+        Each delivery earns its driver `DRIVER_TAX_RATE` and charges its
+        restaurant `RESTAURANT_COMMISSION_RATE` of the order amount, dated
+        when it was delivered. Unsettled deliveries are read from a partial
+        index, their revenues inserted with one `bulk_create` and they are
+        marked with `settled_at`. A revenue is unique per order and type,
+        so settling an order twice (or from concurrent runs) is a no-op.
+        Returns the number of deliveries.
+        """
+        from apps.deliveries.models import Delivery
+        from .models import Revenue
+
+        deliveries = list(
+            Delivery.objects.filter(
+                is_completed=True,
+                settled_at__isnull=True,
+                delivered_at__isnull=False,
+            )
+            .order_by("delivered_at")
+            .values_list(
+                "pk",
+                "order_id",
+                "driver_id",
+                "order_id__restaurant_id",
+                "order_id__amount",
+                "delivered_at",
+            )[:limit]
+        )
+        if not deliveries:
+            return 0
+
+        driver_rate = Decimal(settings.DRIVER_TAX_RATE)
+        commission_rate = Decimal(settings.RESTAURANT_COMMISSION_RATE)
+        revenues = []
+        for _, order_id, driver_id, restaurant_id, amount, _ in deliveries:
+            if driver_id is not None:
+                revenues.append(
+                    Revenue(
+                        order_id_id=order_id,
+                        driver_id_id=driver_id,
+                        amount=round(amount * driver_rate, 2),
+                        transaction_type=TransactionTypeChoices.DELIVERY_EARNINGS,
+                    )
+                )
+            revenues.append(
+                Revenue(
+                    order_id_id=order_id,
+                    restaurant_id_id=restaurant_id,
+                    amount=round(amount * commission_rate, 2),
+                    transaction_type=TransactionTypeChoices.RESTAURANT_COMMISSION,
+                )
+            )
+
+        with transaction.atomic():
+            Revenue.objects.bulk_create(
+                revenues, batch_size=1000, ignore_conflicts=True
+            )
+            # `created_at` is set on insert, date the new revenues by delivery
+            Revenue.objects.filter(pk__in=[r.pk for r in revenues]).update(
+                created_at=Subquery(
+                    Delivery.objects.filter(order_id=OuterRef("order_id")).values(
+                        "delivered_at"
+                    )[:1]
+                )
+            )
+            Delivery.objects.filter(pk__in=[d[0] for d in deliveries]).update(
+                settled_at=timezone.now()
+            )
+        # Bulk inserts send no signals, apply their side effects once
+        bump_model_version(Revenue)
+        RevenueService.schedule_summary_refresh(
+            timezone.localdate(d[5]) for d in deliveries
+        )
+        return len(deliveries)
+
+    @staticmethod
+    def schedule_summary_refresh(days):
+        """Queue the refresh of the revenue summaries of each day, once."""
+        from .tasks import refresh_revenue_summary
+
+        for day in set(days):
+            refresh_revenue_summary.enqueue(
+                dedup_key=f"finances:summary:{day}",
+                day=day.isoformat(),
+            )
+
+    @staticmethod
+    def refresh_daily_summary(day):
+        """
+        Recompute the revenue summaries of a day from its revenues.
+
+        The day is replaced as a whole, its available revenues are summed
+        per restaurant, driver and transaction type in a single grouped
+        query. Only one process refreshes a day at a time, returns False
+        without changes if another one holds it. Run it outside of any
+        transaction, so the lock is held until the new rows are committed.
+        """
+        from .models import Revenue, RevenueDailySummary
+
+        lock_key = f"finances:summary:lock:{day}"
+        if not cache.add(lock_key, 1, settings.REVENUE_SUMMARY_LOCK_TIMEOUT):
+            return False
+        try:
+            start = datetime.combine(day, time.min, timezone.get_current_timezone())
+            rows = (
+                Revenue.objects.filter(
+                    is_available=True,
+                    created_at__gte=start,
+                    created_at__lt=start + timedelta(days=1),
+                )
+                .order_by()
+                .values("restaurant_id", "driver_id", "transaction_type")
+                .annotate(total=Sum("amount"), count=Count("id"))
+            )
+            with transaction.atomic():
+                RevenueDailySummary.objects.filter(day=day).delete()
+                RevenueDailySummary.objects.bulk_create(
+                    [
+                        RevenueDailySummary(
+                            day=day,
+                            restaurant_id_id=row["restaurant_id"],
+                            driver_id_id=row["driver_id"],
+                            transaction_type=row["transaction_type"],
+                            amount=row["total"],
+                            revenues=row["count"],
+                        )
+                        for row in rows.iterator()
+                    ],
+                    batch_size=1000,
+                )
+        finally:
+            cache.delete(lock_key)
+        return True
+
+    @staticmethod
+    def rebuild_summaries():
+        """
+        Recompute the summaries of every day with revenues or summaries.
+
+        Days being refreshed by a worker are queued again instead.
+        """
+        from .models import Revenue, RevenueDailySummary
+
+        days = set(
+            Revenue.objects.annotate(day=TruncDate("created_at"))
+            .order_by()
+            .values_list("day", flat=True)
+            .distinct()
+        )
+        days.update(
+            RevenueDailySummary.objects.order_by()
+            .values_list("day", flat=True)
+            .distinct()
+        )
+        busy = [day for day in days if not RevenueService.refresh_daily_summary(day)]
+        RevenueService.schedule_summary_refresh(busy)
+        return len(days) - len(busy)
+
+    @staticmethod
+    def get_summary(
+        start_date=None,
+        end_date=None,
+        period=None,
+        group_by=(),
+        restaurant_id=None,
+        driver_id=None,
+        transaction_type=None,
+    ):
+        """
+        Return the revenue totals within a date range from the summaries.
+
+        Rows are grouped by `period` (day, week, month or year) and the
+        `group_by` dimensions (restaurant, driver, transaction type), a
+        query over the daily summaries instead of the revenues table.
+        """
+        from .models import RevenueDailySummary
+
+        summaries = RevenueDailySummary.objects.all()
+        if start_date:
+            summaries = summaries.filter(day__gte=start_date)
+        if end_date:
+            summaries = summaries.filter(day__lte=end_date)
+        if restaurant_id:
+            summaries = summaries.filter(restaurant_id=restaurant_id)
+        if driver_id:
+            summaries = summaries.filter(driver_id=driver_id)
+        if transaction_type:
+            summaries = summaries.filter(transaction_type=transaction_type)
+
+        totals = summaries.aggregate(amount=Sum("amount"), revenues=Sum("revenues"))
+        keys = [SUMMARY_DIMENSIONS[dimension] for dimension in group_by]
+        if period:
+            summaries = summaries.annotate(period=SUMMARY_PERIODS[period])
+            keys.insert(0, "period")
+
+        results = []
+        if keys:
+            results = (
+                summaries.order_by()
+                .values(*keys)
+                .annotate(amount=Sum("amount"), revenues=Sum("revenues"))
+                .order_by(*keys)
+            )
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_amount": totals["amount"] or 0,
+            "total_revenues": totals["revenues"] or 0,
+            "results": results,
+        }
@@ -0,0 +1,27 @@
+"""Signals for Finances App."""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.utilities.cache import register_list_cache
+from .models import Revenue
+from .services import RevenueService
+
+
+register_list_cache(Revenue)
+
+
+@receiver(post_save, sender=Revenue)
+def refresh_summary_on_save(sender, instance, raw=False, **kwargs):
+    """Signal queue the refresh of the summaries of a saved revenue."""
+    if not raw:
+        RevenueService.schedule_summary_refresh(
+            [timezone.localdate(instance.created_at)]
+        )
+
+
+@receiver(post_delete, sender=Revenue)
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    """Signal queue the refresh of the summaries of a deleted revenue."""
+    RevenueService.schedule_summary_refresh([timezone.localdate(instance.created_at)])
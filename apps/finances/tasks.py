@@ -0,0 +1,22 @@
+"""Tasks for Finances App."""
+
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.tasks.registry import task
+from .services import RevenueService
+
+
+@task()
+def refresh_revenue_summary(day):
+    """Task recompute the revenue summaries of a day."""
+    day = date.fromisoformat(day)
+    if not RevenueService.refresh_daily_summary(day):
+        # Another worker is refreshing the day, run again once it is done
+        refresh_revenue_summary.enqueue(
+            dedup_key=f"finances:summary:{day}",
+            run_at=timezone.now() + timedelta(seconds=settings.TASK_RETRY_DELAY),
+            day=day.isoformat(),
+        )
@@ -1,18 +1,35 @@
 """ViewSets for Finances App."""
 
 from rest_framework.viewsets import ModelViewSet
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
 
-from apps.utilities.mixins import ListCacheMixin, LogicalDeleteMixin
-from apps.users.permissions import IsAdministrator
+from apps.utilities.mixins import (
+    ReplicaMixin,
+    ListCacheMixin,
+    ExportMixin,
+    LogicalDeleteMixin,
+)
+from apps.utilities.pagination import EstimatedKeysetPagination
+from apps.users.permissions import IsAdministrator, IsFinance
 from .models import Revenue
-from .serializers import RevenueReadSerializer, RevenueWriteSerializer
+from .services import RevenueService
+from .serializers import (
+    RevenueReadSerializer,
+    RevenueWriteSerializer,
+    RevenueSummaryFilterSerializer,
+    RevenueSummarySerializer,
+)
 from .filters import RevenueFilter
 from .schemas import revenue_schemas
 
 
 @extend_schema_view(**revenue_schemas)
-class RevenueViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
+class RevenueViewSet(
+    ReplicaMixin, ListCacheMixin, ExportMixin, LogicalDeleteMixin, ModelViewSet
+):
     """
     ViewSet for Revenue model.
 
@@ -23,12 +40,26 @@ class RevenueViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     - PUT /api/v1/revenues/{id}/
     - PATCH /api/v1/revenues/{id}/
     - DELETE /api/v1/revenues/{id}/
+    - GET /api/v1/revenues/export/
+    - GET /api/v1/revenues/summary/
     """
 
     permission_classes = [IsAdministrator]
     serializer_class = RevenueWriteSerializer
     search_fields = ["order_id", "driver_id", "restaurant_id"]
     filterset_class = RevenueFilter
+    pagination_class = EstimatedKeysetPagination
+    cache_scope = "user"
+    replica_actions = ["list", "retrieve", "export", "get_summary"]
+    export_fields = [
+        "id",
+        "order_id",
+        "driver_id",
+        "restaurant_id",
+        "amount",
+        "transaction_type",
+        "created_at",
+    ]
 
     def get_queryset(self):
         return Revenue.objects.get_available().select_related(
@@ -39,3 +70,28 @@ class RevenueViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
         if self.action in ["list", "retrieve"]:
             return RevenueReadSerializer
         return super().get_serializer_class()
+
+    def get_permissions(self):
+        if self.action in ["export", "get_summary"]:
+            return [IsFinance()]
+        return super().get_permissions()
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="summary",
+    )
+    def get_summary(self, request, *args, **kwargs):
+        """
+        Action returns the revenue totals grouped by period and dimension.
+
+        Endpoints:
+        - GET api/v1/revenues/summary/?start_date=&end_date=&period=&group_by=
+        """
+        serializer = RevenueSummaryFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        summary = RevenueService.get_summary(**serializer.validated_data)
+        return Response(
+            RevenueSummarySerializer(summary).data,
+            status=status.HTTP_200_OK,
+        )
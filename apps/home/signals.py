@@ -0,0 +1,7 @@
+"""Signals for Home App."""
+
+from apps.utilities.cache import register_list_cache
+from .models import Page, Keyword
+
+
+register_list_cache(Page, Keyword)
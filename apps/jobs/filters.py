@@ -3,6 +3,8 @@
 from django_filters import rest_framework as filters
 
 from apps.utilities.filters import BaseFilter
+from apps.locations.models import Country, State, City
+from apps.locations.filters import LocationNameFilter
 from .models import Worker, Applicant
 from .choices import ContractTypeChoices, WorkerStatusChoices, StatusChoices
 
@@ -15,19 +17,19 @@ class WorkerFilter(BaseFilter):
         lookup_expr="icontains",
         label="Filter by user (username), ex `/?user=randomuser`",
     )
-    city = filters.CharFilter(
-        field_name="city_id__name",
-        lookup_expr="icontains",
+    city = LocationNameFilter(
+        model=City,
+        field_name="city_id",
         label="Filter by city name, ex `/?city=New York`",
     )
-    state = filters.CharFilter(
-        field_name="state_id__name",
-        lookup_expr="icontains",
+    state = LocationNameFilter(
+        model=State,
+        field_name="state_id",
         label="Filter by city name, ex `/?state=California`",
     )
-    country = filters.CharFilter(
-        field_name="country_id__name",
-        lookup_expr="icontains",
+    country = LocationNameFilter(
+        model=Country,
+        field_name="country_id",
         label="Filter by country name, ex `/?country_name=USA`",
     )
     position = filters.CharFilter(
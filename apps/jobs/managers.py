@@ -33,9 +33,6 @@ class WorkerManager(BaseManager):
     def get_detail(self):
         return self.get_available().select_related(
             "user_id",
-            "city_id",
-            "state_id",
-            "country_id",
             "position_id",
         )
 
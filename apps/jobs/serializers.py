@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from apps.users.serializers import UserMinimalSerializer
+from apps.locations.models import Country, State, City
+from apps.locations.serializers import LocationNameField
 from .models import Position, Worker, Applicant
 
 
@@ -49,9 +51,9 @@ class WorkerReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Worker model (List/retrieve)."""
 
     user_id = UserMinimalSerializer()
-    city_id = serializers.StringRelatedField()
-    state_id = serializers.StringRelatedField()
-    country_id = serializers.StringRelatedField()
+    city_id = LocationNameField(model=City)
+    state_id = LocationNameField(model=State)
+    country_id = LocationNameField(model=Country)
     status = serializers.CharField(source="get_status_display")
     contract_type = serializers.CharField(source="get_contract_type_display")
 
@@ -0,0 +1,7 @@
+"""Signals for Jobs App."""
+
+from apps.utilities.cache import register_list_cache
+from .models import Position, Worker, Applicant
+
+
+register_list_cache(Position, Worker, Applicant)
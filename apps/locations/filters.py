@@ -0,0 +1,25 @@
+"""Filters for Locations App."""
+
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+
+from .snapshot import location_registry
+
+
+class LocationNameFilter(filters.CharFilter):
+    """
+    Filter a location foreign key by a part of its name.
+
+    Matching names are resolved to ids from the location snapshot, so the
+    query filters on the foreign key column without joining.
+    """
+
+    def __init__(self, model, *args, **kwargs):
+        self.location_model = model
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        ids = location_registry.search(self.location_model, value)
+        return self.get_method(qs)(**{f"{self.field_name}__in": ids})
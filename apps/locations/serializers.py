@@ -1,9 +1,31 @@
 """Serializers for Locations App."""
 
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import ModelSerializer, ReadOnlyField
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from .models import Country, State, City
+from .snapshot import location_registry
+
+
+class LocationNameField(ReadOnlyField):
+    """
+    Field to represent a location foreign key by its name.
+
+    Reads the raw `<field>_id` column and resolves the name from the
+    location snapshot, so no join or lookup is needed.
+    """
+
+    def __init__(self, model, **kwargs):
+        self.location_model = model
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        if self.source is None:
+            self.source = f"{field_name}_id"
+        super().bind(field_name, parent)
+
+    def to_representation(self, value):
+        return location_registry.get_name(self.location_model, value)
 
 
 class CountryReadSerializer(ReadOnlyFieldsMixin, ModelSerializer):
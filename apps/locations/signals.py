@@ -0,0 +1,26 @@
+"""Signals for Locations App."""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.utilities.cache import register_resource_cache
+from .models import Country, State, City
+from .snapshot import location_registry
+
+
+register_resource_cache(Country)
+register_resource_cache(State, dependencies=[Country])
+register_resource_cache(City, dependencies=[State])
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=State)
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=State)
+@receiver(post_delete, sender=City)
+def refresh_location_snapshot(sender, instance, **kwargs):
+    """
+    Signal to refresh the location snapshot of every process after a write.
+    """
+    location_registry.publish_on_commit()
@@ -0,0 +1,150 @@
+"""Reference data snapshot for Locations App."""
+
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class LocationSnapshot(NamedTuple):
+    """Immutable id and name indexes of every country, state and city."""
+
+    names: Mapping  # model label -> {id: name}
+    ids: Mapping  # model label -> {lowercase name: id}
+
+
+class LocationRegistry:
+    """
+    Per-process holder of the current `LocationSnapshot`.
+
+    The snapshot is built with one small query per table and replaced as a
+    whole, so readers never lock and never see a partial state. Writes to
+    the location tables publish a message on a Redis channel; every process
+    listens to it in a daemon thread and drops its snapshot, which is then
+    rebuilt on the next read.
+    """
+
+    def __init__(self, channel, retry_interval=5):
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._listener_pid = None
+
+    @staticmethod
+    def _models():
+        from .models import Country, State, City
+
+        return [Country, State, City]
+
+    def load(self):
+        """Build a fresh snapshot from the database."""
+        names = {}
+        ids = {}
+        for model in self._models():
+            rows = dict(model.objects.values_list("id", "name"))
+            label = model._meta.label_lower
+            names[label] = MappingProxyType(rows)
+            ids[label] = MappingProxyType(
+                {name.lower(): pk for pk, name in rows.items()}
+            )
+        snapshot = LocationSnapshot(MappingProxyType(names), MappingProxyType(ids))
+        self._snapshot = snapshot
+        return snapshot
+
+    def get(self):
+        """Return the current snapshot, loading it on first use."""
+        self._start_listener()
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot or self.load()
+        return snapshot
+
+    def warm(self):
+        """Load the snapshot at process startup, when the database is ready."""
+        try:
+            self.get()
+        except DatabaseError:
+            logger.warning("Location snapshot could not be loaded at startup.")
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def publish(self):
+        """Drop the local snapshot and notify every other process."""
+        self.invalidate()
+        connection = self._get_redis_connection()
+        if connection is not None:
+            connection.publish(self.channel, "invalidate")
+
+    def publish_on_commit(self):
+        transaction.on_commit(self.publish)
+
+    def get_name(self, model, pk):
+        """Return the name of a location, falling back to the database."""
+        if pk is None:
+            return None
+        name = self.get().names[model._meta.label_lower].get(pk)
+        if name is None:
+            # Created by another process whose message was not received yet
+            name = model.objects.filter(pk=pk).values_list("name", flat=True).first()
+            self.invalidate()
+        return name
+
+    def get_id(self, model, name):
+        """Return the id of a location by its exact name (case insensitive)."""
+        return self.get().ids[model._meta.label_lower].get(name.lower())
+
+    def search(self, model, term):
+        """Return the ids of the locations whose name contains `term`."""
+        term = term.lower()
+        ids = self.get().ids[model._meta.label_lower]
+        return [pk for name, pk in ids.items() if term in name]
+
+    def _get_redis_connection(self):
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            # Not a Redis cache backend, only the local snapshot is refreshed
+            return None
+
+    def _start_listener(self):
+        # Threads do not survive a fork, so each worker process starts its own
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._lock:
+            if self._listener_pid == pid:
+                return
+            self._listener_pid = pid
+            if self._get_redis_connection() is not None:
+                threading.Thread(target=self._listen, daemon=True).start()
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._get_redis_connection().pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(self.channel)
+                # Messages may have been missed while (re)connecting
+                self.invalidate()
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.invalidate()
+            except Exception:
+                logger.exception("Location snapshot listener disconnected.")
+                time.sleep(self.retry_interval)
+
+
+location_registry = LocationRegistry(channel=settings.LOCATION_SNAPSHOT_CHANNEL)
@@ -6,7 +6,6 @@ from drf_spectacular.utils import extend_schema_view
 
 from apps.users.permissions import IsAdministrator
 from apps.utilities.mixins import CacheMixin, LogicalDeleteMixin
-from apps.utilities.helpers import generate_cache_key
 from .models import Country, State, City
 from .serializers import (
     CountryReadSerializer,
@@ -55,9 +54,6 @@ class CountryViewSet(CacheMixin, LogicalDeleteMixin, ModelViewSet):
             return [AllowAny()]
         return super().get_permissions()
 
-    def get_cache_key(self, request, *args, **kwargs):
-        return generate_cache_key(request, prefix="country")
-
 
 @extend_schema_view(**state_schemas)
 class StateViewSet(CacheMixin, LogicalDeleteMixin, ModelViewSet):
@@ -94,9 +90,6 @@ class StateViewSet(CacheMixin, LogicalDeleteMixin, ModelViewSet):
             return [AllowAny()]
         return super().get_permissions()
 
-    def get_cache_key(self, request, *args, **kwargs):
-        return generate_cache_key(request, prefix="state")
-
 
 @extend_schema_view(**city_schemas)
 class CityViewSet(CacheMixin, LogicalDeleteMixin, ModelViewSet):
@@ -132,6 +125,3 @@ class CityViewSet(CacheMixin, LogicalDeleteMixin, ModelViewSet):
         if self.action in ["list", "retrieve"]:
             return [AllowAny()]
         return super().get_permissions()
-
-    def get_cache_key(self, request, *args, **kwargs):
-        return generate_cache_key(request, prefix="city")
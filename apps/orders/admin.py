@@ -4,6 +4,7 @@ from django.contrib import admin
 
 from apps.utilities.admin import BaseAdmin
 from .models import Order, OrderItem, OrderRating, OrderReport
+from .services import OrderService
 
 
 @admin.register(Order)
@@ -16,6 +17,12 @@ class OrderAdmin(BaseAdmin):
     list_editable = ["is_available"]
     readonly_fields = ["pk", "transaction", "amount", "created_at", "updated_at"]
     ordering = ["created_at"]
+    actions = BaseAdmin.actions + ["recalculate_amounts"]
+
+    @admin.action(description="Recalculate amounts of selected orders")
+    def recalculate_amounts(self, request, queryset):
+        """Action to recompute amount and validity from the order items."""
+        OrderService.recalculate_amounts(queryset)
 
 
 @admin.register(OrderItem)
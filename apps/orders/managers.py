@@ -1,6 +1,9 @@
 """Managers for Orders App."""
 
+from django.db.models import Exists, OuterRef
+
 from apps.utilities.managers import BaseManager
+from .choices import OrderStatusChoices
 
 
 class OrderManager(BaseManager):
@@ -31,9 +34,6 @@ class OrderManager(BaseManager):
             .filter(user_id=user)
             .select_related(
                 "user_id",
-                "city_id",
-                "state_id",
-                "country_id",
                 "restaurant_id",
             )
         )
@@ -41,6 +41,28 @@ class OrderManager(BaseManager):
     def get_by_status(self, status):
         return self.get_available().filter(status=status)
 
+    def get_awaiting_driver(self):
+        """Return paid, undelivered orders without an active driver assignment."""
+        from apps.drivers.models import DriverAssignment
+
+        return (
+            self.get_available()
+            .filter(is_payment=True)
+            .exclude(
+                status__in=[
+                    OrderStatusChoices.DELIVERED,
+                    OrderStatusChoices.CANCELLED,
+                ]
+            )
+            .exclude(
+                Exists(
+                    DriverAssignment.objects.get_active().filter(
+                        order_id=OuterRef("pk")
+                    )
+                )
+            )
+        )
+
 
 class OrderItemManager(BaseManager):
     """Manager for OrderItem Model."""
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0001_initial'),
+        ('orders', '0009_remove_historicalorder_zip_code_and_more'),
+        ('restaurants', '0004_historicalrestaurant_latitude_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user_id', 'created_at', 'id'], name='orders_orde_user_id_245e33_idx'),
+        ),
+    ]
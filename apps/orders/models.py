@@ -1,6 +1,6 @@
 """Models for Orders App."""
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator, MinValueValidator
 from simple_history.models import HistoricalRecords
@@ -64,18 +64,24 @@ class Order(BaseModel):
         indexes = [
             # Composite indexes
             models.Index(fields=["is_payment", "is_valid"]),
+            models.Index(fields=["user_id", "created_at", "id"]),
         ]
 
     def __str__(self):
         return str(f"{self.shipping_name} - {self.transaction}")
 
     def save(self, *args, **kwargs):
-        from .services import OrderService
-
         # OrderService.generate_transaction_field(self)
         # ! TODO: Remove transaction service
-        OrderService.calculate_amount(self)
-        OrderService.validate_order(self)
+
+        # `amount` and `is_valid` are maintained in the database by the
+        # OrderItem deltas, never overwrite them with in-memory values
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ["amount", "is_valid"]
+            ]
         super().save(*args, **kwargs)
 
 
@@ -108,11 +114,26 @@ class OrderItem(BaseModel):
     def __str__(self):
         return f"{self.order_id} - {self.food_id}"
 
+    @property
+    def subtotal(self):
+        return self.price * self.quantity
+
     def save(self, *args, **kwargs):
-        from .services import OrderItemService
+        from .services import OrderService, OrderItemService
 
         OrderItemService.set_price(self)
-        super(OrderItem, self).save(*args, **kwargs)
+        with transaction.atomic():
+            previous_order_id, previous_subtotal = (
+                OrderItemService.get_stored_subtotal(self)
+            )
+            super(OrderItem, self).save(*args, **kwargs)
+            if previous_order_id not in (None, self.order_id_id):
+                # Moved to another order, take it out of the previous one
+                OrderService.apply_amount_delta(previous_order_id, -previous_subtotal)
+                previous_subtotal = 0
+            OrderService.apply_amount_delta(
+                self.order_id_id, self.subtotal - previous_subtotal
+            )
 
 
 class OrderRating(BaseModel):
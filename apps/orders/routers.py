@@ -5,6 +5,7 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested.routers import NestedSimpleRouter
 
+from .views import OrderAcceptView, OrderPickedUpView, OrderDeliveredView
 from .viewsets import OrderViewSet, OrderItemViewSet
 
 router = DefaultRouter()
@@ -14,6 +15,21 @@ orders_router = NestedSimpleRouter(router, r"orders", lookup="order")
 orders_router.register(r"items", OrderItemViewSet, basename="order-items")
 
 urlpatterns = [
+    path(
+        "api/v1/orders/<uuid:pk>/accept/",
+        OrderAcceptView.as_view(),
+        name="order-accept",
+    ),
+    path(
+        "api/v1/orders/<uuid:pk>/picked_up/",
+        OrderPickedUpView.as_view(),
+        name="order-picked-up",
+    ),
+    path(
+        "api/v1/orders/<uuid:pk>/delivered/",
+        OrderDeliveredView.as_view(),
+        name="order-delivered",
+    ),
     path("api/v1/", include(router.urls)),
     path("api/v1/", include(orders_router.urls)),
 ]
@@ -2,11 +2,14 @@
 
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from apps.utilities.idempotency import idempotency_key_parameter
+from apps.utilities.exports import export_format_parameter, export_responses
 from apps.deliveries.serializers import SignatureSerializer, FailedDeliverySerializer
 from .serializers import (
     OrderReadSerializer,
     OrderWriteSerializer,
     OrderMinimalSerializer,
+    OrderCartWriteSerializer,
     OrderRatingWriteSerializer,
     OrderItemReadSerializer,
     OrderItemWriteSerializer,
@@ -84,6 +87,18 @@ order_schemas = {
         },
         tags=["orders"],
     ),
+    "create_cart": extend_schema(
+        summary="Create a Order with its Items",
+        description="Create a new order and all its items in a single request, only for `IsClient` users.",
+        request=OrderCartWriteSerializer,
+        responses={
+            201: OpenApiResponse(OrderReadSerializer, description="Created"),
+            400: OpenApiResponse(description="Bad request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+        },
+        tags=["orders"],
+    ),
     "report_order": extend_schema(
         summary="Report an Order",
         description="Allows drivers to report an order by its ID. The request should include necessary details for the report, only for `IsClient` or `IsAdministrator` users.",
@@ -101,7 +116,7 @@ order_schemas = {
     ),
     "assign_driver": extend_schema(
         summary="Assign a Driver to an Order",
-        description="Assigns an available driver to an order. Only available drivers who are verified and active will be considered. If no drivers are available, an error will be returned, only for `IsDispatcher` or `IsAdministrator` users.",
+        description="Assigns the nearest available driver to the order's restaurant. Only available drivers who are verified, active and have reported a location will be considered. If no drivers are available, an error will be returned, only for `IsDispatcher` or `IsAdministrator` users.",
         request=None,
         responses={
             200: OpenApiResponse(
@@ -116,19 +131,17 @@ order_schemas = {
         },
         tags=["orders"],
     ),
-    "accept_order": extend_schema(
-        summary="Accept an Order Assignment",
-        description="Marks a specific order assignment as accepted by a driver. The driver must have a pending assignment for the order. If no such assignment exists, an error is returned. only for `IsDriver` or `IsAdministrator` users.",
+    "dispatch_orders": extend_schema(
+        summary="Dispatch Orders in Batch",
+        description="Assigns drivers to every paid, undelivered order without an active assignment in a single batch, solving one global order-to-driver matching by distance to the restaurant, only for `IsDispatcher` or `IsAdministrator` users.",
         request=None,
         responses={
-            200: OpenApiResponse(description="The order `order.id` was accepted."),
-            400: OpenApiResponse(
-                description="No pending assignment found for this driver."
+            200: OpenApiResponse(
+                description="`n` orders assigned, `m` left pending."
             ),
             401: OpenApiResponse(description="Unauthorized"),
             403: OpenApiResponse(description="Forbidden"),
-            404: OpenApiResponse(description="Not Found"),
-            500: OpenApiResponse(description="Internal Server Error"),
+            404: OpenApiResponse(description="No drivers available or active."),
         },
         tags=["orders"],
     ),
@@ -146,42 +159,6 @@ order_schemas = {
         },
         tags=["orders"],
     ),
-    "picked_up_order": extend_schema(
-        summary="Mark Order as Picked Up",
-        description="Marks a specific order assignment as rejected by a driver. The driver must have an assignment for the order. If the assignment does not exist or cannot be updated, an error is returned. only for `IsDriver` or `IsAdministrator` users.",
-        request=None,
-        responses={
-            200: OpenApiResponse(
-                description="Delivery status was changed to 'Picked Up'."
-            ),
-            400: OpenApiResponse(
-                description="Delivery with status pending cannot be marked."
-            ),
-            401: OpenApiResponse(description="Unauthorized"),
-            403: OpenApiResponse(description="Forbidden"),
-            404: OpenApiResponse(description="Not Found"),
-            409: OpenApiResponse(
-                description="Delivery has already been marked as 'Picked Up'."
-            ),
-        },
-        tags=["orders"],
-    ),
-    "delivered_order": extend_schema(
-        summary="Mark Order as Delivered",
-        description="Marks a delivery status as `Delivered`. The delivery must have been marked as `Picked Up` before it can be marked as `Delivered`. A valid signature is required to complete the delivery, the request must be sent with `Content-Type: multipart/form-data`. only for `IsDriver` or `IsAdministrator` users.",
-        request=SignatureSerializer,
-        responses={
-            200: OpenApiResponse(description="Order successfully delivered."),
-            400: OpenApiResponse(description="Bad Request"),
-            401: OpenApiResponse(description="Unauthorized"),
-            403: OpenApiResponse(description="Forbidden"),
-            404: OpenApiResponse(description="Not Found"),
-            409: OpenApiResponse(
-                description="The status could not be changed, please try again."
-            ),
-        },
-        tags=["orders"],
-    ),
     "failed_order": extend_schema(
         summary="Mark Order as Failed",
         description="Marks a delivery status as 'Failed'. The delivery must have been either 'Assigned' or 'Picked Up' before it can be marked as 'Failed'. A reason for failure is required. only for `IsDriver` or `IsAdministrator` users.",
@@ -211,6 +188,19 @@ order_schemas = {
         },
         tags=["orders"],
     ),
+    "export": extend_schema(
+        summary="Export Orders",
+        description="Download all the orders matching the list filters as a CSV or NDJSON file, streamed while it is read, only for `IsFinance` or `IsAdministrator` users.",
+        parameters=[export_format_parameter],
+        filters=True,
+        responses={
+            **export_responses,
+            400: OpenApiResponse(description="Bad request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+        },
+        tags=["orders"],
+    ),
 }
 
 
@@ -288,3 +278,70 @@ order_item_schemas = {
         tags=["orders"],
     ),
 }
+
+
+accept_order_schemas = {
+    "patch": extend_schema(
+        summary="Accept an Order Assignment",
+        description="Marks a specific order assignment as accepted by a driver. The driver must have a pending assignment for the order. If no such assignment exists, an error is returned. only for `IsDriver` or `IsAdministrator` users.",
+        request=None,
+        parameters=[idempotency_key_parameter],
+        responses={
+            200: OpenApiResponse(description="The order `order.id` was accepted."),
+            400: OpenApiResponse(
+                description="No pending assignment found for this driver."
+            ),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Not Found"),
+            500: OpenApiResponse(description="Internal Server Error"),
+        },
+        tags=["orders"],
+    ),
+}
+
+
+picked_up_order_schemas = {
+    "patch": extend_schema(
+        summary="Mark Order as Picked Up",
+        description="Marks a specific order assignment as rejected by a driver. The driver must have an assignment for the order. If the assignment does not exist or cannot be updated, an error is returned. only for `IsDriver` or `IsAdministrator` users.",
+        request=None,
+        parameters=[idempotency_key_parameter],
+        responses={
+            200: OpenApiResponse(
+                description="Delivery status was changed to 'Picked Up'."
+            ),
+            400: OpenApiResponse(
+                description="Delivery with status pending cannot be marked."
+            ),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Not Found"),
+            409: OpenApiResponse(
+                description="Delivery has already been marked as 'Picked Up'."
+            ),
+        },
+        tags=["orders"],
+    ),
+}
+
+
+delivered_order_schemas = {
+    "post": extend_schema(
+        summary="Mark Order as Delivered",
+        description="Marks a delivery status as `Delivered`. The delivery must have been marked as `Picked Up` before it can be marked as `Delivered`. A valid signature is required to complete the delivery, the request must be sent with `Content-Type: multipart/form-data`. only for `IsDriver` or `IsAdministrator` users.",
+        request=SignatureSerializer,
+        parameters=[idempotency_key_parameter],
+        responses={
+            200: OpenApiResponse(description="Order successfully delivered."),
+            400: OpenApiResponse(description="Bad Request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Not Found"),
+            409: OpenApiResponse(
+                description="The status could not be changed, please try again."
+            ),
+        },
+        tags=["orders"],
+    ),
+}
@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
 from apps.users.serializers import UserMinimalSerializer
+from apps.locations.models import Country, State, City
+from apps.locations.serializers import LocationNameField
 from apps.restaurants.serializers import (
     RestaurantMinimalSerializer,
     FoodMinimalSerializer,
@@ -16,9 +18,9 @@ class OrderReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Order model (List/retrieve)."""
 
     user_id = UserMinimalSerializer()
-    city_id = serializers.StringRelatedField()
-    state_id = serializers.StringRelatedField()
-    country_id = serializers.StringRelatedField()
+    city_id = LocationNameField(model=City)
+    state_id = LocationNameField(model=State)
+    country_id = LocationNameField(model=Country)
     restaurant_id = RestaurantMinimalSerializer()
     status = serializers.CharField(source="get_status_display")
     payment_method = serializers.CharField(source="get_payment_method_display")
@@ -66,6 +68,31 @@ class OrderWriteSerializer(serializers.ModelSerializer):
         ]
 
 
+class OrderCartItemSerializer(serializers.Serializer):
+    """Serializer for a single item of a cart submission."""
+
+    food_id = serializers.UUIDField()
+    quantity = serializers.IntegerField(min_value=1)
+
+    def validate_quantity(self, value):
+        return OrderItemService.validate_quantity(value)
+
+
+class OrderCartWriteSerializer(OrderWriteSerializer):
+    """Serializer for Order model with all its items (Create)."""
+
+    items = OrderCartItemSerializer(many=True, allow_empty=False)
+
+    class Meta(OrderWriteSerializer.Meta):
+        fields = OrderWriteSerializer.Meta.fields + ["items"]
+
+    def validate_items(self, value):
+        food_ids = [item["food_id"] for item in value]
+        if len(food_ids) != len(set(food_ids)):
+            raise serializers.ValidationError("Each food can only appear once.")
+        return value
+
+
 class OrderMinimalSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Order model (Minimal)."""
 
@@ -1,9 +1,18 @@
 """Services for Orders App."""
 
+from datetime import timedelta
+from decimal import Decimal
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum, Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 
+from apps.utilities.cache import bump_queryset_version
+
 
 class OrderService:
     """
@@ -17,40 +26,113 @@ class OrderService:
             order.transaction = f"trans-{order.pk}"
 
     @staticmethod
-    def calculate_amount(order):
-        """Calculate the total amount of the order based on quantity * price."""
-        from .models import OrderItem
+    def apply_amount_delta(order_id, delta):
+        """
+        Adjust the stored amount of an order by `delta` in a single UPDATE.
 
-        order_items = OrderItem.objects.filter(order_id=order.id)
-        total = sum(item.price * item.quantity for item in order_items)
-        order.amount = total
-        return order
+        The increment is applied with `F()` so concurrent item changes never
+        overwrite each other, and `is_valid` is refreshed in the same
+        statement from the existence of order items.
+        """
+        from .models import Order, OrderItem
+
+        Order.objects.filter(pk=order_id).update(
+            amount=F("amount") + delta,
+            is_valid=Exists(OrderItem.objects.filter(order_id=OuterRef("pk"))),
+            updated_at=timezone.now(),
+        )
 
     @staticmethod
-    def validate_order(order):
-        """Validate the order by checking if it has associated order items."""
+    def recalculate_amounts(orders):
+        """
+        Recompute and store `amount` and `is_valid` for a queryset of orders.
+
+        Issues one UPDATE with correlated aggregates, meant for repairs when
+        a full recompute is really needed.
+        """
         from .models import OrderItem
 
-        if OrderItem.objects.filter(order_id=order.id).exists():
-            order.is_valid = True
-        else:
-            order.is_valid = False
+        items = OrderItem.objects.filter(order_id=OuterRef("pk"))
+        total = (
+            items.order_by()
+            .values("order_id")
+            .annotate(total=Sum(F("price") * F("quantity")))
+            .values("total")
+        )
+        updated = orders.update(
+            amount=Coalesce(Subquery(total), Value(Decimal(0))),
+            is_valid=Exists(items),
+            updated_at=timezone.now(),
+        )
+        bump_queryset_version(orders)
+        return updated
+
+    @staticmethod
+    def create_order_with_items(user, order_data, items):
+        """
+        Create an order together with all its items in one transaction.
+
+        Foods are priced with a single `in_bulk` query, the total is computed
+        once and stored with the order, and the items are inserted with
+        `bulk_create`, so the per-item saves and amount deltas are skipped.
+        """
+        from apps.restaurants.models import Food
+        from .models import Order, OrderItem
+
+        restaurant = order_data["restaurant_id"]
+        foods = Food.objects.filter(
+            restaurant_id=restaurant, is_available=True
+        ).in_bulk([item["food_id"] for item in items])
+
+        missing = [str(item["food_id"]) for item in items if item["food_id"] not in foods]
+        if missing:
+            raise ValidationError(
+                {"items": f"Foods not available in this restaurant: {', '.join(missing)}."}
+            )
+        unpriced = [str(pk) for pk, food in foods.items() if not food.sale_price]
+        if unpriced:
+            raise ValidationError(
+                {"items": f"Sale price are not defined for foods: {', '.join(unpriced)}."}
+            )
+
+        amount = sum(
+            foods[item["food_id"]].sale_price * item["quantity"] for item in items
+        )
+        with transaction.atomic():
+            order = Order.objects.create(
+                user_id=user, amount=amount, is_valid=True, **order_data
+            )
+            OrderItem.objects.bulk_create(
+                [
+                    OrderItem(
+                        order_id=order,
+                        food_id=foods[item["food_id"]],
+                        quantity=item["quantity"],
+                        price=foods[item["food_id"]].sale_price,
+                    )
+                    for item in items
+                ]
+            )
+        return order
 
     @staticmethod
-    def accept_order(order, driver):
-        """Accept an order assignment and create a delivery entry."""
+    async def aaccept_order(order, driver):
+        """Accept an order assignment and assign the delivery to the driver."""
         from apps.drivers.models import DriverAssignment
         from apps.drivers.choices import AssignmentStatusChoices
         from apps.deliveries.models import Delivery
         from apps.deliveries.choices import StatusChoices
 
         try:
-            # Find a pending assignment for the driver
-            assignment = DriverAssignment.objects.filter(
+            # Find the pending, unexpired assignment of the order for the driver
+            assignment = await DriverAssignment.objects.filter(
                 is_available=True,
                 driver_id=driver,
+                order_id=order,
                 status=AssignmentStatusChoices.PENDING,
-            ).first()
+                created_at__gte=timezone.now()
+                - timedelta(seconds=settings.DRIVER_OFFER_TIMEOUT),
+            ).afirst()
 
             if not assignment:
                 return {
@@ -62,13 +144,12 @@ class OrderService:
             # Update the assignment status
             assignment.status = AssignmentStatusChoices.ACCEPTED
             assignment.is_available = False
-            assignment.save()
+            await assignment.asave()
 
-            # Create a delivery entry
-            Delivery.objects.create(
+            # The delivery entry may already exist since the order was paid
+            await Delivery.objects.aupdate_or_create(
                 order_id=order,
-                driver_id=driver,
-                status=StatusChoices.ASSIGNED,
+                defaults={"driver_id": driver, "status": StatusChoices.ASSIGNED},
             )
 
             return {
@@ -149,6 +230,29 @@ class OrderItemService:
                 code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @staticmethod
+    def get_stored_subtotal(order_item):
+        """
+        Return the order and subtotal currently stored for an item, locking
+        its row.
+
+        Returns `(None, 0)` for items that have not been saved yet.
+        """
+        from .models import OrderItem
+
+        if order_item._state.adding:
+            return None, Decimal(0)
+        stored = (
+            OrderItem.objects.select_for_update()
+            .filter(pk=order_item.pk)
+            .values_list("order_id", "price", "quantity")
+            .first()
+        )
+        if stored is None:
+            return None, Decimal(0)
+        order_id, price, quantity = stored
+        return order_id, price * quantity
+
     @staticmethod
     def validate_quantity(quantity):
         """Validate the quantity of an OrderItem."""
@@ -1,19 +1,26 @@
 """Signals for Order App."""
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 
-from .models import OrderItem
+from apps.utilities.cache import register_cache_owner
+from .models import Order, OrderItem
 
 
-@receiver(post_save, sender=OrderItem)
-def update_order_amount(sender, instance, created, **kwargs):
+register_cache_owner(Order, lambda order: [order.user_id_id])
+register_cache_owner(
+    OrderItem,
+    lambda item: Order.objects.filter(pk=item.order_id_id).values_list(
+        "user_id", flat=True
+    ),
+)
+
+
+@receiver(post_delete, sender=OrderItem)
+def update_order_amount(sender, instance, **kwargs):
     """
-    Signal to update the save method in Order model whenever an OrderItem is saved.
+    Signal to subtract a deleted OrderItem from the amount of its order.
     """
     from .services import OrderService
 
-    order = instance.order_id
-    if created:
-        OrderService.calculate_amount(order)
-        order.save()
+    OrderService.apply_amount_delta(instance.order_id_id, -instance.subtotal)
@@ -0,0 +1,90 @@
+"""Views for Orders App."""
+
+from django.shortcuts import aget_object_or_404
+from adrf.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from drf_spectacular.utils import extend_schema_view
+
+from apps.users.permissions import IsDriver
+from apps.utilities.helpers import generate_response
+from apps.utilities.idempotency import idempotent
+from apps.drivers.models import Driver
+from apps.deliveries.services import DeliveryService
+from apps.deliveries.serializers import SignatureSerializer
+from .models import Order
+from .services import OrderService
+from .schemas import (
+    accept_order_schemas,
+    picked_up_order_schemas,
+    delivered_order_schemas,
+)
+
+
+class OrderDriverView(APIView):
+    """
+    Base view for the async order actions of a driver.
+
+    The order is looked up among all available orders; whether the driver
+    may act on it is checked against its assignment or delivery.
+    """
+
+    permission_classes = [IsDriver]
+
+    async def get_order_and_driver(self, request, pk):
+        order = await aget_object_or_404(Order.objects.get_available(), pk=pk)
+        driver = await aget_object_or_404(Driver, user_id=request.user)
+        return order, driver
+
+
+@extend_schema_view(**accept_order_schemas)
+class OrderAcceptView(OrderDriverView):
+    """
+    View to mark a specific order assignment as accepted.
+
+    Endpoints:
+    - PATCH api/v1/orders/{id}/accept/
+    """
+
+    @idempotent
+    async def patch(self, request, pk, *args, **kwargs):
+        order, driver = await self.get_order_and_driver(request, pk)
+        result = await OrderService.aaccept_order(order, driver)
+        return generate_response(result)
+
+
+@extend_schema_view(**picked_up_order_schemas)
+class OrderPickedUpView(OrderDriverView):
+    """
+    View to mark a delivery status to pickup.
+
+    Endpoints:
+    - PATCH api/v1/orders/{id}/picked_up/
+    """
+
+    @idempotent
+    async def patch(self, request, pk, *args, **kwargs):
+        order, driver = await self.get_order_and_driver(request, pk)
+        result = await DeliveryService.amark_as_picked_up(order, driver)
+        return generate_response(result)
+
+
+@extend_schema_view(**delivered_order_schemas)
+class OrderDeliveredView(OrderDriverView):
+    """
+    View to mark a delivery status to delivered.
+
+    Endpoints:
+    - POST api/v1/orders/{id}/delivered/
+    """
+
+    @idempotent
+    async def post(self, request, pk, *args, **kwargs):
+        serializer = SignatureSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        order, driver = await self.get_order_and_driver(request, pk)
+        signature = serializer.validated_data["signature"]
+        result = await DeliveryService.amark_as_delivered(order, driver, signature)
+        return generate_response(result)
@@ -8,20 +8,29 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
 
-from apps.users.permissions import IsOwner, IsClient, IsDriver, IsDispatcher
-from apps.utilities.mixins import ListCacheMixin, LogicalDeleteMixin
+from apps.users.permissions import (
+    IsOwner,
+    IsClient,
+    IsDriver,
+    IsDispatcher,
+    IsFinance,
+)
+from apps.utilities.mixins import ListCacheMixin, ExportMixin, LogicalDeleteMixin
+from apps.utilities.pagination import KeysetPagination
 from apps.utilities.helpers import generate_response
 from apps.drivers.services import DriverService
 from apps.deliveries.services import DeliveryService
 from apps.deliveries.models import Delivery
-from apps.deliveries.serializers import FailedDeliverySerializer, SignatureSerializer
+from apps.deliveries.serializers import FailedDeliverySerializer
 from apps.deliveries.choices import StatusChoices
+from apps.restaurants.models import Restaurant
 from .models import Order, OrderItem, OrderReport
 from .services import OrderService
 from .serializers import (
     OrderReadSerializer,
     OrderWriteSerializer,
     OrderMinimalSerializer,
+    OrderCartWriteSerializer,
     OrderItemReadSerializer,
     OrderItemWriteSerializer,
     OrderReportWriteSerializer,
@@ -32,7 +41,7 @@ from .schemas import order_schemas, order_item_schemas
 
 
 @extend_schema_view(**order_schemas)
-class OrderViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
+class OrderViewSet(ListCacheMixin, ExportMixin, LogicalDeleteMixin, ModelViewSet):
     """
     ViewSet for managing Order instances.
 
@@ -43,18 +52,39 @@ class OrderViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     - PUT /api/v1/orders/{id}/
     - PATCH /api/v1/orders/{id}/
     - DELETE /api/v1/orders/{id}/
+    - GET /api/v1/orders/export/
     """
 
     permission_classes = [IsClient, IsOwner]
     serializer_class = OrderWriteSerializer
     search_fields = ["transaction", "shipping_name"]
     filterset_class = OrderFilter
+    pagination_class = KeysetPagination
+    cache_scope = "user"
+    cache_dependencies = [Restaurant]
+    cache_user_dependencies = [Order, OrderItem]
+    export_fields = [
+        "id",
+        "transaction",
+        "user_id",
+        "restaurant_id",
+        "amount",
+        "status",
+        "payment_method",
+        "is_payment",
+        "is_valid",
+        "created_at",
+        "updated_at",
+    ]
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Order.objects.none()
 
         user = self.request.user
+        if self.action == "export":
+            # Finance exports the orders of every user
+            return Order.objects.get_available()
         if self.action == "list":
             return Order.objects.get_list_by_user(user)
         return Order.objects.get_detail_by_user(user)
@@ -66,9 +96,38 @@ class OrderViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
             return OrderReadSerializer
         return super().get_serializer_class()
 
+    def get_permissions(self):
+        if self.action == "export":
+            return [IsFinance()]
+        return super().get_permissions()
+
     def perform_create(self, serializer):
         serializer.save(user_id=self.request.user)
 
+    @action(
+        methods=["post"],
+        detail=False,
+        url_path="cart",
+        permission_classes=[IsClient],
+    )
+    def create_cart(self, request, *args, **kwargs):
+        """
+        Action to create an order with all its items in a single request.
+
+        Endpoints:
+        - POST api/v1/orders/cart/
+        """
+        serializer = OrderCartWriteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data.pop("items")
+        order = OrderService.create_order_with_items(
+            request.user, serializer.validated_data, items
+        )
+        return Response(
+            OrderReadSerializer(order).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(
         methods=["post"],
         detail=True,
@@ -117,21 +176,19 @@ class OrderViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
         return generate_response(result)
 
     @action(
-        methods=["patch"],
-        detail=True,
-        url_path="accept",
-        permission_classes=[IsDriver],
+        methods=["post"],
+        detail=False,
+        url_path="dispatch",
+        permission_classes=[IsDispatcher],
     )
-    def accept_order(self, request, *args, **kwargs):
+    def dispatch_orders(self, request, *args, **kwargs):
         """
-        Action to mark a specific order assignment as accepted.
+        Action assign drivers to all orders awaiting one in a single batch.
 
         Endpoints:
-        - POST api/v1/orders/{id}/accept/
+        - POST api/v1/orders/dispatch/
         """
-        order = self.get_object()
-        driver = request.user.driver
-        result = OrderService.accept_order(order, driver)
+        result = DriverService.dispatch_pending_orders()
         return generate_response(result)
 
     @action(
@@ -152,47 +209,6 @@ class OrderViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
         result = OrderService.reject_order(order, driver)
         return generate_response(result)
 
-    @action(
-        methods=["patch"],
-        detail=True,
-        url_path="picked_up",
-        permission_classes=[IsDriver],
-    )
-    def picked_up_order(self, request, *args, **kwargs):
-        """
-        Action to mark a delivery status to pickup.
-
-        Endpoints:
-        - PATCH api/v1/orders/{id}/picked_up/
-        """
-        order = self.get_object()
-        driver = request.user.driver
-        result = DeliveryService.mark_as_picked_up(order, driver)
-        return generate_response(result)
-
-    @action(
-        methods=["post"],
-        detail=True,
-        url_path="delivered",
-        permission_classes=[IsDriver],
-    )
-    def delivered_order(self, request, *args, **kwargs):
-        """
-        Action to mark a delivery status to delivered.
-
-        Endpoints:
-        - POST api/v1/orders/{id}/delivered/
-        """
-        order = self.get_object()
-        driver = request.user.driver
-
-        serializer = SignatureSerializer(data=request.data)
-        if serializer.is_valid():
-            signature = serializer.validated_data["signature"]
-            result = DeliveryService.mark_as_delivered(order, driver, signature)
-            return generate_response(result)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
     @action(
         methods=["post"],
         detail=True,
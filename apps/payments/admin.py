@@ -0,0 +1,17 @@
+"""Admin for Payments App."""
+
+from django.contrib import admin
+
+from apps.utilities.admin import BaseAdmin
+from .models import Payment
+
+
+@admin.register(Payment)
+class PaymentAdmin(BaseAdmin):
+    """Admin for Payment model."""
+
+    search_fields = ["order_id", "gateway_id"]
+    list_display = ["order_id", "amount", "status", "created_at", "processed_at"]
+    list_filter = ["status"]
+    readonly_fields = ["pk", "payload", "created_at", "updated_at"]
+    ordering = ["-created_at"]
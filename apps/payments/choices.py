@@ -9,3 +9,12 @@ class PaymentMethodChoices(models.TextChoices):
     BANK_TRANSFER = "bank transfer", "Bank Transfer"
     CREDIT_CARD = "credit card", "Credit Card"
     DEBIT_CARD = "debit card", "Debit Card"
+
+
+class PaymentStatusChoices(models.TextChoices):
+
+    PENDING = "pending", "Pending"
+    PROCESSING = "processing", "Processing"
+    APPROVED = "approved", "Approved"
+    REJECTED = "rejected", "Rejected"
+    FAILED = "failed", "Failed"
@@ -0,0 +1,85 @@
+"""Gateways for Payments App."""
+
+import asyncio
+import time
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+
+class MercadoPagoGateway:
+    """Payment gateway backed by the MercadoPago SDK."""
+
+    def __init__(self, access_token):
+        # https://github.com/mercadopago/sdk-python
+        import mercadopago
+        from mercadopago.config import RequestOptions
+
+        self.sdk = mercadopago.SDK(access_token)
+        self.request_options_class = RequestOptions
+
+    def create_payment(self, payment_data, idempotency_key):
+        """Create a payment, safe to retry with the same idempotency key."""
+        request_options = self.request_options_class(
+            custom_headers={"x-idempotency-key": idempotency_key}
+        )
+        return self.sdk.payment().create(payment_data, request_options)["response"]
+
+    def get_payment(self, gateway_id):
+        return self.sdk.payment().get(gateway_id)["response"]
+
+    async def aget_payment(self, gateway_id):
+        # The SDK is blocking, run it off the event loop without serializing
+        return await sync_to_async(self.get_payment, thread_sensitive=False)(
+            gateway_id
+        )
+
+
+class FakeGateway:
+    """
+    Local stand-in for the payment gateway, used for development and load tests.
+
+    Waits `latency` seconds to mimic the gateway round trip, rejects card
+    tokens starting with "reject" and approves everything else. Payments
+    are kept in the cache so webhooks can be replayed from any process.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def create_payment(self, payment_data, idempotency_key):
+        cache_key = f"fake_gateway:idempotency:{idempotency_key}"
+        payment = cache.get(cache_key)
+        if payment is not None:
+            return payment
+
+        time.sleep(self.latency)
+        token = str(payment_data.get("token") or "")
+        payment = {
+            "id": uuid.uuid4().int % 10**10,
+            "status": "rejected" if token.startswith("reject") else "approved",
+            "status_detail": "fake",
+            "external_reference": payment_data.get("external_reference"),
+            "transaction_amount": payment_data.get("transaction_amount"),
+        }
+        cache.set(cache_key, payment, timeout=60 * 60 * 24)
+        cache.set(f"fake_gateway:payment:{payment['id']}", payment, timeout=60 * 60 * 24)
+        return payment
+
+    def get_payment(self, gateway_id):
+        time.sleep(self.latency)
+        return cache.get(f"fake_gateway:payment:{gateway_id}") or {"status": "not_found"}
+
+    async def aget_payment(self, gateway_id):
+        await asyncio.sleep(self.latency)
+        payment = await cache.aget(f"fake_gateway:payment:{gateway_id}")
+        return payment or {"status": "not_found"}
+
+
+def get_gateway():
+    """Return the payment gateway configured in `PAYMENT_GATEWAY`."""
+    if settings.PAYMENT_GATEWAY == "fake":
+        return FakeGateway(latency=settings.FAKE_GATEWAY_LATENCY)
+    return MercadoPagoGateway(settings.MERCADOPAGO_ACCESS_TOKEN)
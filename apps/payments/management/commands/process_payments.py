@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.payments.choices import PaymentStatusChoices
+from apps.payments.services import PaymentService
+
+
+class Command(BaseCommand):
+    help = "Payments: Send the pending payments left without a task to the gateway"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch", type=int, default=50)
+
+    def handle(self, *args, **options) -> None:
+        payments = PaymentService.process_pending_payments(options["batch"])
+        approved = sum(
+            1
+            for payment in payments
+            if payment and payment.status == PaymentStatusChoices.APPROVED
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(payments)} payments processed, {approved} approved."
+            )
+        )
@@ -0,0 +1,57 @@
+"""Models for Payments App."""
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+from apps.utilities.models import BaseModel
+from apps.orders.models import Order
+from .choices import PaymentStatusChoices
+
+User = settings.AUTH_USER_MODEL
+
+
+class Payment(BaseModel):
+    """Model definition for Payment (Intent to pay an order)."""
+
+    order_id = models.ForeignKey(Order, on_delete=models.CASCADE)
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    status = models.CharField(
+        max_length=15,
+        choices=PaymentStatusChoices.choices,
+        default=PaymentStatusChoices.PENDING,
+    )
+    gateway_id = models.CharField(max_length=255, blank=True, db_index=True)
+    payload = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Card data sent to the gateway, cleared once processed.",
+    )
+    error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "payment"
+        verbose_name_plural = "payments"
+        indexes = [
+            models.Index(fields=["status", "updated_at"]),
+        ]
+        constraints = [
+            # Ensures that an order has a single payment in progress or approved
+            models.UniqueConstraint(
+                fields=["order_id"],
+                condition=Q(
+                    status__in=[
+                        PaymentStatusChoices.PENDING,
+                        PaymentStatusChoices.PROCESSING,
+                        PaymentStatusChoices.APPROVED,
+                    ]
+                ),
+                name="unique_active_order_payment",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.order_id} - {self.status}"
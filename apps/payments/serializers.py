@@ -0,0 +1,34 @@
+"""Serializers for Payments App."""
+
+from rest_framework import serializers
+
+from apps.utilities.mixins import ReadOnlyFieldsMixin
+from .models import Payment
+
+
+class PaymentReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
+    """Serializer for Payment model (Retrieve)."""
+
+    class Meta:
+        model = Payment
+        fields = [
+            "id",
+            "order_id",
+            "amount",
+            "status",
+            "gateway_id",
+            "error",
+            "processed_at",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class PaymentWriteSerializer(serializers.Serializer):
+    """Serializer for Payment model (Create)."""
+
+    order_id = serializers.UUIDField()
+    token = serializers.CharField()
+    payment_method_id = serializers.CharField()
+    installments = serializers.IntegerField(min_value=1, default=1)
+    issuer_id = serializers.CharField(required=False, allow_null=True, default=None)
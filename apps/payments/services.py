@@ -1 +1,226 @@
 """Services for Payments App."""
+
+import uuid
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.shortcuts import aget_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.orders.models import Order
+from apps.orders.choices import OrderStatusChoices
+from apps.deliveries.models import Delivery
+from apps.deliveries.choices import StatusChoices
+from .models import Payment
+from .choices import PaymentStatusChoices
+from .gateways import get_gateway
+
+
+class PaymentService:
+    """
+    Service for Payment model.
+
+    Payments run in two steps: the request only records a pending intent
+    and queues its processing, then the task worker (or the gateway
+    webhook) talks to the gateway and confirms the order, so no DB
+    transaction or web worker waits on the gateway.
+    """
+
+    @staticmethod
+    def schedule_processing(payment_id, run_at=None):
+        """Queue the processing of a payment, once."""
+        from .tasks import process_payment
+
+        process_payment.enqueue(
+            dedup_key=f"payments:process:{payment_id}",
+            run_at=run_at,
+            payment_id=str(payment_id),
+        )
+
+    @staticmethod
+    def record_intent(order, user, data):
+        """Record a pending payment and queue it in the same transaction."""
+        try:
+            with transaction.atomic():
+                payment = Payment.objects.create(
+                    order_id=order,
+                    user_id=user,
+                    amount=order.amount,
+                    payload={
+                        "token": data["token"],
+                        "payment_method_id": data["payment_method_id"],
+                        "installments": data["installments"],
+                        "issuer_id": data.get("issuer_id"),
+                    },
+                )
+                PaymentService.schedule_processing(payment.pk)
+        except IntegrityError:
+            raise ValidationError({"error": "Order already has a payment in progress."})
+        return payment
+
+    @staticmethod
+    async def acreate_intent(user, data):
+        """Record a pending payment for an order of the user."""
+        order = await aget_object_or_404(Order, id=data["order_id"], user_id=user)
+
+        if order.is_payment:
+            raise ValidationError({"error": "Order is already paid."})
+        if not order.is_valid or order.amount <= 0:
+            raise ValidationError({"error": "Order has no items to pay."})
+
+        return await sync_to_async(PaymentService.record_intent)(order, user, data)
+
+    @staticmethod
+    def claim_payment(payment_id):
+        """
+        Mark a payment as processing, return False if another worker has it.
+
+        Payments stuck in processing longer than `PAYMENT_PROCESSING_TIMEOUT`
+        can be claimed again; the gateway idempotency key makes the retry safe.
+        """
+        stale = timezone.now() - timedelta(seconds=settings.PAYMENT_PROCESSING_TIMEOUT)
+        claimed = (
+            Payment.objects.filter(pk=payment_id)
+            .filter(
+                Q(status=PaymentStatusChoices.PENDING)
+                | Q(status=PaymentStatusChoices.PROCESSING, updated_at__lt=stale)
+            )
+            .update(status=PaymentStatusChoices.PROCESSING, updated_at=timezone.now())
+        )
+        return claimed == 1
+
+    @staticmethod
+    def process_payment(payment_id):
+        """Send a claimed payment to the gateway, outside any transaction."""
+        if not PaymentService.claim_payment(payment_id):
+            return None
+
+        payment = Payment.objects.select_related("user_id").get(pk=payment_id)
+        payment_data = {
+            **payment.payload,
+            "transaction_amount": float(payment.amount),
+            "installments": int(payment.payload.get("installments") or 1),
+            "external_reference": str(payment.pk),
+            "payer": PaymentService.get_payer(payment.user_id),
+        }
+        if settings.SITE_URL:
+            # The gateway notifies status changes to the webhook
+            payment_data["notification_url"] = (
+                settings.SITE_URL.rstrip("/") + reverse("payment-webhook")
+            )
+        try:
+            response = get_gateway().create_payment(payment_data, str(payment.pk))
+        except Exception as e:
+            # Left in processing, it is retried once the claim goes stale
+            Payment.objects.filter(pk=payment.pk).update(error=f"{e}")
+            PaymentService.schedule_processing(
+                payment.pk,
+                run_at=timezone.now()
+                + timedelta(seconds=settings.PAYMENT_PROCESSING_TIMEOUT),
+            )
+            return None
+        return PaymentService.confirm_payment(
+            payment.pk, response.get("id"), response.get("status")
+        )
+
+    @staticmethod
+    def get_payer(user):
+        """Return the payer data of a user sent to the gateway."""
+        payer = {"email": user.email}
+        profile = getattr(user, "profile", None)
+        if profile is not None:
+            payer["identification"] = {
+                "type": "DNI",
+                "number": profile.identification_number,
+            }
+        return payer
+
+    @staticmethod
+    def confirm_payment(payment_id, gateway_id, gateway_status):
+        """
+        Apply the gateway result to a payment and its order.
+
+        Approved payments mark the order as paid and create its delivery.
+        Safe to call more than once for the same payment.
+        """
+        with transaction.atomic():
+            payment = (
+                Payment.objects.select_for_update()
+                .select_related("order_id")
+                .filter(pk=payment_id)
+                .first()
+            )
+            if payment is None or payment.status in [
+                PaymentStatusChoices.APPROVED,
+                PaymentStatusChoices.REJECTED,
+            ]:
+                return payment
+
+            payment.gateway_id = str(gateway_id or "")
+            payment.processed_at = timezone.now()
+            if gateway_status == "approved":
+                payment.status = PaymentStatusChoices.APPROVED
+                payment.payload = {}
+
+                order = payment.order_id
+                order.is_payment = True
+                order.status = OrderStatusChoices.PROCESSED
+                order.transaction = payment.gateway_id
+                order.save()
+
+                Delivery.objects.get_or_create(
+                    order_id=order,
+                    defaults={"status": StatusChoices.PENDING},
+                )
+            elif gateway_status in ["rejected", "cancelled"]:
+                payment.status = PaymentStatusChoices.REJECTED
+                payment.payload = {}
+            else:
+                # Still pending at the gateway, the webhook confirms it later
+                payment.status = PaymentStatusChoices.PROCESSING
+            payment.save()
+            return payment
+
+    @staticmethod
+    def process_pending_payments(limit=50):
+        """
+        Process a batch of pending (or stale) payments, oldest first.
+
+        Payments are processed by their queued task, this is only meant to
+        recover the ones whose task was lost.
+        """
+        stale = timezone.now() - timedelta(seconds=settings.PAYMENT_PROCESSING_TIMEOUT)
+        payment_ids = list(
+            Payment.objects.filter(
+                Q(status=PaymentStatusChoices.PENDING)
+                | Q(status=PaymentStatusChoices.PROCESSING, updated_at__lt=stale)
+            )
+            .order_by("created_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        return [PaymentService.process_payment(pk) for pk in payment_ids]
+
+    @staticmethod
+    async def ahandle_webhook(data):
+        """
+        Confirm a payment from a gateway notification.
+
+        The notification only carries the gateway id; the status is read
+        back from the gateway, so a forged notification changes nothing.
+        """
+        if data.get("type") != "payment" or not data.get("data", {}).get("id"):
+            return None
+
+        response = await get_gateway().aget_payment(data["data"]["id"])
+        try:
+            payment_id = uuid.UUID(str(response.get("external_reference")))
+        except ValueError:
+            return None
+        return await sync_to_async(PaymentService.confirm_payment)(
+            payment_id, response.get("id"), response.get("status")
+        )
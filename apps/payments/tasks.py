@@ -0,0 +1,11 @@
+"""Tasks for Payments App."""
+
+from apps.tasks.registry import task
+
+
+@task()
+def process_payment(payment_id):
+    """Task send a pending payment to the gateway and confirm its order."""
+    from .services import PaymentService
+
+    PaymentService.process_payment(payment_id)
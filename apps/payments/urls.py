@@ -1 +1,19 @@
 """Urls for Payments App."""
+
+from django.urls import path
+
+from .views import PaymentView, PaymentDetailView, PaymentWebhookView
+
+urlpatterns = [
+    path("api/v1/payments/", PaymentView.as_view(), name="payment"),
+    path(
+        "api/v1/payments/webhook/",
+        PaymentWebhookView.as_view(),
+        name="payment-webhook",
+    ),
+    path(
+        "api/v1/payments/<uuid:pk>/",
+        PaymentDetailView.as_view(),
+        name="payment-detail",
+    ),
+]
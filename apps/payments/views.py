@@ -1,98 +1,100 @@
 """Views for Payments App."""
 
-from django.conf import settings
-from django.db import transaction
-from django.shortcuts import get_object_or_404
-from rest_framework.views import APIView
+from django.shortcuts import aget_object_or_404
+from adrf.views import APIView
 from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
 from rest_framework import status
-import mercadopago
+from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 from apps.users.permissions import IsClient
-from apps.orders.models import Order
-from apps.orders.serializers import OrderReadSerializer
-from apps.deliveries.models import Delivery
-from apps.deliveries.choices import StatusChoices
-
-
-# https://github.com/mercadopago/sdk-python
-sdk = mercadopago.SDK(settings.MERCADOPAGO_ACCESS_TOKEN)
+from apps.utilities.idempotency import idempotent, idempotency_key_parameter
+from .models import Payment
+from .services import PaymentService
+from .serializers import PaymentReadSerializer, PaymentWriteSerializer
 
 
 class PaymentView(APIView):
     """
     View to handle the payment of an order.
 
+    The payment is recorded as pending and processed in the background by
+    the task worker, poll the payment to follow its status.
+
     Endpoints:
+    - POST api/v1/payments/
     """
 
     permission_classes = [IsClient]
 
-    @transaction.atomic
-    def post(self, request, *args, **kwargs):
-        # TODO: Add services layers
-        user = request.user
-        data = request.data
-
-        # Body
-        order_id = data.get("order_id")
-        token = data.get("token")
-        payment_method_id = data.get("payment_method_id")
-        installments = data.get("installments", 1)
-        issuer_id = data.get("issuer_id", None)
-
-        try:
-            # Retrieve the order
-            order = get_object_or_404(Order, id=order_id, user_id=user)
-
-            # Check if the order has already been paid
-            if order.is_payment:
-                return Response(
-                    {"error": "Order is already paid."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Create the payment using MercadoPago
-            payment_data = {
-                "transaction_amount": float(order.amount),
-                "token": token,
-                "installments": int(installments),
-                "payment_method_id": payment_method_id,
-                "issuer_id": issuer_id,
-                "payer": {
-                    "email": user.email,
-                    "identification": {
-                        "type": "DNI",
-                        "number": user.profile.identification_number,
-                    },
-                },
-            }
-
-            payment_response = sdk.payment().create(payment_data)
-            payment = payment_response["response"]
-
-            if payment["status"] == "approved":
-                # Mark the order as paid
-                order.is_payment = True
-                order.status = "COMPLETED"
-                order.transaction = payment["id"]
-                order.save()
-
-                # Create a record in the Delivery model
-                Delivery.objects.create(
-                    order_id=order,
-                    status=StatusChoices.PENDING,
-                )
-
-                order_serializer = OrderReadSerializer(order)
-                return Response(order_serializer.data, status=status.HTTP_200_OK)
-
-            return Response(
-                {"error": "Payment failed"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        except Exception as e:
-            return Response(
-                {"error": f"{e}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    @extend_schema(
+        summary="Pay a Order",
+        description="Record a pending payment for an order of the user, processed in the background, only for `IsClient` users.",
+        request=PaymentWriteSerializer,
+        parameters=[idempotency_key_parameter],
+        responses={
+            202: OpenApiResponse(PaymentReadSerializer, description="Accepted"),
+            400: OpenApiResponse(description="Bad request"),
+            404: OpenApiResponse(description="Not found"),
+        },
+        tags=["payments"],
+    )
+    @idempotent
+    async def post(self, request, *args, **kwargs):
+        serializer = PaymentWriteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        payment = await PaymentService.acreate_intent(
+            request.user, serializer.validated_data
+        )
+        return Response(
+            PaymentReadSerializer(payment).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class PaymentDetailView(APIView):
+    """
+    View to retrieve the status of a payment.
+
+    Endpoints:
+    - GET api/v1/payments/{id}/
+    """
+
+    permission_classes = [IsClient]
+
+    @extend_schema(
+        summary="Get a Payment",
+        description="Get the status of a payment of the user, only for `IsClient` users.",
+        responses={
+            200: OpenApiResponse(PaymentReadSerializer, description="OK"),
+            404: OpenApiResponse(description="Not found"),
+        },
+        tags=["payments"],
+    )
+    async def get(self, request, pk, *args, **kwargs):
+        payment = await aget_object_or_404(Payment, pk=pk, user_id=request.user)
+        return Response(PaymentReadSerializer(payment).data, status=status.HTTP_200_OK)
+
+
+class PaymentWebhookView(APIView):
+    """
+    View to receive the payment notifications of the gateway.
+
+    Endpoints:
+    - POST api/v1/payments/webhook/
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    @extend_schema(
+        summary="Payment Webhook",
+        description="Receive a payment notification from the gateway, the payment status is read back from the gateway.",
+        request=None,
+        responses={200: OpenApiResponse(description="OK")},
+        tags=["payments"],
+    )
+    async def post(self, request, *args, **kwargs):
+        await PaymentService.ahandle_webhook(request.data)
+        return Response(status=status.HTTP_200_OK)
@@ -32,6 +32,9 @@ class FixedCouponManager(BaseManager):
     def get_by_code(self, code):
         return self.get_available().filter(code=code).first()
 
+    async def aget_by_code(self, code):
+        return await self.get_available().filter(code=code).afirst()
+
 
 class PercentageCouponManager(BaseManager):
     """Manager for PercentageCoupon model."""
@@ -41,3 +44,6 @@ class PercentageCouponManager(BaseManager):
 
     def get_by_code(self, code):
         return self.get_available().filter(code=code).first()
+
+    async def aget_by_code(self, code):
+        return await self.get_available().filter(code=code).afirst()
@@ -1,10 +1,17 @@
 """Signals for Promotions App."""
 
-from django.db.models.signals import pre_save
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models.signals import pre_save, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from .models import FixedCoupon, PercentageCoupon
+from apps.utilities.cache import register_list_cache
+from .models import Promotion, FixedCoupon, PercentageCoupon
+from .tasks import expire_coupon
+
+
+register_list_cache(Promotion, FixedCoupon, PercentageCoupon)
 
 
 @receiver(pre_save, sender=FixedCoupon)
@@ -15,4 +22,19 @@ def update_coupon_status(sender, instance, **kwargs):
         instance.is_active = False
         instance.is_available = False
 
-        # TODO: Add Celery or Redis Queue
+
+@receiver(post_save, sender=FixedCoupon)
+@receiver(post_save, sender=PercentageCoupon)
+def schedule_coupon_expiration(sender, instance, raw=False, **kwargs):
+    """Signal queue the deactivation of a coupon the day after its end date."""
+    if instance.is_active and not raw:
+        label = sender._meta.label_lower
+        expire_coupon.enqueue(
+            dedup_key=f"promotions:expiration:{label}:{instance.pk}",
+            # Midnight UTC, when the end date check above starts to match
+            run_at=datetime.combine(
+                instance.end_date + timedelta(days=1), time.min, dt_timezone.utc
+            ),
+            model=label,
+            coupon_id=str(instance.pk),
+        )
@@ -0,0 +1,14 @@
+"""Tasks for Promotions App."""
+
+from django.apps import apps
+
+from apps.tasks.registry import task
+
+
+@task()
+def expire_coupon(model, coupon_id):
+    """Task deactivate a coupon once its end date has passed."""
+    coupon = apps.get_model(model).objects.filter(pk=coupon_id).first()
+    if coupon is not None and coupon.is_active:
+        # The pre_save signal deactivates expired coupons
+        coupon.save()
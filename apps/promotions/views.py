@@ -1,6 +1,6 @@
 """Views for Promotions App."""
 
-from rest_framework.views import APIView
+from adrf.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
@@ -22,7 +22,7 @@ class CheckCouponView(APIView):
 
     permission_classes = [IsMarketing]
 
-    def get(self, request, format=None):
+    async def get(self, request, format=None):
         # Check the validity of a coupon code
         try:
             code = request.query_params.get("coupon_code", None)
@@ -32,13 +32,13 @@ class CheckCouponView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            fixed_coupon = FixedCoupon.objects.get_by_code(code)
-            percentage_coupon = PercentageCoupon.objects.get_by_code(code)
-
+            fixed_coupon = await FixedCoupon.objects.aget_by_code(code)
             if fixed_coupon:
                 serializer = FixedCouponReadSerializer(fixed_coupon)
                 return Response(serializer.data)
-            elif percentage_coupon:
+
+            percentage_coupon = await PercentageCoupon.objects.aget_by_code(code)
+            if percentage_coupon:
                 serializer = PercentageCouponReadSerializer(percentage_coupon)
                 return Response(serializer.data)
             else:
@@ -0,0 +1,251 @@
+"""Autocomplete index for Restaurants App."""
+
+import logging
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from apps.utilities.sync import SyncedIndex
+from .choices import SpecialtyChoices
+
+logger = logging.getLogger(__name__)
+
+
+class AutocompleteEntry(NamedTuple):
+    """Suggestion of the index and the keys it is stored under."""
+
+    name: str
+    restaurant_id: object  # Owner restaurant of a food, None otherwise
+    specialty: str | None  # Specialty of a restaurant, None otherwise
+    keys: tuple
+
+
+class AutocompleteIndex(SyncedIndex):
+    """
+    In-process prefix index of restaurant names, food names and specialties.
+
+    Names are normalized (lowercase, no accents) and kept in two sorted
+    arrays: whole names, and their tails starting at each following word
+    (`pizza` for "Margherita Pizza"). A lookup is a binary search to the
+    first key with the prefix, so requests never touch the database. Saves
+    in this process update the index directly, and `sync()` pulls the rows
+    changed by other processes since the last sync.
+    """
+
+    def __init__(self, sync_interval):
+        super().__init__(sync_interval)
+        self._names = []
+        self._words = []
+        self._entries = {}
+        self._restaurant_foods = {}
+        self._specialties = Counter()
+        self._bulk = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def normalize(text):
+        text = unicodedata.normalize("NFKD", str(text))
+        return "".join(c for c in text if not unicodedata.combining(c)).casefold()
+
+    @staticmethod
+    def _delete(array, key):
+        index = bisect_left(array, key)
+        if index < len(array) and array[index] == key:
+            del array[index]
+
+    def _add(self, kind, pk, name, restaurant_id=None, specialty=None):
+        self._remove(kind, pk)
+        words = self.normalize(name).split()
+        if not words:
+            return
+        keys = tuple((" ".join(words[i:]), kind, pk) for i in range(len(words)))
+        if self._bulk:
+            # Sorted once at the end of `load()`
+            self._names.append(keys[0])
+            self._words.extend(keys[1:])
+        else:
+            insort(self._names, keys[0])
+            for key in keys[1:]:
+                insort(self._words, key)
+        self._entries[(kind, pk)] = AutocompleteEntry(
+            name, restaurant_id, specialty, keys
+        )
+
+    def _remove(self, kind, pk):
+        entry = self._entries.pop((kind, pk), None)
+        if entry is None:
+            return None
+        self._delete(self._names, entry.keys[0])
+        for key in entry.keys[1:]:
+            self._delete(self._words, key)
+        return entry
+
+    def _count_specialty(self, specialty, delta):
+        self._specialties[specialty] += delta
+        if self._specialties[specialty] <= 0:
+            del self._specialties[specialty]
+            self._remove("specialty", specialty)
+        elif delta > 0 and self._specialties[specialty] == delta:
+            self._add("specialty", specialty, SpecialtyChoices(specialty).label)
+
+    def _apply_restaurant(self, pk, name, specialty, is_visible):
+        previous = self._remove("restaurant", pk)
+        if previous is not None:
+            self._count_specialty(previous.specialty, -1)
+        if is_visible:
+            self._add("restaurant", pk, name, specialty=specialty)
+            self._count_specialty(specialty, 1)
+        else:
+            for food_id in self._restaurant_foods.pop(pk, ()):
+                self._remove("food", food_id)
+        # Foods of a restaurant that was hidden are not indexed yet
+        return previous is None and is_visible
+
+    def _apply_food(self, pk, name, restaurant_id, is_available):
+        previous = self._remove("food", pk)
+        if previous is not None:
+            self._restaurant_foods.get(previous.restaurant_id, set()).discard(pk)
+        if is_available and ("restaurant", restaurant_id) in self._entries:
+            self._add("food", pk, name, restaurant_id=restaurant_id)
+            self._restaurant_foods.setdefault(restaurant_id, set()).add(pk)
+
+    def _apply_restaurant_rows(self, rows):
+        from .models import Food
+
+        shown = [
+            pk
+            for pk, name, specialty, is_available, is_verified in rows
+            if self._apply_restaurant(pk, name, specialty, is_available and is_verified)
+        ]
+        if shown:
+            foods = Food.objects.get_available().filter(restaurant_id__in=shown)
+            for pk, name, restaurant_id in foods.values_list(
+                "id", "name", "restaurant_id"
+            ):
+                self._apply_food(pk, name, restaurant_id, True)
+
+    def update_restaurant(self, restaurant):
+        """Insert, rename or hide a single restaurant."""
+        with self._lock:
+            if self._loaded:
+                self._apply_restaurant_rows(
+                    [
+                        (
+                            restaurant.pk,
+                            restaurant.name,
+                            restaurant.specialty,
+                            restaurant.is_available,
+                            restaurant.is_verified,
+                        )
+                    ]
+                )
+
+    def update_food(self, food):
+        """Insert, rename or hide a single food."""
+        with self._lock:
+            if self._loaded:
+                self._apply_food(
+                    food.pk, food.name, food.restaurant_id_id, food.is_available
+                )
+
+    def remove_restaurant(self, pk):
+        with self._lock:
+            self._apply_restaurant(pk, None, None, False)
+
+    def remove_food(self, pk):
+        with self._lock:
+            self._apply_food(pk, None, None, False)
+
+    def _reset(self):
+        self._names.clear()
+        self._words.clear()
+        self._entries.clear()
+        self._restaurant_foods.clear()
+        self._specialties.clear()
+
+    def _load_rows(self):
+        from .models import Restaurant
+
+        restaurants = Restaurant.objects.get_verified().values_list(
+            "id", "name", "specialty", "is_available", "is_verified"
+        )
+        self._bulk = True
+        try:
+            self._apply_restaurant_rows(restaurants)
+        finally:
+            self._bulk = False
+            self._names.sort()
+            self._words.sort()
+
+    def warm(self):
+        """Load the index at process startup, when the database is ready."""
+        try:
+            self.sync()
+        except DatabaseError:
+            logger.warning("Autocomplete index could not be loaded at startup.")
+
+    def _sync_rows(self, since):
+        from .models import Restaurant, Food
+
+        restaurants = list(
+            Restaurant.objects.filter(updated_at__gte=since).values_list(
+                "id", "name", "specialty", "is_available", "is_verified"
+            )
+        )
+        foods = list(
+            Food.objects.filter(updated_at__gte=since).values_list(
+                "id", "name", "restaurant_id", "is_available"
+            )
+        )
+        with self._lock:
+            self._apply_restaurant_rows(restaurants)
+            for row in foods:
+                self._apply_food(*row)
+
+    def search(self, term, limit=10):
+        """
+        Return up to `limit` suggestions whose name or a word of it starts
+        with `term`; names starting with it come first, then by name.
+        """
+        prefix = " ".join(self.normalize(term).split())
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            for array in [self._names, self._words]:
+                index = bisect_left(array, (prefix,))
+                while len(results) < limit and index < len(array):
+                    key, kind, pk = array[index]
+                    if not key.startswith(prefix):
+                        break
+                    index += 1
+                    if (kind, pk) in seen:
+                        continue
+                    seen.add((kind, pk))
+                    entry = self._entries[(kind, pk)]
+                    results.append(
+                        {
+                            "type": kind,
+                            "id": str(pk),
+                            "name": entry.name,
+                            "restaurant_id": (
+                                str(entry.restaurant_id)
+                                if entry.restaurant_id is not None
+                                else None
+                            ),
+                        }
+                    )
+        return results
+
+
+autocomplete_index = AutocompleteIndex(
+    sync_interval=settings.AUTOCOMPLETE_SYNC_INTERVAL,
+)
@@ -3,6 +3,8 @@
 from django_filters import rest_framework as filters
 
 from apps.utilities.filters import BaseFilter
+from apps.locations.models import Country, State, City
+from apps.locations.filters import LocationNameFilter
 from .models import Restaurant, Category, Food
 from .choices import SpecialtyChoices
 
@@ -15,25 +17,30 @@ class RestaurantFilter(BaseFilter):
         choices=SpecialtyChoices.choices,
         label="Filter by specialty, ex `/?specialty=italian`",
     )
-    city = filters.CharFilter(
-        field_name="city_id__name",
-        lookup_expr="icontains",
+    city = LocationNameFilter(
+        model=City,
+        field_name="city_id",
         label="Filter by city name, ex `/?city=newyork`",
     )
-    state = filters.CharFilter(
-        field_name="state_id__name",
-        lookup_expr="icontains",
+    state = LocationNameFilter(
+        model=State,
+        field_name="state_id",
         label="Filter by state name, ex `/?state=california`",
     )
-    country = filters.CharFilter(
-        field_name="country_id__name",
-        lookup_expr="icontains",
+    country = LocationNameFilter(
+        model=Country,
+        field_name="country_id",
         label="Filter by country name, ex `/?country=usa`",
     )
     is_open = filters.BooleanFilter(
         field_name="is_open",
         label="Filter by open status, ex `/?is_open=true`",
     )
+    min_rating = filters.NumberFilter(
+        field_name="rating",
+        lookup_expr="gte",
+        label="Filter by minimum rating, ex `/?min_rating=4`",
+    )
 
     class Meta:
         model = Restaurant
@@ -45,6 +52,7 @@ class RestaurantFilter(BaseFilter):
             "country",
             "is_verified",
             "is_open",
+            "min_rating",
         ]
 
 
@@ -1,8 +1,8 @@
 """Managers for Restaurants App."""
 
-from django.db.models import Q
-
 from apps.utilities.managers import BaseManager
+from apps.utilities.search import search
+from apps.reviews.services import ReviewService
 
 
 class RestaurantManager(BaseManager):
@@ -11,15 +11,14 @@ class RestaurantManager(BaseManager):
     def get_verified(self):
         return self.get_available().filter(is_verified=True)
 
+    def get_verified_with_ratings(self):
+        return ReviewService.annotate_ratings(self.get_verified())
+
     def get_unverified(self):
         return self.get_available().filter(is_verified=True)
 
     def get_search(self, search_term):
-        return self.get_available().filter(
-            Q(name__icontains=search_term)
-            | Q(description__icontains=search_term)
-            | Q(address__icontains=search_term)
-        )
+        return search(self.get_available(), search_term)
 
 
 class CategoryManager(BaseManager):
@@ -48,3 +47,7 @@ class FoodManager(BaseManager):
             .filter(is_featured=True)
             .select_related("restaurant_id", "category_id")
         )
+
+    def get_search(self, search_term):
+        """Get the available foods matching a search term, best first."""
+        return search(self.get_available(), search_term)
@@ -2,6 +2,9 @@
 
 from django.conf import settings
 from django.db import models
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import FileExtensionValidator
 from simple_history.models import HistoricalRecords
 
@@ -9,6 +12,7 @@ from apps.utilities.models import BaseModel
 from apps.utilities.mixins import SlugMixin
 from apps.utilities.paths import image_path, image_banner_path
 from apps.utilities.validators import (
+    FOOD_IMAGE_MAX_MB,
     FileSizeValidator,
     validate_phone,
     validate_food_image,
@@ -37,6 +41,8 @@ class Restaurant(BaseModel, SlugMixin):
     city_id = models.ForeignKey(City, on_delete=models.PROTECT)
     state_id = models.ForeignKey(State, on_delete=models.PROTECT)
     country_id = models.ForeignKey(Country, on_delete=models.PROTECT)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
     opening_time = models.TimeField()
     closing_time = models.TimeField()
     phone = models.CharField(max_length=12, unique=True, validators=[validate_phone])
@@ -48,14 +54,25 @@ class Restaurant(BaseModel, SlugMixin):
     legal_rep_email = models.EmailField(blank=True)
     legal_rep_identity_document = models.FileField(upload_to="documents/", blank=True)
     legal_rep_power_of_attorney = models.FileField(upload_to="documents/", blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    review_summaries = GenericRelation("reviews.ReviewSummary")
 
     objects = RestaurantManager()
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=["search_vector"])
 
     class Meta:
         ordering: list[str] = ["pk"]
         verbose_name: str = "restaurant"
         verbose_name_plural: str = "restaurants"
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            GinIndex(
+                fields=["name"],
+                name="restaurant_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self) -> str:
         return str(self.name)
@@ -108,7 +125,7 @@ class Food(BaseModel):
         upload_to=image_path,
         validators=[
             FileExtensionValidator(allowed_extensions=["webp"]),
-            FileSizeValidator(limit_mb=1),
+            FileSizeValidator(limit_mb=FOOD_IMAGE_MAX_MB),
             validate_food_image,
         ],
     )
@@ -123,14 +140,23 @@ class Food(BaseModel):
         null=True,
     )
     is_featured = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = FoodManager()
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=["search_vector"])
 
     class Meta:
         ordering = ["pk"]
         verbose_name = "food"
         verbose_name_plural = "foods"
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            GinIndex(
+                fields=["name"],
+                name="food_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self):
         return str(self.name)
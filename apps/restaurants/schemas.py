@@ -11,7 +11,9 @@ from apps.orders.serializers import OrderReadSerializer
 from .serializers import (
     RestaurantReadSerializer,
     RestaurantWriteSerializer,
-    RestaurantMinimalSerializer,
+    RestaurantListSerializer,
+    RestaurantAutocompleteSerializer,
+    FoodImportSerializer,
     CategoryReadSerializer,
     CategoryWriteSerializer,
     CategoryMinimalSerializer,
@@ -27,7 +29,7 @@ restaurant_schemas = {
         description="Get a list of all available restaurants.",
         responses={
             200: OpenApiResponse(
-                RestaurantMinimalSerializer(many=True), description="OK"
+                RestaurantListSerializer(many=True), description="OK"
             ),
             400: OpenApiResponse(description="Bad Request"),
             404: OpenApiResponse(description="Not Found"),
@@ -108,6 +110,24 @@ restaurant_schemas = {
         },
         tags=["restaurants"],
     ),
+    "get_autocomplete": extend_schema(
+        summary="Autocomplete Restaurants, Foods and Specialties",
+        description="Retrieve up to 10 suggestions whose name, or a word of it, starts with `q`, ex `/?q=piz`. Served from an in-memory index refreshed on every save.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                description="Prefix typed by the user, ex `piz`",
+                type=str,
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                RestaurantAutocompleteSerializer(many=True), description="OK"
+            ),
+        },
+        auth=[],
+        tags=["restaurants"],
+    ),
     "get_pending_verification": extend_schema(
         summary="Retrieve Restaurants Pending Verification",
         description="Retrieve a list of restaurants that are pending verification, only for `IsSupport` or `IsAdministrator` users",
@@ -285,6 +305,21 @@ food_schemas = {
         },
         tags=["foods"],
     ),
+    "import_foods": extend_schema(
+        summary="Import the Foods of a Menu",
+        description="Create several foods of a restaurant at once from a manifest (`csv` or `json`, with `name`, `description`, `price`, `category`, `is_featured` and `image` per food) and a `zip` archive with the `webp` images it references, use `Content-Type: multipart/form-data`. Nothing is created if any row is invalid, only for `IsPartner` users.",
+        request={"multipart/form-data": FoodImportSerializer},
+        responses={
+            201: OpenApiResponse(FoodMinimalSerializer(many=True), description="Created"),
+            400: OpenApiResponse(description="Bad Request"),
+            401: OpenApiResponse(description="Unauthorized"),
+            403: OpenApiResponse(
+                description="Forbidden (You do not have permission to add foods to this restaurant.)"
+            ),
+            404: OpenApiResponse(description="Not Found"),
+        },
+        tags=["foods"],
+    ),
 }
 
 
@@ -1,17 +1,24 @@
 """Serializers for Restaurants App."""
 
+from decimal import Decimal
+
+from django.core.validators import FileExtensionValidator
 from rest_framework import serializers
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
+from apps.locations.models import Country, State, City
+from apps.locations.serializers import LocationNameField
+from apps.reviews.serializers import RatingSummaryField
 from .models import Restaurant, Category, Food
 
 
 class RestaurantReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Restaurant model (List/retrieve)."""
 
-    city_id = serializers.StringRelatedField()
-    state_id = serializers.StringRelatedField()
-    country_id = serializers.StringRelatedField()
+    city_id = LocationNameField(model=City)
+    state_id = LocationNameField(model=State)
+    country_id = LocationNameField(model=Country)
+    rating = RatingSummaryField()
 
     class Meta:
         model = Restaurant
@@ -27,10 +34,13 @@ class RestaurantReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer)
             "city_id",
             "state_id",
             "country_id",
+            "latitude",
+            "longitude",
             "opening_time",
             "closing_time",
             "phone",
             "website",
+            "rating",
         ]
 
     def to_representation(self, instance):
@@ -55,6 +65,8 @@ class RestaurantWriteSerializer(serializers.ModelSerializer):
             "city_id",
             "state_id",
             "country_id",
+            "latitude",
+            "longitude",
             "phone",
             "opening_time",
             "closing_time",
@@ -85,6 +97,29 @@ class RestaurantMinimalSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializ
         return data
 
 
+class RestaurantListSerializer(RestaurantMinimalSerializer):
+    """Serializer for Restaurant model (List)."""
+
+    rating = serializers.DecimalField(max_digits=3, decimal_places=2)
+    review_count = serializers.IntegerField()
+
+    class Meta(RestaurantMinimalSerializer.Meta):
+        fields = [
+            *RestaurantMinimalSerializer.Meta.fields,
+            "rating",
+            "review_count",
+        ]
+
+
+class RestaurantAutocompleteSerializer(serializers.Serializer):
+    """Serializer for the suggestions of the autocomplete index."""
+
+    type = serializers.ChoiceField(choices=["restaurant", "food", "specialty"])
+    id = serializers.CharField()
+    name = serializers.CharField()
+    restaurant_id = serializers.UUIDField(allow_null=True)
+
+
 class CategoryReadSerializer(serializers.ModelSerializer):
     """Serializer for Category model (List/retrieve)."""
 
@@ -163,6 +198,32 @@ class FoodWriteSerializer(serializers.ModelSerializer):
         extra_kwargs = {"category_id": {"required": True}}
 
 
+class FoodImportSerializer(serializers.Serializer):
+    """Serializer for the files of a menu import."""
+
+    manifest = serializers.FileField(
+        validators=[FileExtensionValidator(["csv", "json"])],
+        help_text="CSV or JSON list of foods: name, description, price, category, is_featured and image.",
+    )
+    images = serializers.FileField(
+        validators=[FileExtensionValidator(["zip"])],
+        help_text="ZIP archive with the webp images named in the manifest.",
+    )
+
+
+class FoodImportItemSerializer(serializers.Serializer):
+    """Serializer for a food of a menu import manifest."""
+
+    name = serializers.CharField(max_length=255)
+    description = serializers.CharField(allow_blank=True, default="")
+    price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal("0")
+    )
+    category = serializers.CharField(help_text="Name or ID of the category.")
+    is_featured = serializers.BooleanField(default=False)
+    image = serializers.CharField(help_text="File name of the image in the archive.")
+
+
 class FoodMinimalSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
     """Serializer for Food model (Minimal)."""
 
@@ -1,9 +1,24 @@
 """Services for Restaurants App."""
 
+import csv
+import io
+import json
+import zipfile
 from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
 from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
 
-from .models import Food
+from apps.utilities.validators import (
+    FOOD_IMAGE_MAX_MB,
+    FOOD_IMAGE_MAX_SIZE,
+    read_image_size,
+)
+from .models import Category, Food
 
 
 class RestaurantService:
@@ -38,3 +53,191 @@ class FoodService:
         base_price = Decimal(food.price)
         tax_amount = base_price * Decimal(settings.SALES_TAX_RATE)
         food.sale_price = base_price + tax_amount
+
+    @staticmethod
+    def calculate_sale_prices(prices):
+        """
+        Calculate the sale_price of many base prices at once.
+
+        Prices are taxed as integer cents in a single numpy operation,
+        rounded half up like `calculate_sale_price_with_tax` once stored.
+        """
+        rate = Fraction(str(settings.SALES_TAX_RATE))
+        cents = np.array([int(price * 100) for price in prices], dtype=np.int64)
+        taxes = (cents * rate.numerator * 2 + rate.denominator) // (
+            rate.denominator * 2
+        )
+        return [Decimal(int(total)) / 100 for total in cents + taxes]
+
+    @staticmethod
+    def read_menu_manifest(manifest):
+        """Return the rows of a CSV or JSON menu manifest as dicts."""
+        content = manifest.read().decode("utf-8-sig")
+        if manifest.name.lower().endswith(".json"):
+            rows = json.loads(content)
+            if not isinstance(rows, list) or not all(
+                isinstance(row, dict) for row in rows
+            ):
+                raise ValueError("The JSON manifest must be a list of objects.")
+            return rows
+        return list(csv.DictReader(io.StringIO(content)))
+
+    @staticmethod
+    def read_menu_files(manifest, archive):
+        """Return the manifest rows and the opened ZIP archive of a menu."""
+        try:
+            rows = FoodService.read_menu_manifest(manifest)
+            archive = zipfile.ZipFile(archive)
+        except (ValueError, csv.Error, zipfile.BadZipFile) as e:
+            raise ValidationError({"error": f"Invalid menu files: {e}"})
+        if not rows:
+            raise ValidationError({"error": "The manifest has no items."})
+        if len(rows) > settings.FOOD_IMPORT_MAX_ITEMS:
+            raise ValidationError(
+                {"error": f"At most {settings.FOOD_IMPORT_MAX_ITEMS} items per import."}
+            )
+        return rows, archive
+
+    @staticmethod
+    def validate_menu_row(row, categories, members):
+        """Return the validated data and the errors of a manifest row."""
+        from .serializers import FoodImportItemSerializer
+
+        serializer = FoodImportItemSerializer(data=row)
+        serializer.is_valid()
+        errors = dict(serializer.errors)
+        category = str(row.get("category", "")).strip().lower()
+        if "category" not in errors and category not in categories:
+            errors["category"] = ["Category not found in this restaurant."]
+        image = str(row.get("image", "")).strip()
+        if "image" not in errors:
+            info = members.get(image)
+            if info is None:
+                errors["image"] = ["Image not found in the archive."]
+            elif not image.lower().endswith(".webp"):
+                errors["image"] = ["Only webp images are allowed."]
+            elif info.file_size > FOOD_IMAGE_MAX_MB * 1024 * 1024:
+                errors["image"] = ["Image exceeds the size limit."]
+        return serializer.validated_data, errors
+
+    @staticmethod
+    def validate_menu_images(archive, items):
+        """
+        Return the errors of the images of the validated manifest rows.
+
+        Images are opened one at a time from the archive and only their
+        header is read, so an import never holds the whole menu in memory.
+        """
+        max_width, max_height = FOOD_IMAGE_MAX_SIZE
+        errors = []
+        for number, item in enumerate(items, start=1):
+            with archive.open(item["image"]) as image:
+                size = read_image_size(image)
+            if size is None:
+                errors.append({"row": number, "image": ["Invalid image file."]})
+            elif size[0] > max_width or size[1] > max_height:
+                errors.append(
+                    {
+                        "row": number,
+                        "image": [
+                            f"Image dimensions should not exceed "
+                            f"{max_width}x{max_height}px."
+                        ],
+                    }
+                )
+        return errors
+
+    @staticmethod
+    def create_menu_foods(restaurant, archive, items, categories):
+        """
+        Insert the foods of the validated rows with `bulk_create` (and their
+        history records), streaming each image from the archive to storage.
+
+        Images are written before the transaction commits, so the stored
+        files are deleted again if the insert fails.
+        """
+        from apps.utilities.cache import bump_model_version
+        from apps.utilities.search import update_search_vectors
+        from simple_history.utils import bulk_create_with_history
+        from .tasks import update_restaurant_verification
+
+        sale_prices = FoodService.calculate_sale_prices(
+            [item["price"] for item in items]
+        )
+        foods = [
+            Food(
+                name=item["name"],
+                description=item["description"],
+                price=item["price"],
+                sale_price=sale_price,
+                image=File(archive.open(item["image"]), name=item["image"]),
+                category_id=categories[item["category"].lower()],
+                is_featured=item["is_featured"],
+                restaurant_id=restaurant,
+            )
+            for item, sale_price in zip(items, sale_prices)
+        ]
+        try:
+            with transaction.atomic():
+                foods = bulk_create_with_history(foods, Food, batch_size=500)
+                # Bulk inserts send no signals, apply their side effects once
+                update_search_vectors(
+                    Food.objects.filter(pk__in=[f.pk for f in foods])
+                )
+                update_restaurant_verification.enqueue(
+                    dedup_key=f"restaurants:verification:{restaurant.pk}",
+                    restaurant_id=str(restaurant.pk),
+                )
+                transaction.on_commit(lambda: bump_model_version(Food))
+        except Exception:
+            for food in foods:
+                if food.image._committed:
+                    food.image.storage.delete(food.image.name)
+            raise
+        return foods
+
+    @staticmethod
+    def import_menu(restaurant, manifest, archive):
+        """
+        Create the foods of a menu manifest, with their images from a ZIP.
+
+        Every row is validated first and nothing is created if one fails,
+        then the restaurant verification is queued once for the batch.
+        """
+        from .autocomplete import autocomplete_index
+
+        rows, archive = FoodService.read_menu_files(manifest, archive)
+        categories = {}
+        for category in Category.objects.get_by_restaurant(restaurant):
+            categories[str(category.pk)] = category
+            categories[category.name.lower()] = category
+        members = {info.filename: info for info in archive.infolist()}
+
+        items, errors = [], []
+        for number, row in enumerate(rows, start=1):
+            item, row_errors = FoodService.validate_menu_row(
+                row, categories, members
+            )
+            if row_errors:
+                errors.append({"row": number, **row_errors})
+            elif not errors:
+                items.append(item)
+        if errors:
+            raise ValidationError({"errors": errors})
+
+        total_size = sum(members[item["image"]].file_size for item in items)
+        if total_size > settings.FOOD_IMPORT_MAX_MB * 1024 * 1024:
+            raise ValidationError(
+                {"error": f"The images exceed {settings.FOOD_IMPORT_MAX_MB} MB."}
+            )
+        errors = FoodService.validate_menu_images(archive, items)
+        if errors:
+            raise ValidationError({"errors": errors})
+
+        with archive:
+            foods = FoodService.create_menu_foods(
+                restaurant, archive, items, categories
+            )
+        for food in foods:
+            autocomplete_index.update_food(food)
+        return foods
@@ -1,14 +1,55 @@
 """Signals for Restaurants App."""
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from .models import Food
-from .services import RestaurantService
+from apps.utilities.cache import register_list_cache
+from apps.utilities.search import register_search
+from .models import Restaurant, Food
+from .tasks import update_restaurant_verification
+from .autocomplete import autocomplete_index
+
+
+register_list_cache(Restaurant)
+register_search(
+    Restaurant,
+    {"name": "A", "specialty": "B", "description": "C", "address": "D"},
+    trigram_field="name",
+)
+register_search(Food, {"name": "A", "description": "B"}, trigram_field="name")
 
 
 @receiver(post_save, sender=Food)
-def handle_food_post_save(sender, instance, **kwargs):
-    """Signal update the restaurant verification status."""
-    restaurant = instance.restaurant_id
-    RestaurantService.update_restaurant_verification(restaurant)
+def handle_food_post_save(sender, instance, raw=False, **kwargs):
+    """Signal queue the update of the restaurant verification status."""
+    if not raw:
+        update_restaurant_verification.enqueue(
+            dedup_key=f"restaurants:verification:{instance.restaurant_id_id}",
+            restaurant_id=str(instance.restaurant_id_id),
+        )
+
+
+@receiver(post_save, sender=Restaurant)
+def update_restaurant_autocomplete(sender, instance, raw=False, **kwargs):
+    """Keep the in-process autocomplete index in sync with the saved restaurant."""
+    if not raw:
+        autocomplete_index.update_restaurant(instance)
+
+
+@receiver(post_save, sender=Food)
+def update_food_autocomplete(sender, instance, raw=False, **kwargs):
+    """Keep the in-process autocomplete index in sync with the saved food."""
+    if not raw:
+        autocomplete_index.update_food(instance)
+
+
+@receiver(post_delete, sender=Restaurant)
+def remove_restaurant_from_autocomplete(sender, instance, **kwargs):
+    """Remove a deleted restaurant and its foods from the autocomplete index."""
+    autocomplete_index.remove_restaurant(instance.pk)
+
+
+@receiver(post_delete, sender=Food)
+def remove_food_from_autocomplete(sender, instance, **kwargs):
+    """Remove a deleted food from the autocomplete index."""
+    autocomplete_index.remove_food(instance.pk)
@@ -0,0 +1,13 @@
+"""Tasks for Restaurants App."""
+
+from apps.tasks.registry import task
+from .models import Restaurant
+from .services import RestaurantService
+
+
+@task()
+def update_restaurant_verification(restaurant_id):
+    """Task update the restaurant verification status."""
+    restaurant = Restaurant.objects.filter(pk=restaurant_id).first()
+    if restaurant is not None:
+        RestaurantService.update_restaurant_verification(restaurant)
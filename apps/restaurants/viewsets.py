@@ -1,5 +1,6 @@
 """Viewsets for Restaurant App."""
 
+from django.conf import settings
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
@@ -8,22 +9,26 @@ from django.shortcuts import get_object_or_404
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema_view
 
 from apps.users.permissions import IsPartner, IsClient, IsSupport
-from apps.utilities.mixins import ListCacheMixin, LogicalDeleteMixin
+from apps.utilities.mixins import ReplicaMixin, ListCacheMixin, LogicalDeleteMixin
 from apps.orders.models import Order
 from apps.orders.serializers import OrderReadSerializer
-from apps.reviews.models import Review
+from apps.reviews.models import Review, ReviewSummary
 from apps.reviews.serializers import ReviewReadSerializer, ReviewWriteSerializer
 from apps.reviews.filters import ReviewFilter
 from .models import Restaurant, Category, Food
 from .serializers import (
     RestaurantReadSerializer,
     RestaurantWriteSerializer,
-    RestaurantMinimalSerializer,
+    RestaurantListSerializer,
+    RestaurantAutocompleteSerializer,
+    FoodImportSerializer,
     CategoryReadSerializer,
     CategoryWriteSerializer,
     CategoryMinimalSerializer,
@@ -32,6 +37,8 @@ from .serializers import (
     FoodMinimalSerializer,
 )
 from .filters import RestaurantFilter, FoodFilter
+from .services import FoodService
+from .autocomplete import autocomplete_index
 from .schemas import (
     restaurant_schemas,
     category_schemas,
@@ -41,7 +48,7 @@ from .schemas import (
 
 
 @extend_schema_view(**restaurant_schemas)
-class RestaurantViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
+class RestaurantViewSet(ReplicaMixin, ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     """
     ViewSet for managing Restaurant instances.
 
@@ -58,9 +65,11 @@ class RestaurantViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
     serializer_class = RestaurantWriteSerializer
     search_fields = ["name"]
     filterset_class = RestaurantFilter
+    cache_dependencies = [Restaurant, ReviewSummary]
+    throttle_scope = "autocomplete"  # Rate of the actions with ScopedRateThrottle
 
     def get_queryset(self):
-        return Restaurant.objects.get_verified()
+        return Restaurant.objects.get_verified_with_ratings()
 
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
@@ -71,7 +80,7 @@ class RestaurantViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
 
     def get_serializer_class(self):
         if self.action == "list":
-            return RestaurantMinimalSerializer
+            return RestaurantListSerializer
         elif self.action == "retrieve":
             return RestaurantReadSerializer
         return super().get_serializer_class()
@@ -128,9 +137,33 @@ class RestaurantViewSet(ListCacheMixin, LogicalDeleteMixin, ModelViewSet):
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[AllowAny],
+        throttle_classes=[ScopedRateThrottle],
+        filter_backends=[],
+        pagination_class=None,
+        url_path="autocomplete",
+    )
+    def get_autocomplete(self, request, *args, **kwargs):
+        """
+        Action retrieve name suggestions for restaurants, foods and specialties.
+
+        Endpoints:
+        - GET api/v1/restaurants/autocomplete/?q=piz
+        """
+        autocomplete_index.sync()
+        suggestions = autocomplete_index.search(
+            request.query_params.get("q", ""),
+            limit=settings.AUTOCOMPLETE_MAX_RESULTS,
+        )
+        serializer = RestaurantAutocompleteSerializer(suggestions, many=True)
+        return Response(serializer.data)
+
 
 @extend_schema_view(**category_schemas)
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(ReplicaMixin, ModelViewSet):
     """
     ViewSet for Category model.
 
@@ -212,7 +245,7 @@ class CategoryViewSet(ModelViewSet):
 
 
 @extend_schema_view(**food_schemas)
-class FoodViewSet(ModelViewSet):
+class FoodViewSet(ReplicaMixin, ModelViewSet):
     """
     ViewSet for Food model.
 
@@ -304,9 +337,45 @@ class FoodViewSet(ModelViewSet):
             )
         return super().destroy(request, *args, **kwargs)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[MultiPartParser],
+        url_path="import",
+    )
+    def import_foods(self, request, *args, **kwargs):
+        """
+        Action create the foods of a menu from a manifest and an image archive.
+
+        Endpoints:
+        - POST api/v1/restaurants/{id}/foods/import/
+        """
+        restaurant = get_object_or_404(Restaurant, pk=self.kwargs["restaurant_pk"])
+
+        # Verify if the request user is the owner of the restaurant
+        if restaurant.user_id != request.user:
+            return Response(
+                {
+                    "error": "You do not have permission to add foods to this restaurant."
+                },
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = FoodImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        foods = FoodService.import_menu(
+            restaurant,
+            serializer.validated_data["manifest"],
+            serializer.validated_data["images"],
+        )
+        return Response(
+            FoodMinimalSerializer(foods, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
 
 @extend_schema_view(**restaurant_review_schemas)
-class RestaurantReviewViewSet(ModelViewSet):
+class RestaurantReviewViewSet(ReplicaMixin, ModelViewSet):
     """
     ViewSet for RestaurantReview instances.
 
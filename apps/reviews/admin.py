@@ -3,7 +3,7 @@
 from django.contrib import admin
 
 from apps.utilities.admin import BaseAdmin
-from .models import Review
+from .models import Review, ReviewSummary
 
 
 @admin.register(Review)
@@ -21,3 +21,18 @@ class ReviewAdmin(BaseAdmin):
     list_editable = ["is_available"]
     list_filter = ["rating", "content_type"]
     readonly_fields = ["pk", "created_at", "updated_at"]
+
+
+@admin.register(ReviewSummary)
+class ReviewSummaryAdmin(admin.ModelAdmin):
+    """Admin for ReviewSummary model."""
+
+    list_per_page = 25
+    list_display = [
+        "content_type",
+        "content_object",
+        "review_count",
+        "rating_average",
+    ]
+    list_filter = ["content_type"]
+    readonly_fields = [field.name for field in ReviewSummary._meta.fields]
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.reviews.services import ReviewService
+
+
+class Command(BaseCommand):
+    help = "Reviews: Rebuild the rating summaries from the reviews table"
+
+    def handle(self, *args, **options) -> None:
+        total = ReviewService.rebuild_summaries()
+        self.stdout.write(self.style.SUCCESS(f"{total} review summaries rebuilt."))
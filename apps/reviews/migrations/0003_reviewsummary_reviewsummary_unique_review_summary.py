@@ -0,0 +1,40 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('reviews', '0002_alter_review_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.UUIDField()),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_average', models.DecimalField(decimal_places=2, default=0, max_digits=3)),
+                ('rating_1', models.PositiveIntegerField(default=0)),
+                ('rating_2', models.PositiveIntegerField(default=0)),
+                ('rating_3', models.PositiveIntegerField(default=0)),
+                ('rating_4', models.PositiveIntegerField(default=0)),
+                ('rating_5', models.PositiveIntegerField(default=0)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'review summary',
+                'verbose_name_plural': 'review summaries',
+                'indexes': [models.Index(fields=['content_type', 'rating_average'], name='reviews_rev_content_3a46ab_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reviewsummary',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_review_summary'),
+        ),
+    ]
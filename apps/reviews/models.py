@@ -49,3 +49,44 @@ class Review(BaseModel):
         if self.content_type.model not in ["restaurant", "post"]:
             raise ValidationError("Invalid model relationship")
         super(Review, self).save(*args, **kwargs)
+
+
+class ReviewSummary(models.Model):
+    """
+    Model definition for ReviewSummary (Rollup of Review).
+
+    Kept up to date incrementally by the review signals, so ratings can be
+    shown, filtered and sorted without aggregating the reviews table.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    content_object = GenericForeignKey("content_type", "object_id")
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_average = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    rating_1 = models.PositiveIntegerField(default=0)
+    rating_2 = models.PositiveIntegerField(default=0)
+    rating_3 = models.PositiveIntegerField(default=0)
+    rating_4 = models.PositiveIntegerField(default=0)
+    rating_5 = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "review summary"
+        verbose_name_plural = "review summaries"
+        indexes = [
+            models.Index(fields=["content_type", "rating_average"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="unique_review_summary",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.content_object}: {self.rating_average} ({self.review_count})"
+
+    @property
+    def histogram(self):
+        return {str(rating): getattr(self, f"rating_{rating}") for rating in range(1, 6)}
@@ -1,9 +1,10 @@
 """Serializers for Reviews App."""
 
 from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
 
 from apps.utilities.mixins import ReadOnlyFieldsMixin
-from .models import Review
+from .models import Review, ReviewSummary
 
 
 class ReviewReadSerializer(ReadOnlyFieldsMixin, serializers.ModelSerializer):
@@ -32,3 +33,43 @@ class ReviewWriteSerializer(serializers.ModelSerializer):
             "comment",
             "rating",
         ]
+
+
+@extend_schema_field(
+    {
+        "type": "object",
+        "properties": {
+            "average": {"type": "string", "format": "decimal"},
+            "count": {"type": "integer"},
+            "histogram": {
+                "type": "object",
+                "additionalProperties": {"type": "integer"},
+            },
+        },
+    }
+)
+class RatingSummaryField(serializers.Field):
+    """
+    Read-only rating summary of an object: average, count and histogram.
+
+    Read from the annotations of `ReviewService.annotate_ratings`, objects
+    loaded without them fall back to one query for their summary.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        if not hasattr(instance, "review_count"):
+            instance = instance.review_summaries.first() or ReviewSummary()
+            instance.rating = instance.rating_average
+        return {
+            "average": f"{instance.rating:.2f}",
+            "count": instance.review_count,
+            "histogram": {
+                str(rating): getattr(instance, f"rating_{rating}")
+                for rating in range(1, 6)
+            },
+        }
@@ -0,0 +1,112 @@
+"""Services for Reviews App."""
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, NullIf
+
+from apps.utilities.cache import bump_model_version
+from .models import Review, ReviewSummary
+
+
+class ReviewService:
+    """
+    Service for Review model.
+    """
+
+    @staticmethod
+    def annotate_ratings(queryset):
+        """
+        Annotate a queryset with the rating summary of each object.
+
+        The model must declare a `review_summaries` GenericRelation; the
+        summary is joined (at most one row per object), nothing is grouped.
+        """
+        fields = ["review_count", *[f"rating_{rating}" for rating in range(1, 6)]]
+        return queryset.annotate(
+            rating=Coalesce(
+                F("review_summaries__rating_average"),
+                Value(0),
+                output_field=DecimalField(max_digits=3, decimal_places=2),
+            ),
+            **{
+                field: Coalesce(F(f"review_summaries__{field}"), Value(0))
+                for field in fields
+            },
+        )
+
+    @staticmethod
+    def get_stored_rating(review):
+        """Return the rating counted for a review before it is saved, if any."""
+        if review._state.adding:
+            return None
+        return (
+            Review.objects.filter(pk=review.pk, is_available=True)
+            .values_list("rating", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def apply_rating_delta(content_type_id, object_id, removed=None, added=None):
+        """
+        Move the summary of an object from the `removed` to the `added` rating.
+
+        Either one may be None, for created and deleted reviews. Applied with
+        a single conditional UPDATE, so concurrent reviews never lose counts.
+        """
+        if removed == added:
+            return
+
+        count_delta = (added is not None) - (removed is not None)
+        sum_delta = (added or 0) - (removed or 0)
+        changes = {
+            "review_count": F("review_count") + count_delta,
+            "rating_sum": F("rating_sum") + sum_delta,
+            "rating_average": Coalesce(
+                (F("rating_sum") + sum_delta)
+                * Value(1.0)
+                / NullIf(F("review_count") + count_delta, 0),
+                0,
+                output_field=DecimalField(max_digits=3, decimal_places=2),
+            ),
+        }
+        if removed is not None:
+            changes[f"rating_{removed}"] = F(f"rating_{removed}") - 1
+        if added is not None:
+            changes[f"rating_{added}"] = F(f"rating_{added}") + 1
+
+        with transaction.atomic():
+            ReviewSummary.objects.get_or_create(
+                content_type_id=content_type_id, object_id=object_id
+            )
+            ReviewSummary.objects.filter(
+                content_type_id=content_type_id, object_id=object_id
+            ).update(**changes)
+        transaction.on_commit(lambda: bump_model_version(ReviewSummary))
+
+    @staticmethod
+    def rebuild_summaries():
+        """Recompute every review summary from the reviews table."""
+        histogram = {
+            f"rating_{rating}": Count("id", filter=Q(rating=rating))
+            for rating in range(1, 6)
+        }
+        rows = (
+            Review.objects.filter(is_available=True)
+            .order_by()
+            .values("content_type_id", "object_id")
+            .annotate(review_count=Count("id"), rating_sum=Sum("rating"), **histogram)
+        )
+        with transaction.atomic():
+            ReviewSummary.objects.all().delete()
+            created = ReviewSummary.objects.bulk_create(
+                [
+                    ReviewSummary(
+                        **row,
+                        rating_average=round(row["rating_sum"] / row["review_count"], 2),
+                    )
+                    for row in rows.iterator()
+                ],
+                batch_size=1000,
+            )
+        transaction.on_commit(lambda: bump_model_version(ReviewSummary))
+        return len(created)
@@ -0,0 +1,40 @@
+"""Signals for Reviews App."""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.utilities.cache import register_list_cache
+from .models import Review, ReviewSummary
+from .services import ReviewService
+
+
+register_list_cache(ReviewSummary)
+
+
+@receiver(pre_save, sender=Review)
+def store_previous_rating(sender, instance, raw=False, **kwargs):
+    """Signal to remember the rating a review counted with before saving."""
+    if not raw:
+        instance._previous_rating = ReviewService.get_stored_rating(instance)
+
+
+@receiver(post_save, sender=Review)
+def update_summary_on_save(sender, instance, raw=False, **kwargs):
+    """Signal to apply a created or edited review to its summary."""
+    if raw:
+        return
+    ReviewService.apply_rating_delta(
+        instance.content_type_id,
+        instance.object_id,
+        removed=getattr(instance, "_previous_rating", None),
+        added=instance.rating if instance.is_available else None,
+    )
+
+
+@receiver(post_delete, sender=Review)
+def update_summary_on_delete(sender, instance, **kwargs):
+    """Signal to remove a deleted review from its summary."""
+    if instance.is_available:
+        ReviewService.apply_rating_delta(
+            instance.content_type_id, instance.object_id, removed=instance.rating
+        )
@@ -0,0 +1,17 @@
+"""Admin for Tasks App."""
+
+from django.contrib import admin
+
+from apps.utilities.admin import BaseAdmin
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(BaseAdmin):
+    """Admin for Task model."""
+
+    search_fields = ["name", "dedup_key"]
+    list_display = ["name", "dedup_key", "status", "attempts", "run_at", "finished_at"]
+    list_filter = ["status", "name"]
+    readonly_fields = ["pk", "created_at", "updated_at"]
+    ordering = ["-run_at"]
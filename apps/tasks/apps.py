@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.tasks"
+
+    def ready(self):
+        # Register the tasks declared in the `tasks.py` module of every app
+        autodiscover_modules("tasks")
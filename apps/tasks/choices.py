@@ -0,0 +1,11 @@
+"""Choices for Tasks App."""
+
+from django.db import models
+
+
+class TaskStatusChoices(models.TextChoices):
+
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
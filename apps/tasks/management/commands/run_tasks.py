@@ -0,0 +1,49 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.tasks.choices import TaskStatusChoices
+from apps.tasks.services import TaskService
+
+
+class Command(BaseCommand):
+    help = "Tasks: Run the queued background tasks, retrying the failed ones"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for due tasks every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.TASK_WORKER_INTERVAL,
+        )
+        parser.add_argument("--batch", type=int, default=50)
+
+    def handle(self, *args, **options) -> None:
+        last_purge = None
+        while True:
+            if last_purge is None or time.monotonic() - last_purge > 60 * 60:
+                TaskService.purge_finished_tasks()
+                last_purge = time.monotonic()
+
+            tasks = TaskService.process_pending_tasks(options["batch"])
+            succeeded = sum(
+                1
+                for task in tasks
+                if task and task.status == TaskStatusChoices.SUCCEEDED
+            )
+            if tasks or not options["loop"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{len(tasks)} tasks run, {succeeded} succeeded."
+                    )
+                )
+
+            # Drain the backlog before sleeping again
+            if not options["loop"]:
+                break
+            if len(tasks) < options["batch"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,44 @@
+"""Models for Tasks App."""
+
+from django.db import models
+from django.db.models import Q
+
+from apps.utilities.models import BaseModel
+from .choices import TaskStatusChoices
+
+
+class Task(BaseModel):
+    """Model definition for Task (Deferred call run by the task worker)."""
+
+    name = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True)
+    dedup_key = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=15,
+        choices=TaskStatusChoices.choices,
+        default=TaskStatusChoices.PENDING,
+    )
+    run_at = models.DateTimeField()
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    error = models.TextField(blank=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["run_at"]
+        verbose_name = "task"
+        verbose_name_plural = "tasks"
+        indexes = [
+            models.Index(fields=["status", "run_at"]),
+        ]
+        constraints = [
+            # Ensures that a deduplication key has a single pending task
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                condition=Q(status=TaskStatusChoices.PENDING) & ~Q(dedup_key=""),
+                name="unique_pending_task_dedup_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} - {self.status}"
@@ -0,0 +1,58 @@
+"""Task registry for Tasks App."""
+
+from django.conf import settings
+
+# Tasks declared with `task`, by name
+_tasks = {}
+
+
+class RegisteredTask:
+    """A function the task worker can run, see `task`."""
+
+    def __init__(self, func, name, max_attempts):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, dedup_key="", run_at=None, **kwargs):
+        """
+        Queue a call with JSON serializable `kwargs`, see `TaskService.enqueue`.
+        """
+        from .services import TaskService
+
+        return TaskService.enqueue(
+            self.name,
+            kwargs,
+            dedup_key=dedup_key,
+            run_at=run_at,
+            max_attempts=self.max_attempts,
+        )
+
+
+def task(name=None, max_attempts=None):
+    """
+    Register a function as a task, run by the `run_tasks` worker.
+
+    Calling the task runs it inline, `task.enqueue(**kwargs)` queues it.
+    Failed calls are retried with an exponential backoff until they were
+    tried `max_attempts` times (`TASK_MAX_ATTEMPTS` by default).
+    """
+
+    def decorator(func):
+        registered = RegisteredTask(
+            func,
+            name or f"{func.__module__}.{func.__name__}",
+            max_attempts or settings.TASK_MAX_ATTEMPTS,
+        )
+        _tasks[registered.name] = registered
+        return registered
+
+    return decorator
+
+
+def get_task(name):
+    return _tasks.get(name)
@@ -0,0 +1,160 @@
+"""Services for Tasks App."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+from .choices import TaskStatusChoices
+from .registry import get_task
+
+logger = logging.getLogger(__name__)
+
+
+class TaskService:
+    """
+    Service for Task model.
+
+    Tasks are rows written in the same transaction as the change that
+    queued them, so they only exist once it commits, and the worker runs
+    them outside of any request.
+    """
+
+    @staticmethod
+    def enqueue(name, kwargs=None, dedup_key="", run_at=None, max_attempts=1):
+        """
+        Queue a call of the task `name`, to run at `run_at` (now by default).
+
+        While a task with the same `dedup_key` is pending, it is updated
+        with the arguments and run time of the latest call instead, so a
+        burst of saves runs the task once.
+        """
+        values = {
+            "name": name,
+            "kwargs": kwargs or {},
+            "run_at": run_at or timezone.now(),
+            "max_attempts": max_attempts,
+        }
+        pending = Task.objects.filter(
+            dedup_key=dedup_key, status=TaskStatusChoices.PENDING
+        )
+        for _ in range(2):
+            if dedup_key and pending.update(**values, updated_at=timezone.now()):
+                return None
+            try:
+                with transaction.atomic():
+                    return Task.objects.create(dedup_key=dedup_key, **values)
+            except IntegrityError:
+                # Queued concurrently with the same key, update that one
+                continue
+        return None
+
+    @staticmethod
+    def claim_task(task_id):
+        """
+        Mark a task as running, return False if another worker has it.
+
+        Tasks running longer than `TASK_TIMEOUT` (their worker died) can be
+        claimed again while they have attempts left.
+        """
+        stale = timezone.now() - timedelta(seconds=settings.TASK_TIMEOUT)
+        claimed = (
+            Task.objects.filter(pk=task_id)
+            .filter(
+                Q(status=TaskStatusChoices.PENDING)
+                | Q(
+                    status=TaskStatusChoices.RUNNING,
+                    updated_at__lt=stale,
+                    attempts__lt=F("max_attempts"),
+                )
+            )
+            .update(
+                status=TaskStatusChoices.RUNNING,
+                attempts=F("attempts") + 1,
+                updated_at=timezone.now(),
+            )
+        )
+        return claimed == 1
+
+    @staticmethod
+    def run_task(task_id):
+        """Run a claimed task, then record its result or schedule a retry."""
+        if not TaskService.claim_task(task_id):
+            return None
+
+        task = Task.objects.get(pk=task_id)
+        registered = get_task(task.name)
+        try:
+            if registered is None:
+                raise LookupError(f"Task {task.name} is not registered.")
+            registered(**task.kwargs)
+        except Exception as e:
+            logger.exception("Task %s (%s) failed.", task.name, task.pk)
+            return TaskService.fail_task(task, e)
+
+        task.status = TaskStatusChoices.SUCCEEDED
+        task.error = ""
+        task.finished_at = timezone.now()
+        task.save(update_fields=["status", "error", "finished_at", "updated_at"])
+        return task
+
+    @staticmethod
+    def fail_task(task, error):
+        """Schedule the retry of a failed task, or mark it as failed."""
+        task.error = f"{error}"
+        if task.attempts < task.max_attempts:
+            delay = settings.TASK_RETRY_DELAY * 2 ** (task.attempts - 1)
+            task.status = TaskStatusChoices.PENDING
+            task.run_at = timezone.now() + timedelta(seconds=delay)
+        else:
+            task.status = TaskStatusChoices.FAILED
+            task.finished_at = timezone.now()
+
+        fields = ["status", "error", "run_at", "finished_at", "updated_at"]
+        try:
+            with transaction.atomic():
+                task.save(update_fields=fields)
+        except IntegrityError:
+            # A newer call with the same key is pending, it runs instead
+            task.status = TaskStatusChoices.FAILED
+            task.finished_at = timezone.now()
+            task.save(update_fields=fields)
+        return task
+
+    @staticmethod
+    def process_pending_tasks(limit=50):
+        """Run a batch of due (or stale) tasks, oldest first."""
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.TASK_TIMEOUT)
+        Task.objects.filter(
+            status=TaskStatusChoices.RUNNING,
+            updated_at__lt=stale,
+            attempts__gte=F("max_attempts"),
+        ).update(
+            status=TaskStatusChoices.FAILED,
+            error="Timed out.",
+            finished_at=now,
+            updated_at=now,
+        )
+        task_ids = list(
+            Task.objects.filter(
+                Q(status=TaskStatusChoices.PENDING, run_at__lte=now)
+                | Q(status=TaskStatusChoices.RUNNING, updated_at__lt=stale)
+            )
+            .order_by("run_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        return [TaskService.run_task(pk) for pk in task_ids]
+
+    @staticmethod
+    def purge_finished_tasks():
+        """Delete the succeeded tasks older than `TASK_RETENTION_DAYS`."""
+        cutoff = timezone.now() - timedelta(days=settings.TASK_RETENTION_DAYS)
+        deleted, _ = Task.objects.filter(
+            status=TaskStatusChoices.SUCCEEDED, finished_at__lt=cutoff
+        ).delete()
+        return deleted
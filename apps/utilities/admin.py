@@ -2,6 +2,8 @@
 
 from django.contrib import admin
 
+from .cache import bump_queryset_version
+
 
 class BaseAdmin(admin.ModelAdmin):
     """Base Admin."""
@@ -14,8 +16,10 @@ class BaseAdmin(admin.ModelAdmin):
     def soft_delete(self, request, queryset):
         """Action to perform soft delete by setting is_available to False."""
         queryset.update(is_available=False)
+        bump_queryset_version(queryset)
 
     @admin.action(description="Restore selected items")
     def restore_items(self, request, queryset):
         """Action to restore items by setting is_available to True."""
         queryset.update(is_available=True)
+        bump_queryset_version(queryset)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UtilitiesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.utilities"
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from .cache import handle_model_change
+
+        post_save.connect(handle_model_change, dispatch_uid="cache_version_save")
+        post_delete.connect(handle_model_change, dispatch_uid="cache_version_delete")
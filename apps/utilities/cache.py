@@ -0,0 +1,164 @@
+"""Cache versioning for Utilities App."""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import urlencode
+
+VERSION_KEY_PREFIX = "version"
+
+# Models whose counters are bumped on every save or delete
+_versioned_models = set()
+
+# Resolvers returning the pks of the users owning an instance, per model
+_owner_resolvers = {}
+
+# Related models of each model cached per resource by `CacheMixin`
+_resource_dependencies = {}
+
+
+def _version_key(model, user_pk=None):
+    key = f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+    if user_pk is not None:
+        key = f"{key}:user_{user_pk}"
+    return key
+
+
+def _initial_version():
+    # A fresh counter starts from the current time instead of 1, so entries
+    # written before the counter was evicted can never match again
+    return int(time.time() * 1000)
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_version(), timeout=None)
+
+
+def register_list_cache(*models):
+    """
+    Register models that cached lists depend on.
+
+    Only the counters of registered models are bumped by the save and
+    delete signals, writes to any other model leave the cache untouched.
+    """
+    _versioned_models.update(model._meta.label_lower for model in models)
+
+
+def register_cache_owner(model, resolver):
+    """
+    Register how to find the users owning an instance of `model`.
+
+    `resolver(instance)` returns the user pks whose per-user counters are
+    bumped, together with the model counter, when the instance changes.
+    """
+    register_list_cache(model)
+    _owner_resolvers[model._meta.label_lower] = resolver
+
+
+def register_resource_cache(model, dependencies=()):
+    """
+    Register `model` as reference data cached per resource.
+
+    Saving or deleting an instance evicts exactly its detail entry, and
+    changes to `dependencies` (related models shown in the responses)
+    invalidate its entries through their version counters.
+    """
+    register_list_cache(model)
+    _resource_dependencies[model._meta.label_lower] = list(dependencies)
+
+
+def get_resource_dependencies(model):
+    return _resource_dependencies.get(model._meta.label_lower, [])
+
+
+def get_resource_cache_key(model, pk):
+    """Generate the shared cache key of a single resource."""
+    versions = get_model_versions(get_resource_dependencies(model))
+    versions = ".".join(str(version) for version in versions)
+    return f"resource:{model._meta.label_lower}:{pk}:{versions}"
+
+
+def get_model_versions(models, user_models=(), user_pk=None):
+    """
+    Return the current version counters of `models`, in order.
+
+    `user_models` are read from the counters of `user_pk` instead of the
+    model-wide ones. Counters that do not exist yet are created, all reads
+    are done with a single `get_many` round-trip.
+    """
+    keys = [_version_key(model) for model in models]
+    keys += [_version_key(model, user_pk) for model in user_models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _initial_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _version_keys(model, instances=()):
+    keys = [_version_key(model)]
+    resolver = _owner_resolvers.get(model._meta.label_lower)
+    if resolver is not None:
+        user_pks = {pk for instance in instances for pk in resolver(instance)}
+        keys += [_version_key(model, user_pk) for user_pk in user_pks]
+    return keys
+
+
+def bump_model_version(model, instances=()):
+    """
+    Invalidate every cache entry built from `model` by bumping its counter.
+
+    The per-user counters of the owners of `instances` are bumped as well.
+    """
+    for key in _version_keys(model, instances):
+        _bump(key)
+
+
+def bump_queryset_version(queryset):
+    """Bump the counters of a queryset updated without sending signals."""
+    model = queryset.model
+    instances = queryset if model._meta.label_lower in _owner_resolvers else ()
+    bump_model_version(model, instances)
+
+
+def generate_versioned_cache_key(prefix, versions, scope, request, view_kwargs):
+    """
+    Generate a cache key from model versions, auth scope and query params.
+
+    Only what changes the response is part of the key: the host (used in
+    pagination links), the URL kwargs, the sorted query params and the
+    scope, so headers like `User-Agent` no longer multiply the entries.
+    """
+    versions = ".".join(str(version) for version in versions)
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    path = urlencode(sorted((key, str(value)) for key, value in view_kwargs.items()))
+    digest = hashlib.md5(f"{request.get_host()}/{path}?{params}".encode()).hexdigest()
+    return f"{prefix}:{versions}:{scope}:{digest}"
+
+
+def handle_model_change(sender, instance, using=None, **kwargs):
+    """
+    Signal to bump the version of a registered model on save or delete.
+
+    Owners are resolved right away, while the rows still exist, but the
+    counters are bumped once the transaction commits: a list read before
+    that can only be cached under the old version.
+    """
+    if sender._meta.label_lower not in _versioned_models:
+        return
+    keys = _version_keys(sender, [instance])
+    pk = instance.pk
+
+    def bump():
+        for key in keys:
+            _bump(key)
+        if sender._meta.label_lower in _resource_dependencies:
+            cache.delete(get_resource_cache_key(sender, pk))
+
+    transaction.on_commit(bump, using=using)
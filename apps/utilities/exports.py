@@ -0,0 +1,78 @@
+"""Streaming exports for Utilities App."""
+
+import csv
+import io
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+export_format_parameter = OpenApiParameter(
+    name="file_format",
+    type=str,
+    location=OpenApiParameter.QUERY,
+    required=False,
+    enum=list(EXPORT_FORMATS),
+    description="Format of the exported file, `csv` (default) or `ndjson`, ex `/?file_format=ndjson`",
+)
+
+export_responses = {
+    (200, media_type): OpenApiResponse(OpenApiTypes.STR, description="OK")
+    for media_type in EXPORT_FORMATS.values()
+}
+
+
+def _batches(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def stream_csv(fields, rows, batch_size):
+    """Yield a header line and then the rows as CSV, `batch_size` at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for batch in _batches(rows, batch_size):
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_ndjson(fields, rows, batch_size):
+    """Yield the rows as one JSON object per line, `batch_size` at a time."""
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    for batch in _batches(rows, batch_size):
+        yield "".join(
+            encoder.encode(dict(zip(fields, row))) + "\n" for row in batch
+        )
+
+
+def export_queryset(queryset, fields, file_format, filename, chunk_size):
+    """
+    Return a streaming response with the `fields` of every row of a queryset.
+
+    Rows are read with `values_list` through a server-side cursor
+    (`iterator`), `chunk_size` at a time, and written as they arrive, so
+    memory stays constant whatever the size of the export.
+    """
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    stream = stream_ndjson if file_format == "ndjson" else stream_csv
+    response = StreamingHttpResponse(
+        stream(fields, rows, chunk_size),
+        content_type=EXPORT_FORMATS[file_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{file_format}"'
+    )
+    return response
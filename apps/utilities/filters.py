@@ -1,8 +1,10 @@
 """Filters for Utilities App."""
 
 from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
 
 from .choices import SortChoices
+from .search import get_search_config, search
 
 
 class BaseFilter(filters.FilterSet):
@@ -21,3 +23,23 @@ class BaseFilter(filters.FilterSet):
         elif value == "desc":
             return queryset.order_by("-" + order_by)
         return queryset
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Search filter using the full-text search of registered models.
+
+    Models registered with `register_search` are searched on their search
+    vector and ranked (see `search`), other models keep the `icontains`
+    lookups of the view `search_fields`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        term = " ".join(self.get_search_terms(request))
+        if (
+            term
+            and getattr(view, "search_fields", None)
+            and get_search_config(queryset.model) is not None
+        ):
+            return search(queryset, term)
+        return super().filter_queryset(request, queryset, view)
@@ -0,0 +1,173 @@
+"""Idempotency keys for Utilities App."""
+
+import hashlib
+import inspect
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+from rest_framework import status
+from drf_spectacular.utils import OpenApiParameter
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_PREFIX = "idempotency"
+
+idempotency_key_parameter = OpenApiParameter(
+    name=IDEMPOTENCY_HEADER,
+    type=str,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description="Unique key of the request, retries with the same key replay the first response.",
+)
+
+
+def _fingerprint(request, view_kwargs):
+    """Hash what identifies the request, so a key cannot be reused for another."""
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    path = json.dumps(view_kwargs, sort_keys=True, default=str)
+    return hashlib.md5(f"{request.method}:{request.path}:{path}:{body}".encode()).hexdigest()
+
+
+def _get_key(request):
+    """Return the cache key of the request, or an error response."""
+    idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not idempotency_key:
+        return None, None
+    if len(idempotency_key) > 255:
+        return None, Response(
+            {"error": f"{IDEMPOTENCY_HEADER} must have at most 255 characters."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    digest = hashlib.md5(idempotency_key.encode()).hexdigest()
+    return f"{IDEMPOTENCY_KEY_PREFIX}:{request.user.pk}:{digest}", None
+
+
+def _in_progress():
+    return Response(
+        {"error": "A request with this key is still in progress."},
+        status=status.HTTP_409_CONFLICT,
+    )
+
+
+def _to_store(response, fingerprint):
+    if response.status_code >= 500:
+        return None
+    return {
+        "fingerprint": fingerprint,
+        "status": response.status_code,
+        "data": response.data,
+    }
+
+
+def _replay(stored, fingerprint):
+    if stored["fingerprint"] != fingerprint:
+        return Response(
+            {"error": f"{IDEMPOTENCY_HEADER} was already used for another request."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(
+        stored["data"],
+        status=stored["status"],
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _lock_key(key):
+    return f"{key}:lock"
+
+
+def _claim(request, view_kwargs):
+    """
+    Look up the key of a request and hold it while the handler runs.
+
+    Return the key and fingerprint to store the response under, or the
+    response to return without running the handler (stored, conflict or
+    invalid key). All three are None for requests without a key.
+    """
+    key, error = _get_key(request)
+    if key is None:
+        return None, None, error
+    fingerprint = _fingerprint(request, view_kwargs)
+    stored = cache.get(key)
+    if stored is not None:
+        return None, None, _replay(stored, fingerprint)
+    if not cache.add(_lock_key(key), 1, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+        return None, None, _in_progress()
+    return key, fingerprint, None
+
+
+async def _aclaim(request, view_kwargs):
+    """Async version of `_claim`."""
+    key, error = _get_key(request)
+    if key is None:
+        return None, None, error
+    fingerprint = _fingerprint(request, view_kwargs)
+    stored = await cache.aget(key)
+    if stored is not None:
+        return None, None, _replay(stored, fingerprint)
+    if not await cache.aadd(_lock_key(key), 1, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+        return None, None, _in_progress()
+    return key, fingerprint, None
+
+
+def _store(key, response, fingerprint):
+    """Store the response of the handler, returned as is to retries."""
+    stored = _to_store(response, fingerprint)
+    if stored is not None:
+        cache.set(key, stored, settings.IDEMPOTENCY_KEY_TIMEOUT)
+
+
+async def _astore(key, response, fingerprint):
+    """Async version of `_store`."""
+    stored = _to_store(response, fingerprint)
+    if stored is not None:
+        await cache.aset(key, stored, settings.IDEMPOTENCY_KEY_TIMEOUT)
+
+
+def idempotent(handler):
+    """
+    Make a view handler replay its response for a repeated `Idempotency-Key`.
+
+    Keys are scoped to the user. The first request holds the key while it
+    runs, concurrent duplicates get a 409, and once it finishes any response
+    below 500 is stored and returned as is to retries, without running the
+    handler (nor touching the database or the payment gateway) again.
+    Requests without the header are not affected. Works on sync and async
+    handlers.
+    """
+
+    if inspect.iscoroutinefunction(handler):
+
+        @wraps(handler)
+        async def async_wrapper(self, request, *args, **kwargs):
+            key, fingerprint, response = await _aclaim(request, kwargs)
+            if response is not None:
+                return response
+            if key is None:
+                return await handler(self, request, *args, **kwargs)
+            try:
+                response = await handler(self, request, *args, **kwargs)
+                await _astore(key, response, fingerprint)
+                return response
+            finally:
+                await cache.adelete(_lock_key(key))
+
+        return async_wrapper
+
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        key, fingerprint, response = _claim(request, kwargs)
+        if response is not None:
+            return response
+        if key is None:
+            return handler(self, request, *args, **kwargs)
+        try:
+            response = handler(self, request, *args, **kwargs)
+            _store(key, response, fingerprint)
+            return response
+        finally:
+            cache.delete(_lock_key(key))
+
+    return wrapper
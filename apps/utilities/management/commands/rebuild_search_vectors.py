@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.utilities.search import rebuild_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Search: Rebuild the full-text search vectors of every searchable model"
+
+    def handle(self, *args, **options) -> None:
+        for label, total in rebuild_search_vectors().items():
+            self.stdout.write(self.style.SUCCESS(f"{total} {label} vectors rebuilt."))
@@ -0,0 +1,22 @@
+"""Middleware for Utilities App."""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.deprecation import MiddlewareMixin
+from social_django import middleware
+
+
+class SocialAuthExceptionMiddleware(
+    MiddlewareMixin, middleware.SocialAuthExceptionMiddleware
+):
+    """
+    `SocialAuthExceptionMiddleware` supporting both sync and async requests.
+
+    The upstream class is sync only, which makes Django run the rest of the
+    stack, async views included, in a worker thread per request under ASGI.
+    """
+
+    def __init__(self, get_response):
+        # The upstream __init__ takes get_response, skip MiddlewareMixin's
+        middleware.SocialAuthExceptionMiddleware.__init__(self, get_response)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
@@ -1,16 +1,26 @@
 """Mixins for Utilities App."""
 
+from django.conf import settings
 from django.db import models
 from django.http import Http404
-from django.utils.decorators import method_decorator
 from django.core.cache import cache
-from django.views.decorators.cache import cache_page
-from django.views.decorators.vary import vary_on_headers
 from django.utils.text import slugify
 
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework import status
 
+from .cache import (
+    get_model_versions,
+    get_resource_dependencies,
+    get_resource_cache_key,
+    generate_versioned_cache_key,
+)
+from .replicas import use_replica, release_replica, is_pinned_to_primary
+from .exports import EXPORT_FORMATS, export_queryset
+
 
 class SlugMixin(models.Model):
     """Mixin providing slug functionality for models."""
@@ -36,84 +46,238 @@ class SlugMixin(models.Model):
 
 
 class ListCacheMixin:
-    """Mixin provides caching for the list methods of viewsets."""
+    """
+    Mixin provides caching for the list methods of viewsets.
+
+    Entries are keyed by the version counters of `cache_dependencies`
+    (the queryset model by default), which are bumped on every save or
+    delete, so writes are visible immediately despite the long timeout.
+    `cache_scope` sets who shares an entry: "public" for everyone, "role"
+    for users with the same role, "user" for a single user and role.
+
+    In "user" scope, `cache_user_dependencies` are models whose rows in the
+    list belong to the requesting user; they are versioned per user (see
+    `register_cache_owner`), so a write only evicts its owners' entries.
+    """
+
+    cache_timeout = settings.LIST_CACHE_TIMEOUT
+    cache_scope = "role"
+    cache_dependencies = None
+    cache_user_dependencies = ()
+
+    def get_cache_scope(self, request):
+        user = request.user
+        if self.cache_scope == "public":
+            return "public"
+        if not user.is_authenticated:
+            return "anonymous"
+        role = f"role_{getattr(user, 'role', '')}_{int(user.is_staff)}"
+        if self.cache_scope == "user":
+            return f"user_{user.pk}_{role}"
+        return role
+
+    def get_cache_versions(self, request, queryset):
+        dependencies = self.cache_dependencies
+        if dependencies is None:
+            dependencies = [] if self.cache_user_dependencies else [queryset.model]
+        if self.cache_scope == "user" and request.user.is_authenticated:
+            return get_model_versions(
+                dependencies, self.cache_user_dependencies, request.user.pk
+            )
+        return get_model_versions([*dependencies, *self.cache_user_dependencies])
+
+    def get_cache_timeout(self):
+        return self.cache_timeout
 
-    @method_decorator(cache_page(60 * 60 * 2))
-    @method_decorator(vary_on_headers("User-Agent"))
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_queryset()
+        cache_key = generate_versioned_cache_key(
+            f"{type(self).__module__}.{type(self).__name__}_list",
+            self.get_cache_versions(request, queryset),
+            self.get_cache_scope(request),
+            request,
+            self.kwargs,
+        )
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = self._list(request, queryset)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data, timeout=self.get_cache_timeout())
+        return response
 
-        model_name = queryset.model._meta.verbose_name_plural.lower()
-        if not queryset.exists():
-            return Response({"message": f"No {model_name} available"})
+    def _list(self, request, queryset):
+        queryset = self.filter_queryset(queryset)
+        empty_response = Response(
+            {"message": f"No {queryset.model._meta.verbose_name_plural.lower()} available"}
+        )
 
+        # Emptiness is inferred from the first page instead of an extra query
         page = self.paginate_queryset(queryset)
         if page is not None:
+            if not page and self.paginator.get_previous_link() is None:
+                return empty_response
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
         serializer = self.get_serializer(queryset, many=True)
+        if not serializer.data:
+            return empty_response
         return Response(serializer.data)
 
 
+class ReplicaMixin:
+    """
+    Mixin routes the read-only actions of a viewset to the read replicas.
+
+    Only safe requests to `replica_actions` read from a replica, and not
+    for users who wrote in the last `REPLICA_STICKY_SECONDS` (see
+    `ReplicaPinMiddleware`), so they always read their own writes. Lists
+    read from a replica are cached for that long at most, a lagging
+    replica cannot keep a stale entry under the new version counters.
+    """
+
+    replica_actions = ["list", "retrieve"]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.replica_token = None
+        if (
+            request.method in SAFE_METHODS
+            and self.action in self.replica_actions
+            and not is_pinned_to_primary(request.user)
+        ):
+            self.replica_token = use_replica()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if getattr(self, "replica_token", None) is not None:
+            release_replica(self.replica_token)
+            self.replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def get_cache_timeout(self):
+        timeout = super().get_cache_timeout()
+        if getattr(self, "replica_token", None) is not None:
+            return min(timeout, settings.REPLICA_STICKY_SECONDS)
+        return timeout
+
+
 class CacheMixin:
     """
-    This mixin caches list and retrieve responses using a key generated by get_cache_key.
-    The cache is automatically invalidated when an object is created, updated, or deleted.
+    Mixin provides a shared write-through cache for reference data viewsets.
+
+    Responses are the same for every visitor, so a single canonical copy is
+    stored per resource and query. Lists are keyed by their query params and
+    the version counters of the model and its registered dependencies
+    (see `register_resource_cache`); details are keyed by pk and evicted
+    one by one. Writes through the viewset store the fresh detail at once.
     """
 
-    cache_timeout = 60 * 60 * 2  # 2 hrs
-    # prefix_list = "_list"
-    # prefix_detail = "_detail"
+    cache_timeout = settings.LIST_CACHE_TIMEOUT
 
-    def get_cache_key(self, request, *args, **kwargs):
-        """Generate the cache key for the view."""
-        raise NotImplementedError(
-            "You must override the get_cache_key method in your ViewSet."
-        )
+    def get_cache_model(self):
+        return self.get_queryset().model
+
+    def get_detail_cache_key(self, pk):
+        return get_resource_cache_key(self.get_cache_model(), pk)
 
     def list(self, request, *args, **kwargs):
-        cache_key = self.get_cache_key(request, *args, **kwargs) + "_list"
+        model = self.get_cache_model()
+        cache_key = generate_versioned_cache_key(
+            f"resource:{model._meta.label_lower}_list",
+            get_model_versions([model, *get_resource_dependencies(model)]),
+            "public",
+            request,
+            self.kwargs,
+        )
         data = cache.get(cache_key)
-        if not data:
+        if data is None:
             response = super().list(request, *args, **kwargs)
-            data = response.data
-            cache.set(cache_key, data, timeout=self.cache_timeout)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(cache_key, response.data, timeout=self.cache_timeout)
             return response
         return Response(data)
 
     def retrieve(self, request, *args, **kwargs):
-        cache_key = self.get_cache_key(request, *args, **kwargs) + "_detail"
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        cache_key = self.get_detail_cache_key(self.kwargs[lookup_url_kwarg])
         data = cache.get(cache_key)
-        if not data:
+        if data is None:
             response = super().retrieve(request, *args, **kwargs)
-            data = response.data
-            cache.set(cache_key, data, timeout=self.cache_timeout)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(cache_key, response.data, timeout=self.cache_timeout)
             return response
         return Response(data)
 
     def perform_create(self, serializer):
         super().perform_create(serializer)
-        self.invalidate_cache()
+        self.write_through(serializer.instance)
 
     def perform_update(self, serializer):
-        instance = serializer.save()
-        self.invalidate_cache(instance)
+        super().perform_update(serializer)
+        self.write_through(serializer.instance)
+
+    def destroy(self, request, *args, **kwargs):
+        response = super().destroy(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        cache.delete(self.get_detail_cache_key(self.kwargs[lookup_url_kwarg]))
+        return response
+
+    def write_through(self, instance):
+        """Store the detail representation of a written instance."""
+        cache_key = self.get_detail_cache_key(instance.pk)
+        if not getattr(instance, "is_available", True):
+            cache.delete(cache_key)
+            return
+
+        # Serialize as the retrieve action would
+        action, self.action = self.action, "retrieve"
+        try:
+            data = self.get_serializer(instance).data
+        finally:
+            self.action = action
+        cache.set(cache_key, data, timeout=self.cache_timeout)
 
-    def perform_destroy(self, instance):
-        super().perform_destroy(instance)
-        self.invalidate_cache(instance)
 
-    def invalidate_cache(self, instance=None):
+class ExportMixin:
+    """
+    Mixin adds an `export` action streaming the filtered list as a file.
+
+    The rows are the `export_fields` of the list queryset after the same
+    filters, search and ordering as the list action, written as CSV or
+    NDJSON (`/?file_format=ndjson`) while they are read from the database.
+    """
+
+    export_fields = []
+    export_chunk_size = settings.EXPORT_CHUNK_SIZE
+
+    def get_export_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Bind the database now, the rows are read after the view returns
+        return queryset.using(queryset.db)
+
+    @action(methods=["get"], detail=False, url_path="export")
+    def export(self, request, *args, **kwargs):
         """
-        Method to invalidate the cache.
-        Optionally override in the viewset to add extra logic.
+        Action stream the filtered list as a CSV or NDJSON file.
+
+        Endpoints:
+        - GET api/v1/{resource}/export/
         """
-        cache_key = self.get_cache_key(self.request) + "_list"
-        cache.delete(cache_key)
-        if instance:
-            cache_key = self.get_cache_key(self.request, pk=instance.pk) + "_detail"
-            cache.delete(cache_key)
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"file_format": f"Choose one of: {', '.join(EXPORT_FORMATS)}."}
+            )
+        queryset = self.get_export_queryset()
+        return export_queryset(
+            queryset,
+            self.export_fields,
+            file_format,
+            queryset.model._meta.verbose_name_plural.lower(),
+            self.export_chunk_size,
+        )
 
 
 class LogicalDeleteMixin:
@@ -1,7 +1,54 @@
 """Pagination for Utilities App."""
 
+import json
+import uuid
+from base64 import b64decode, b64encode
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def estimate_count(queryset):
+    """
+    Return a cheap estimate of the number of rows of a queryset.
+
+    On PostgreSQL, unfiltered querysets read `pg_class.reltuples` and
+    filtered ones the row estimate of their EXPLAIN plan, neither of which
+    scans the table. Estimates below `ESTIMATED_COUNT_THRESHOLD`, missing
+    statistics and other databases fall back to an exact `COUNT(*)`,
+    which is cheap at that size.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            estimate = row[0] if row else -1
+        else:
+            sql, params = queryset.order_by().values("pk").query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+    if estimate < settings.ESTIMATED_COUNT_THRESHOLD:
+        return queryset.count()
+    return int(estimate)
 
 
 class LimitSetPagination(LimitOffsetPagination):
@@ -43,3 +90,174 @@ class LargeSetPagination(PageNumberPagination):
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 25
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination for large tables by keyset on `(created_at, id)`.
+
+    Each page is read with an indexed range condition from the last row of
+    the previous one, so deep pages cost the same as the first, unlike
+    LIMIT/OFFSET. Cursors are opaque. `count_mode` sets how the total is
+    computed: "exact", "estimated" (see `estimate_count`) or "none"; it can
+    be overridden with `/?count=false`, `/?count=estimated` or
+    `/?count=true`.
+    """
+
+    page_size = 25
+    max_page_size = 100
+    page_size_query_param = "limit"
+    page_size_query_description = "Number of results to return per page, ex `/?limit=50`"
+    cursor_query_param = "cursor"
+    cursor_query_description = "The pagination cursor value."
+    count_query_param = "count"
+    count_query_description = (
+        "Include the total count: `true`, `false` or `estimated`, ex `/?count=false`"
+    )
+    count_mode = "exact"
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = self.get_count(queryset, self.get_count_mode(request))
+
+        cursor = self.decode_cursor(request)
+        self.is_reverse = bool(cursor and cursor["reverse"])
+        queryset = queryset.order_by(*self.ordering)
+        if cursor is not None:
+            created_at, pk = cursor["created_at"], cursor["id"]
+            if self.is_reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                ).order_by("created_at", "id")
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.is_reverse:
+            self.page.reverse()
+
+        # Walking forwards there is more after the page if a row was left out,
+        # and before it if a cursor was given; the opposite when reversing
+        self.has_next = has_more if not self.is_reverse else True
+        self.has_previous = cursor is not None if not self.is_reverse else has_more
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def get_count_mode(self, request):
+        value = request.query_params.get(self.count_query_param, "").lower()
+        if value in ("false", "0", "no"):
+            return "none"
+        if value == "estimated":
+            return "estimated"
+        if value in ("true", "1", "yes"):
+            return "exact"
+        return self.count_mode
+
+    def get_count(self, queryset, count_mode):
+        if count_mode == "none":
+            return None
+        if count_mode == "estimated":
+            return estimate_count(queryset)
+        return queryset.count()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            data = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            created_at = datetime.fromisoformat(data["c"])
+            if created_at.tzinfo is None:
+                raise ValueError("Naive cursor datetime.")
+            return {
+                "created_at": created_at,
+                "id": uuid.UUID(data["i"]),
+                "reverse": bool(data.get("r")),
+            }
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse=False):
+        data = {"c": instance.created_at.isoformat(), "i": str(instance.pk)}
+        if reverse:
+            data["r"] = 1
+        encoded = b64encode(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encoded.decode("ascii"))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        response = {}
+        if self.count is not None:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer", "example": 123},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.page_size_query_description,
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.count_query_description,
+                "schema": {"type": "string", "enum": ["true", "false", "estimated"]},
+            },
+        ]
+
+
+class EstimatedKeysetPagination(KeysetPagination):
+    """Keyset pagination with an estimated total count for the largest tables."""
+
+    count_mode = "estimated"
@@ -0,0 +1,102 @@
+"""Read replica routing for Utilities App."""
+
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.decorators import sync_and_async_middleware
+from rest_framework.permissions import SAFE_METHODS
+
+PIN_KEY_PREFIX = "replica:pin"
+
+# Alias of the replica the current request reads from, if any
+_read_database = ContextVar("read_database", default=None)
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads to a replica only when a view opted in.
+
+    Reads are routed to the alias set by `use_replica()` for the current
+    request (see `ReplicaMixin`), everything else, writes and migrations
+    included, goes to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get()
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror the primary, so all aliases hold the same rows
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+def use_replica():
+    """Route the reads of the current context to a random replica."""
+    if not settings.DATABASE_REPLICAS:
+        return None
+    return _read_database.set(random.choice(settings.DATABASE_REPLICAS))
+
+
+def release_replica(token):
+    _read_database.reset(token)
+
+
+def _pin_key(user_pk):
+    return f"{PIN_KEY_PREFIX}:{user_pk}"
+
+
+def is_pinned_to_primary(user):
+    """Return True if the user wrote recently and must read its own writes."""
+    if not user or not user.is_authenticated:
+        return False
+    return cache.get(_pin_key(user.pk)) is not None
+
+
+def pin_to_primary(user):
+    cache.set(_pin_key(user.pk), 1, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def _pin_after_write(request, response):
+    user = getattr(request, "user", None)
+    if response.status_code < 400 and user is not None and user.is_authenticated:
+        pin_to_primary(user)
+
+
+@sync_and_async_middleware
+def ReplicaPinMiddleware(get_response):
+    """
+    Pin users to the primary for a while after each successful write.
+
+    Runs after the view, when the user authenticated by DRF is set on the
+    request, so token authenticated writes are pinned as well.
+    """
+
+    def is_write(request):
+        return settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            response = await get_response(request)
+            if is_write(request):
+                # The session user is loaded lazily, which is sync only
+                await sync_to_async(_pin_after_write)(request, response)
+            return response
+
+    else:
+
+        def middleware(request):
+            response = get_response(request)
+            if is_write(request):
+                _pin_after_write(request, response)
+            return response
+
+    return middleware
@@ -0,0 +1,158 @@
+"""Full-text search for Utilities App."""
+
+import re
+from typing import NamedTuple
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.signals import post_save, m2m_changed
+
+
+class SearchConfig(NamedTuple):
+    """Weighted fields of the search vector of a model."""
+
+    fields: dict  # field name or related lookup -> weight, "A" to "D"
+    trigram_field: str | None  # Field matched with typo tolerance
+
+
+# Search configs of the models registered with `register_search`
+_search_configs = {}
+
+
+def register_search(model, fields, trigram_field=None):
+    """
+    Register `model` for full-text search.
+
+    `fields` maps the field names (or lookups through relations, ex
+    `tags__name`) indexed in its `search_vector` column to their weight.
+    The vector is refreshed after every save and many-to-many change, and
+    `trigram_field` is also matched by similarity to tolerate typos.
+    """
+    label = model._meta.label_lower
+    _search_configs[label] = SearchConfig(dict(fields), trigram_field)
+    post_save.connect(
+        handle_search_update, sender=model, dispatch_uid=f"search:{label}"
+    )
+    for lookup in fields:
+        field = model._meta.get_field(lookup.split("__")[0])
+        if field.many_to_many:
+            m2m_changed.connect(
+                handle_search_m2m_update,
+                sender=field.remote_field.through,
+                dispatch_uid=f"search:{label}:{field.name}",
+            )
+
+
+def get_search_config(model):
+    return _search_configs.get(model._meta.label_lower)
+
+
+def is_full_text_available(queryset):
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def build_search_vector(model):
+    """Return the weighted search vector expression of a registered model."""
+    vector = None
+    for lookup, weight in get_search_config(model).fields.items():
+        expression = lookup
+        if "__" in lookup:
+            # Related values are aggregated in a subquery, an UPDATE can't join
+            expression = Subquery(
+                model._base_manager.filter(pk=OuterRef("pk"))
+                .values("pk")
+                .annotate(text=StringAgg(lookup, delimiter=" "))
+                .values("text")
+            )
+        part = SearchVector(expression, weight=weight, config=settings.SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(queryset):
+    """
+    Refresh the search vector of every object of a queryset in one UPDATE.
+
+    Needed after writes that send no signals, like `bulk_create`.
+    """
+    if not is_full_text_available(queryset):
+        return 0
+    return queryset.update(search_vector=build_search_vector(queryset.model))
+
+
+def rebuild_search_vectors():
+    """Refresh the search vector of every registered model."""
+    return {
+        label: update_search_vectors(apps.get_model(label)._base_manager.all())
+        for label in _search_configs
+    }
+
+
+def search(queryset, term):
+    """
+    Filter a queryset of a registered model by a search term, best first.
+
+    On PostgreSQL every word of the term matches the search vector as a
+    prefix (`piz` finds "pizza"), or the whole term is similar to the
+    trigram field (`piza` finds "pizza"); both use GIN indexes and add to
+    the `search_rank` annotation. Other databases fall back to `icontains`
+    lookups on the registered fields.
+    """
+    config = get_search_config(queryset.model)
+    words = re.findall(r"\w+", term)
+    if not words:
+        return queryset
+
+    if not is_full_text_available(queryset):
+        condition = Q()
+        for lookup in config.fields:
+            condition |= Q(**{f"{lookup}__icontains": term})
+        return queryset.filter(condition).distinct()
+
+    query = SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=settings.SEARCH_CONFIG,
+    )
+    condition = Q(search_vector=query)
+    rank = SearchRank(F("search_vector"), query)
+    if config.trigram_field:
+        condition |= Q(**{f"{config.trigram_field}__trigram_word_similar": term})
+        rank = rank + TrigramWordSimilarity(term, config.trigram_field)
+    return (
+        queryset.filter(condition)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "pk")
+    )
+
+
+def handle_search_update(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Signal to refresh the search vector of a saved object."""
+    if raw:
+        return
+    fields = get_search_config(sender).fields
+    if update_fields and not any(lookup in update_fields for lookup in fields):
+        return
+    update_search_vectors(
+        sender._base_manager.using(kwargs["using"]).filter(pk=instance.pk)
+    )
+
+
+def handle_search_m2m_update(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Signal to refresh the search vectors after a many-to-many change."""
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    target, pks = (model, pk_set) if reverse else (type(instance), [instance.pk])
+    if pks and get_search_config(target) is not None:
+        update_search_vectors(
+            target._base_manager.using(kwargs["using"]).filter(pk__in=pks)
+        )
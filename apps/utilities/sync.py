@@ -0,0 +1,75 @@
+"""In-process indexes for Utilities App."""
+
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+class SyncedIndex:
+    """
+    Base of the in-process indexes loaded once from the database and then
+    refreshed incrementally with the rows changed since the last sync.
+
+    `updated_at` is set when a row is saved, not when its transaction
+    commits, so a row committed after a sync can carry an earlier time.
+    Every sync reads again the last `max(sync_interval, INDEX_SYNC_OVERLAP)`
+    seconds, the rows read twice are applied again, which is harmless.
+
+    Subclasses implement `_reset()` (clear the index, under the lock),
+    `_load_rows()` (fill it, under the lock) and `_sync_rows(since)` (apply
+    the rows changed since a time, taking the lock to write).
+    """
+
+    def __init__(self, sync_interval):
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._last_sync = None
+        self._last_sync_check = 0.0
+
+    def _sync_from(self, now):
+        overlap = max(self.sync_interval, settings.INDEX_SYNC_OVERLAP)
+        return now - timedelta(seconds=overlap)
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+            self._loaded = False
+            self._last_sync = None
+
+    def load(self):
+        """Build the index from the database."""
+        now = timezone.now()
+        with self._lock:
+            self._reset()
+            self._load_rows()
+            self._loaded = True
+            self._last_sync = self._sync_from(now)
+        self._last_sync_check = time.monotonic()
+
+    def sync(self, force=False):
+        """
+        Apply the rows changed since the last sync, loading it the first time.
+
+        Runs at most once every `sync_interval` seconds unless forced, and
+        only reads the rows touched in between (indexed on `updated_at`).
+        """
+        with self._lock:
+            loaded = self._loaded
+            since = self._last_sync
+        if not loaded:
+            self.load()
+            return
+
+        monotonic_now = time.monotonic()
+        if not force and monotonic_now - self._last_sync_check < self.sync_interval:
+            return
+        self._last_sync_check = monotonic_now
+
+        now = timezone.now()
+        self._sync_rows(since)
+        with self._lock:
+            self._last_sync = self._sync_from(now)
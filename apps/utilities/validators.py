@@ -35,12 +35,15 @@ def validate_birth_date(value):
         )
 
 
+FOOD_IMAGE_MAX_MB = 1
+FOOD_IMAGE_MAX_SIZE = (600, 600)
+
+
 def validate_food_image(image):
     """
     Validate that the uploaded image for a food item meets the required dimensions.
     """
-    max_width = 600
-    max_height = 600
+    max_width, max_height = FOOD_IMAGE_MAX_SIZE
     img = Image.open(image)
     width, height = img.size
 
@@ -51,6 +54,18 @@ def validate_food_image(image):
         )
 
 
+def read_image_size(image):
+    """
+    Return the `(width, height)` of an image file, or None if it is not a
+    valid image. Only the image header is read.
+    """
+    try:
+        with Image.open(image) as img:
+            return img.size
+    except (OSError, ValueError):
+        return None
+
+
 @deconstructible
 class FileSizeValidator:
     """
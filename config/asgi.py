@@ -8,3 +8,11 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", SETTINGS_MODULE)
 
 application = get_asgi_application()
+
+# Load the reference data snapshot and the autocomplete index once per
+# process before serving requests
+from apps.locations.snapshot import location_registry  # noqa: E402
+from apps.restaurants.autocomplete import autocomplete_index  # noqa: E402
+
+location_registry.warm()
+autocomplete_index.warm()
@@ -0,0 +1,45 @@
+"""Gunicorn config for config project (Production)."""
+
+import multiprocessing
+import os
+
+# "uvicorn.workers.UvicornWorker" serves the ASGI application instead
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+is_async = worker_class.startswith("uvicorn")
+wsgi_app = "config.asgi:application" if is_async else "config.wsgi:application"
+
+if is_async:
+    # Async requests do not reuse thread-bound persistent connections, they
+    # would pile up instead; put PgBouncer in front of the database
+    os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Async workers need one process per core, sync workers also wait on I/O
+cores = multiprocessing.cpu_count()
+workers = int(os.environ.get("WEB_CONCURRENCY", cores if is_async else cores * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 1 if is_async else 2))
+
+# Import the app and settings once in the master, workers are forked from it
+preload_app = True
+
+# Recycle workers to bound memory growth, jittered so they do not restart together
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Heartbeat files on tmpfs, a disk-backed /tmp can block workers in containers
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    # Connections opened while preloading must not be shared by the workers
+    from django.db import connections
+
+    connections.close_all()
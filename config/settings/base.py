@@ -29,9 +29,70 @@ CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS")
 
 INTERNAL_IPS = env.list("INTERNAL_IPS")
 
+SITE_URL = env("SITE_URL", default="")  # Public URL of the API, ex https://api.example.com
+
 
 SALES_TAX_RATE = 0.10
 DRIVER_TAX_RATE = 0.02
+RESTAURANT_COMMISSION_RATE = 0.15
+
+# Cache
+LIST_CACHE_TIMEOUT = 60 * 60 * 24  # Invalidated by model version counters
+LOCATION_SNAPSHOT_CHANNEL = "locations:snapshot"
+
+# Idempotency
+IDEMPOTENCY_KEY_TIMEOUT = 60 * 60 * 24  # Seconds a response is replayed for a key
+IDEMPOTENCY_LOCK_TIMEOUT = 60  # Seconds a key is held while its request runs
+
+# Read replicas
+DATABASE_REPLICAS = []  # Aliases in DATABASES, set per environment
+REPLICA_STICKY_SECONDS = 10  # Reads stay on the primary after a user writes
+
+# Search
+SEARCH_CONFIG = "english"  # PostgreSQL text search configuration
+
+# In-process indexes
+INDEX_SYNC_OVERLAP = 30  # Seconds read again by each sync, for late commits
+
+# Autocomplete
+AUTOCOMPLETE_SYNC_INTERVAL = 5  # Seconds between incremental index syncs
+AUTOCOMPLETE_MAX_RESULTS = 10
+
+# Finance reporting
+REVENUE_SUMMARY_LOCK_TIMEOUT = 60  # Seconds a day is held while it is refreshed
+
+# Settlement
+SETTLEMENT_INTERVAL = 60  # Seconds between settlement runs of the worker
+SETTLEMENT_BATCH_SIZE = 1000  # Deliveries settled per batch
+
+# Exports
+EXPORT_CHUNK_SIZE = 2000  # Rows fetched from the server-side cursor at a time
+
+# Menu import
+FOOD_IMPORT_MAX_ITEMS = 1000  # Foods per manifest
+FOOD_IMPORT_MAX_MB = 200  # Uncompressed size of the images of an import
+
+# Task queue
+TASK_WORKER_INTERVAL = 1  # Seconds between polls of the task worker
+TASK_MAX_ATTEMPTS = 5
+TASK_RETRY_DELAY = 10  # Seconds before the first retry, doubled on each one
+TASK_TIMEOUT = 300  # Seconds before a running task is considered lost
+TASK_RETENTION_DAYS = 7  # Days succeeded tasks are kept for
+
+# Pagination
+ESTIMATED_COUNT_THRESHOLD = 10000  # Smaller estimates are counted exactly
+
+# Driver dispatch
+DRIVER_INDEX_CELL_SIZE = 0.01  # Grid cell size in degrees (~1.1 km)
+DRIVER_INDEX_SYNC_INTERVAL = 5  # Seconds between incremental index syncs
+DRIVER_DISPATCH_RADIUS_KM = 10
+DRIVER_DISPATCH_CANDIDATES = 5
+DISPATCH_BATCH_WINDOW = 30  # Seconds between batch dispatch runs
+DISPATCH_BATCH_CANDIDATES = 10  # Nearest drivers considered per order
+DRIVER_OFFER_TIMEOUT = 60  # Seconds a driver has to accept an order offer
+
+# Driver earnings
+DRIVER_EARNINGS_WINDOW_DAYS = 30  # Max days listed in the daily breakdown
 
 
 BASE_APPS = [
@@ -41,6 +102,7 @@ BASE_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 PROJECT_APPS = [
@@ -57,6 +119,7 @@ PROJECT_APPS = [
     "apps.deliveries",
     "apps.blogs",
     "apps.locations",
+    "apps.tasks",
     "apps.utilities",
 ]
 
@@ -75,7 +138,7 @@ THIRD_APPS = [
 INSTALLED_APPS = BASE_APPS + PROJECT_APPS + THIRD_APPS
 
 MIDDLEWARE = [
-    "social_django.middleware.SocialAuthExceptionMiddleware",
+    "apps.utilities.middleware.SocialAuthExceptionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -84,8 +147,11 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
+    "apps.utilities.replicas.ReplicaPinMiddleware",
 ]
 
+DATABASE_ROUTERS = ["apps.utilities.replicas.ReplicaRouter"]
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -169,13 +235,14 @@ REST_FRAMEWORK = {
     "DEFAULT_CONTENT_LANGUAGE": "en",
     "DEFAULT_PAGINATION_CLASS": "apps.utilities.pagination.LimitSetPagination",
     "DEFAULT_FILTER_BACKENDS": [
-        "rest_framework.filters.SearchFilter",
+        "apps.utilities.filters.FullTextSearchFilter",
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "3/second",
         "user": "60/minute",
         "daily": "1000/day",
+        "autocomplete": "10/second",
     },
     "NUM_PROXIES": None,
     "PAGE_SIZE": 25,
@@ -241,6 +308,11 @@ AUTHENTICATION_BACKENDS = (
 
 MERCADOPAGO_ACCESS_TOKEN = env("MERCADOPAGO_ACCESS_TOKEN")
 
+# Payments
+PAYMENT_GATEWAY = env("PAYMENT_GATEWAY", default="mercadopago")  # Or "fake"
+FAKE_GATEWAY_LATENCY = env.float("FAKE_GATEWAY_LATENCY", default=0.5)
+PAYMENT_PROCESSING_TIMEOUT = 120  # Seconds before a processing payment is retried
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Drop Dash (API)",
     "DESCRIPTION": "A home delivery platform that allows users to search for and purchase products from local restaurants near their homes, place orders, and schedule deliveries. Provides access to restaurants to manage their menus, receive orders, and handle their meals through the platform. Inspired by platforms like Rappi and Uber Eats",
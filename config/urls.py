@@ -37,6 +37,7 @@ urlpatterns = [
     path("", include("apps.jobs.routers")),
     path("", include("apps.locations.routers")),
     path("", include("apps.orders.routers")),
+    path("", include("apps.payments.urls")),
     path("", include("apps.promotions.routers")),
     path("", include("apps.restaurants.routers")),
     path("", include("apps.users.routers")),
@@ -3,8 +3,27 @@
 import os
 from config.environment import SETTINGS_MODULE
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
+from whitenoise import WhiteNoise
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", SETTINGS_MODULE)
 
 application = get_wsgi_application()
+
+# Serve collected static files before Django, files with a hash in their
+# name are cached forever by clients
+application = WhiteNoise(
+    application,
+    root=settings.STATIC_ROOT,
+    prefix=settings.STATIC_URL,
+    immutable_file_test=r"\.[0-9a-f]{12}\.\w+$",
+)
+
+# Load the reference data snapshot and the autocomplete index once per
+# process before serving requests
+from apps.locations.snapshot import location_registry  # noqa: E402
+from apps.restaurants.autocomplete import autocomplete_index  # noqa: E402
+
+location_registry.warm()
+autocomplete_index.warm()
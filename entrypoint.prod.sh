@@ -0,0 +1,16 @@
+#!/bin/bash
+set -o errexit
+set -o pipefail
+set -o nounset
+
+# Define color and style codes directly
+bold="\033[1m"
+normal="\033[0m"
+red="\033[31m"
+
+# Migrations are not applied at boot, run them once per release instead:
+# python manage.py migrate --noinput
+
+# Start the Gunicorn server, settings are read from config/gunicorn.py
+echo -e "${bold}${red}Starting Gunicorn server on port 8000...${normal}"
+exec gunicorn --config config/gunicorn.py
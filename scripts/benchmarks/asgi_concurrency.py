@@ -0,0 +1,100 @@
+"""
+Benchmark: throughput of sync vs async views under a slow upstream.
+
+The same gateway notification is sent to the payment webhook, which reads
+the payment back from the gateway. The fake gateway waits `--latency`
+seconds per call, standing in for a slow upstream. Requests go through:
+
+- the WSGI handler, from a pool of `--workers` threads (the in-flight
+  limit of sync gunicorn workers is workers x threads);
+- the ASGI handler, from one event loop with `--concurrency` requests in
+  flight.
+
+The notification references an unknown payment, so no database is needed.
+
+Usage:
+    python scripts/benchmarks/asgi_concurrency.py --requests 400 --workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+URL = "/api/v1/payments/webhook/"
+PAYLOAD = {"type": "payment", "data": {"id": "0"}}
+
+
+def run_sync(total, workers):
+    from django.test import Client
+
+    def send(_):
+        return Client().post(URL, PAYLOAD, content_type="application/json")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        responses = list(pool.map(send, range(total)))
+    return [response.status_code for response in responses]
+
+
+async def run_async(total, concurrency):
+    from django.test import AsyncClient
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send():
+        async with semaphore:
+            response = await AsyncClient().post(
+                URL, PAYLOAD, content_type="application/json"
+            )
+            return response.status_code
+
+    return await asyncio.gather(*[send() for _ in range(total)])
+
+
+def report(name, total, elapsed, statuses):
+    errors = sum(1 for code in statuses if code != 200)
+    print(
+        f"{name:<6} {total} requests in {elapsed:6.2f}s "
+        f"-> {total / elapsed:8.1f} req/s ({errors} errors)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    from config.environment import SETTINGS_MODULE
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", SETTINGS_MODULE)
+
+    import django
+    from django.conf import settings
+
+    django.setup()
+    settings.PAYMENT_GATEWAY = "fake"
+    settings.FAKE_GATEWAY_LATENCY = args.latency
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+
+    print(
+        f"Upstream latency {args.latency}s, {args.workers} sync workers, "
+        f"{args.concurrency} async in-flight requests"
+    )
+    start = time.perf_counter()
+    statuses = run_sync(args.requests, args.workers)
+    report("WSGI", args.requests, time.perf_counter() - start, statuses)
+
+    start = time.perf_counter()
+    statuses = asyncio.run(run_async(args.requests, args.concurrency))
+    report("ASGI", args.requests, time.perf_counter() - start, statuses)
+
+
+if __name__ == "__main__":
+    main()
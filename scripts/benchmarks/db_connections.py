@@ -0,0 +1,77 @@
+"""
+Benchmark: database connection overhead per request.
+
+Runs `--requests` simulated requests, each one sending the request signals
+Django sends around a view and running a single small query, first with
+`CONN_MAX_AGE = 0` (a new connection per request) and then with persistent
+connections (`CONN_MAX_AGE` and `CONN_HEALTH_CHECKS`, as in production).
+Run it against the production database settings to see the real setup
+cost, including TLS and authentication.
+
+Usage:
+    python scripts/benchmarks/db_connections.py --requests 500
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+
+def run(requests, conn_max_age, health_checks):
+    from django.core.signals import request_finished, request_started
+    from django.db import connection
+
+    connection.close()
+    connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+    connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        request_started.send(sender=None)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        request_finished.send(sender=None)
+        timings.append((time.perf_counter() - start) * 1000)
+    connection.close()
+    return timings
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<32} mean {statistics.mean(timings):7.3f} ms "
+        f"p50 {statistics.median(timings):7.3f} ms p95 {p95:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--conn-max-age", type=int, default=60)
+    args = parser.parse_args()
+
+    from config.environment import SETTINGS_MODULE
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", SETTINGS_MODULE)
+
+    import django
+    from django.db import connection
+
+    django.setup()
+    print(f"Database: {connection.vendor} {connection.settings_dict['NAME']}")
+    report("CONN_MAX_AGE=0", run(args.requests, 0, False))
+    report(
+        f"CONN_MAX_AGE={args.conn_max_age}, health checks",
+        run(args.requests, args.conn_max_age, True),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: container start time until the first response is served.
+
+Compares the boot sequence of `entrypoint.sh` (makemigrations and migrate on
+every start, then the server) with `entrypoint.prod.sh` (Gunicorn with the
+preloaded app, migrations applied once per release). Each step runs as its
+own process, like in the container, and Gunicorn is timed until it answers
+a request on `--path` in both cases, so only the boot steps differ. Needs
+a reachable database.
+
+Usage:
+    python scripts/benchmarks/startup.py --runs 3
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LEGACY_STEPS = [
+    [sys.executable, "manage.py", "makemigrations", "--check", "--dry-run"],
+    [sys.executable, "manage.py", "migrate", "--noinput"],
+]
+
+
+def run_step(command):
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def time_to_first_response(port, path, timeout):
+    """Start Gunicorn and return the seconds until it answers a request."""
+    env = {
+        **os.environ,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "WEB_CONCURRENCY": os.environ.get("WEB_CONCURRENCY", "2"),
+    }
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "config/gunicorn.py"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1)
+                return time.perf_counter() - start
+            except urllib.error.HTTPError:
+                # Any HTTP status means the app is serving
+                return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.05)
+        raise TimeoutError(f"No response after {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/api/v1/")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    legacy, production = [], []
+    for _ in range(args.runs):
+        steps = sum(run_step(command) for command in LEGACY_STEPS)
+        serve = time_to_first_response(args.port, args.path, args.timeout)
+        legacy.append(steps + serve)
+        production.append(time_to_first_response(args.port, args.path, args.timeout))
+
+    for name, times in [("entrypoint.sh", legacy), ("entrypoint.prod.sh", production)]:
+        print(
+            f"{name:<20} best {min(times):6.2f}s "
+            f"mean {sum(times) / len(times):6.2f}s over {len(times)} runs"
+        )
+
+
+if __name__ == "__main__":
+    main()